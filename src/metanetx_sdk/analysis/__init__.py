@@ -0,0 +1,23 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide network-level analyses of the MetaNetX reaction space."""
+
+
+from .balance import check_balance
+from .cluster import find_clusters, label_components
+from .formula import ELEMENTS, ElementMatrix
+from .reaction_graph import ReactionGraph
+from .stoichiometry import StoichiometricMatrix, parse_equations
@@ -0,0 +1,148 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide a mass and charge balance check of reactions."""
+
+
+import logging
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..index.identifier_index import expand_ranges
+from .formula import ELEMENT_INDEX, ElementMatrix
+from .stoichiometry import StoichiometricMatrix
+
+
+logger = logging.getLogger(__name__)
+
+
+# Stoichiometric coefficients may be fractional such that sums are not exact.
+TOLERANCE = 1e-9
+
+
+def check_balance(
+    matrix: StoichiometricMatrix, elements: ElementMatrix, charges: pd.Series
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Compute the element and charge imbalance of all reactions at once.
+
+    The element residuals are the product of the stoichiometric matrix with the
+    element matrix of the metabolites' chemicals. Compartments are ignored, such
+    that ``MNXM1@MNXD1`` has the formula and charge of ``MNXM1``.
+
+    Parameters
+    ----------
+    matrix : StoichiometricMatrix
+        The parsed reaction equations.
+    elements : ElementMatrix
+        The element counts of the chemicals.
+    charges : pandas.Series
+        The charge of the chemicals indexed by their identifier.
+
+    Returns
+    -------
+    pandas.DataFrame
+        A table with one row per reaction and the columns ``mnx_id``,
+        ``is_element_balanced``, ``is_charge_balanced``, ``charge_residual``,
+        ``num_unknown``, and ``is_balanced``. Reactions involving metabolites
+        without a valid formula have an unknown element balance and those without
+        a charge have an unknown charge balance. The column ``is_balanced`` uses
+        the flags B and U of the reaction properties and is missing unless both
+        balances are known.
+    pandas.DataFrame
+        A table with the columns ``mnx_id``, ``element``, and ``residual`` with one
+        row per unbalanced element of each reaction with a known element balance.
+        Positive residuals are in excess on the product side.
+
+    """
+    compounds = matrix.compounds().values
+    rows = matrix.rows
+    positions = elements.index.get_indexer(compounds)
+    known_formula = np.append(elements.valid, False)[positions][matrix.indices]
+    numeric_charges = pd.to_numeric(charges, errors="coerce")
+    metabolite_charges = (
+        numeric_charges.loc[~numeric_charges.index.duplicated()]
+        .reindex(compounds)
+        .values.astype(float)[matrix.indices]
+    )
+    known_charge = ~np.isnan(metabolite_charges)
+    num_reactions = len(matrix.reactions)
+    unknown_formulae = np.bincount(rows[~known_formula], minlength=num_reactions)
+    unknown_charges = np.bincount(rows[~known_charge], minlength=num_reactions)
+    # Multiply each stoichiometric coefficient with its chemical's element counts.
+    entries = np.flatnonzero(known_formula)
+    chemical_rows = positions[matrix.indices[entries]]
+    starts = elements.indptr[chemical_rows]
+    stops = elements.indptr[chemical_rows + 1]
+    products = expand_ranges(starts, stops)
+    product_rows = np.repeat(rows[entries], stops - starts)
+    product_elements = elements.indices[products]
+    product_values = (
+        np.repeat(matrix.data[entries], stops - starts) * elements.data[products]
+    )
+    # Sum the products per reaction and element.
+    order = np.lexsort((product_elements, product_rows))
+    product_rows, product_elements = product_rows[order], product_elements[order]
+    is_new = np.ones(len(order), dtype=bool)
+    is_new[1:] = (product_rows[1:] != product_rows[:-1]) | (
+        product_elements[1:] != product_elements[:-1]
+    )
+    sums = np.add.reduceat(product_values[order], np.flatnonzero(is_new))
+    residual_rows = product_rows[is_new]
+    # Partial residuals of reactions with unknown formulae would be misleading.
+    unbalanced = (np.abs(sums) > TOLERANCE) & (unknown_formulae[residual_rows] == 0)
+    residual_rows = residual_rows[unbalanced]
+    num_unbalanced = np.bincount(residual_rows, minlength=num_reactions)
+    residuals = pd.DataFrame(
+        {
+            "mnx_id": matrix.reactions.values[residual_rows],
+            "element": ELEMENT_INDEX.values[product_elements[is_new][unbalanced]],
+            "residual": sums[unbalanced],
+        }
+    )
+    charge_residuals = np.bincount(
+        rows[known_charge],
+        weights=matrix.data[known_charge] * metabolite_charges[known_charge],
+        minlength=num_reactions,
+    ).astype(float)
+    charge_residuals[unknown_charges > 0] = np.nan
+    element_balanced = num_unbalanced == 0
+    charge_balanced = np.abs(charge_residuals) <= TOLERANCE
+    is_element_balanced = pd.array(element_balanced, dtype="boolean")
+    is_element_balanced[unknown_formulae > 0] = pd.NA
+    is_charge_balanced = pd.array(charge_balanced, dtype="boolean")
+    is_charge_balanced[unknown_charges > 0] = pd.NA
+    is_balanced = np.where(element_balanced & charge_balanced, "B", "U").astype(object)
+    is_balanced[(unknown_formulae > 0) | (unknown_charges > 0)] = None
+    summary = pd.DataFrame(
+        {
+            "mnx_id": matrix.reactions.values,
+            "is_element_balanced": is_element_balanced,
+            "is_charge_balanced": is_charge_balanced,
+            "charge_residual": charge_residuals,
+            "num_unknown": np.bincount(
+                rows[~(known_formula & known_charge)], minlength=num_reactions
+            ),
+            "is_balanced": is_balanced,
+        }
+    )
+    logger.debug(
+        "Found %d balanced and %d unbalanced reactions.",
+        (summary["is_balanced"] == "B").sum(),
+        (summary["is_balanced"] == "U").sum(),
+    )
+    return summary, residuals
@@ -0,0 +1,189 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide clusters of MetaNetX entries that are connected by cross-references."""
+
+
+import logging
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+
+def _compress(parent: np.ndarray, nodes: np.ndarray) -> None:
+    """Point the given nodes directly at their roots by pointer jumping."""
+    while True:
+        grandparents = parent[parent[nodes]]
+        if (grandparents == parent[nodes]).all():
+            break
+        parent[nodes] = grandparents
+
+
+def label_components(
+    sources: np.ndarray, targets: np.ndarray, num_nodes: int
+) -> np.ndarray:
+    """
+    Label the connected components of a graph with an array-based union-find.
+
+    In each round, every root is linked to the smallest root that any of its edges
+    leads to, for all edges at once. Pointer jumping is restricted to the endpoints
+    of the remaining edges and their roots, which halves path lengths in each step,
+    and edges within a set are dropped, such that the work shrinks quickly and the
+    total is near-linear in the number of edges. For example, a star whose center
+    is shared by many nodes is merged in two rounds.
+
+    Parameters
+    ----------
+    sources : numpy.ndarray
+        The integer source node of each edge.
+    targets : numpy.ndarray
+        The integer target node of each edge.
+    num_nodes : int
+        The number of nodes.
+
+    Returns
+    -------
+    numpy.ndarray
+        The smallest node of each node's component.
+
+    """
+    parent = np.arange(num_nodes, dtype=np.int64)
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    num_rounds = 0
+    while len(sources) > 0:
+        # The endpoints of the remaining edges point directly at their roots.
+        source_roots = parent[sources]
+        target_roots = parent[targets]
+        distinct = source_roots != target_roots
+        if not distinct.any():
+            break
+        num_rounds += 1
+        sources = sources[distinct]
+        targets = targets[distinct]
+        source_roots = source_roots[distinct]
+        target_roots = target_roots[distinct]
+        # Roots only ever point to smaller nodes, which rules out cycles.
+        np.minimum.at(
+            parent,
+            np.maximum(source_roots, target_roots),
+            np.minimum(source_roots, target_roots),
+        )
+        # The parents of these nodes are among them, so jumping stays within them.
+        _compress(
+            parent,
+            np.unique(np.concatenate([sources, targets, source_roots, target_roots])),
+        )
+    # Point all remaining nodes directly at their roots.
+    while True:
+        grandparent = parent[parent]
+        if (grandparent == parent).all():
+            break
+        parent = grandparent
+    logger.debug("Labeled components in %d rounds.", num_rounds)
+    return parent
+
+
+def find_clusters(cross_references: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Find MetaNetX entries that are connected through shared cross-references.
+
+    MetaNetX identifiers and external identifiers form a bipartite graph whose
+    edges are the cross-references. Its connected components are clusters of
+    entries that may describe the same chemical or reaction.
+
+    Parameters
+    ----------
+    cross_references : pandas.DataFrame
+        Transformed cross-references with the columns ``mnx_id``, ``prefix``, and
+        ``identifier``.
+
+    Returns
+    -------
+    pandas.DataFrame
+        A table with one row per MetaNetX identifier and the columns ``mnx_id``,
+        ``cluster``, ``num_mnx_ids``, and ``num_identifiers``, where the latter two
+        are the size of the cluster. Clusters are numbered from the largest to the
+        smallest and their members are in order of appearance.
+    pandas.DataFrame
+        A table of the ambiguous external identifiers, which refer to more than one
+        MetaNetX entry, with the columns ``prefix``, ``identifier``,
+        ``num_mnx_ids``, ``mnx_ids``, and ``cluster``.
+
+    """
+    table = cross_references[["mnx_id", "prefix", "identifier"]].dropna()
+    # References of MetaNetX identifiers to themselves do not connect anything.
+    table = table.loc[table["identifier"] != table["mnx_id"]]
+    mnx_codes, mnx_ids = pd.factorize(table["mnx_id"])
+    prefix_codes, _ = pd.factorize(table["prefix"])
+    identifier_codes, _ = pd.factorize(table["identifier"])
+    external_codes, _ = pd.factorize(
+        prefix_codes.astype(np.int64) * (identifier_codes.max(initial=0) + 1)
+        + identifier_codes
+    )
+    num_mnx_ids = len(mnx_ids)
+    num_external = external_codes.max(initial=-1) + 1
+    # Deduplicating the integer edges is much cheaper than comparing strings.
+    is_distinct = (
+        ~pd.Series(external_codes.astype(np.int64) * num_mnx_ids + mnx_codes)
+        .duplicated()
+        .values
+    )
+    table = table.loc[is_distinct]
+    mnx_codes = mnx_codes[is_distinct]
+    external_codes = external_codes[is_distinct]
+    # MetaNetX identifiers are the first nodes such that each component is labeled
+    # by one of them.
+    labels = label_components(
+        mnx_codes, num_mnx_ids + external_codes, num_mnx_ids + num_external
+    )
+    mnx_labels = labels[:num_mnx_ids]
+    sizes = np.bincount(mnx_labels, minlength=num_mnx_ids)
+    identifier_sizes = np.bincount(labels[num_mnx_ids:], minlength=num_mnx_ids)
+    roots = np.flatnonzero(sizes)
+    order = np.lexsort((roots, -identifier_sizes[roots], -sizes[roots]))
+    rank = np.empty(num_mnx_ids, dtype=np.int64)
+    rank[roots[order]] = np.arange(len(roots))
+    clusters = pd.DataFrame(
+        {
+            "mnx_id": mnx_ids.values,
+            "cluster": rank[mnx_labels],
+            "num_mnx_ids": sizes[mnx_labels],
+            "num_identifiers": identifier_sizes[mnx_labels],
+        }
+    ).sort_values("cluster", kind="stable", ignore_index=True)
+    # Rows are distinct such that each one adds another MetaNetX entry.
+    counts = np.bincount(external_codes, minlength=num_external)
+    is_ambiguous = counts[external_codes] > 1
+    ambiguous = (
+        table.loc[is_ambiguous, ["prefix", "identifier", "mnx_id"]]
+        .assign(cluster=rank[mnx_labels[mnx_codes[is_ambiguous]]])
+        .sort_values(["prefix", "identifier", "mnx_id"])
+        .groupby(["prefix", "identifier"], sort=False)
+        .agg(
+            num_mnx_ids=("mnx_id", "size"),
+            mnx_ids=("mnx_id", ";".join),
+            cluster=("cluster", "first"),
+        )
+        .reset_index()
+    )
+    logger.debug(
+        "Found %d clusters and %d ambiguous identifiers.", len(roots), len(ambiguous)
+    )
+    return clusters, ambiguous
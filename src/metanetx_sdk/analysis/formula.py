@@ -0,0 +1,312 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide a parser of chemical formulae into element counts."""
+
+
+from __future__ import annotations
+
+import logging
+import re
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from ..index.identifier_index import expand_ranges
+
+
+logger = logging.getLogger(__name__)
+
+
+# The periodic table followed by the generic residue R used in many formulae.
+ELEMENTS = (
+    "H He Li Be B C N O F Ne Na Mg Al Si P S Cl Ar K Ca Sc Ti V Cr Mn Fe Co Ni Cu "
+    "Zn Ga Ge As Se Br Kr Rb Sr Y Zr Nb Mo Tc Ru Rh Pd Ag Cd In Sn Sb Te I Xe Cs Ba "
+    "La Ce Pr Nd Pm Sm Eu Gd Tb Dy Ho Er Tm Yb Lu Hf Ta W Re Os Ir Pt Au Hg Tl Pb "
+    "Bi Po At Rn Fr Ra Ac Th Pa U Np Pu Am Cm Bk Cf Es Fm Md No Lr Rf Db Sg Bh Hs "
+    "Mt Ds Rg Cn Nh Fl Mc Lv Ts Og R"
+).split()
+ELEMENT_INDEX = pd.Index(ELEMENTS)
+
+# Masses of the most abundant isotope in Dalton. Elements without a stable isotope
+# and the generic residue R have no defined mass.
+MONOISOTOPIC_MASSES = {
+    "H": 1.00782503207,
+    "He": 4.00260325415,
+    "Li": 7.01600455,
+    "Be": 9.0121822,
+    "B": 11.0093054,
+    "C": 12.0,
+    "N": 14.0030740048,
+    "O": 15.99491461956,
+    "F": 18.99840322,
+    "Ne": 19.9924401754,
+    "Na": 22.9897692809,
+    "Mg": 23.985041700,
+    "Al": 26.98153863,
+    "Si": 27.9769265325,
+    "P": 30.97376163,
+    "S": 31.97207100,
+    "Cl": 34.96885268,
+    "Ar": 39.9623831225,
+    "K": 38.96370668,
+    "Ca": 39.96259098,
+    "Sc": 44.9559119,
+    "Ti": 47.9479463,
+    "V": 50.9439595,
+    "Cr": 51.9405075,
+    "Mn": 54.9380451,
+    "Fe": 55.9349375,
+    "Co": 58.9331950,
+    "Ni": 57.9353429,
+    "Cu": 62.9295975,
+    "Zn": 63.9291422,
+    "Ga": 68.9255736,
+    "Ge": 73.9211778,
+    "As": 74.9215965,
+    "Se": 79.9165213,
+    "Br": 78.9183371,
+    "Kr": 83.911507,
+    "Rb": 84.911789738,
+    "Sr": 87.9056121,
+    "Y": 88.9058483,
+    "Zr": 89.9047044,
+    "Nb": 92.9063781,
+    "Mo": 97.9054082,
+    "Ru": 101.9043493,
+    "Rh": 102.905504,
+    "Pd": 105.903486,
+    "Ag": 106.905097,
+    "Cd": 113.9033585,
+    "In": 114.903878,
+    "Sn": 119.9021947,
+    "Sb": 120.9038157,
+    "Te": 129.9062244,
+    "I": 126.904473,
+    "Xe": 131.9041535,
+    "Cs": 132.905451933,
+    "Ba": 137.9052472,
+    "La": 138.9063533,
+    "Ce": 139.9054387,
+    "Pr": 140.9076528,
+    "Nd": 141.9077233,
+    "Sm": 151.9197324,
+    "Eu": 152.9212303,
+    "Gd": 157.9241039,
+    "Tb": 158.9253468,
+    "Dy": 163.9291748,
+    "Ho": 164.9303221,
+    "Er": 165.9302931,
+    "Tm": 168.9342133,
+    "Yb": 173.9388621,
+    "Lu": 174.9407718,
+    "Hf": 179.94655,
+    "Ta": 180.9479958,
+    "W": 183.9509312,
+    "Re": 186.9557531,
+    "Os": 191.9614807,
+    "Ir": 192.9629264,
+    "Pt": 194.9647911,
+    "Au": 196.9665687,
+    "Hg": 201.970643,
+    "Tl": 204.9744275,
+    "Pb": 207.9766521,
+    "Bi": 208.9803987,
+    "Th": 232.0380553,
+    "U": 238.0507882,
+}
+
+TERM_PATTERN = r"([A-Z][a-z]?)(\d*)"
+FORMULA_SEPARATOR = "\n"
+
+
+class ElementMatrix:
+    """
+    Store the element counts of chemical formulae as a compressed sparse matrix.
+
+    Rows are chemicals and columns are the fixed vocabulary of `ELEMENTS`, such
+    that matrices of different tables or releases are directly comparable. Each
+    distinct formula is parsed only once.
+
+    """
+
+    def __init__(
+        self,
+        index: pd.Index,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        data: np.ndarray,
+        valid: np.ndarray,
+    ) -> None:
+        """
+        Initialize the matrix from its compressed sparse row parts.
+
+        Parameters
+        ----------
+        index : pandas.Index
+            The chemical identifiers of the rows.
+        indptr : numpy.ndarray
+            The offsets of each row's entries.
+        indices : numpy.ndarray
+            The element code of each entry.
+        data : numpy.ndarray
+            The count of each entry.
+        valid : numpy.ndarray
+            Whether each row's formula could be parsed.
+
+        """
+        self.index = index
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.valid = valid
+
+    @classmethod
+    def from_formulae(cls, formulae: pd.Series) -> ElementMatrix:
+        """
+        Parse formulae such as ``C6H12O6`` into element counts.
+
+        Parameters
+        ----------
+        formulae : pandas.Series
+            The formulae indexed by chemical identifier. Formulae with other
+            notation, for example, polymers such as ``(C6H10O5)n``, and those with
+            unknown elements are marked invalid and have no element counts.
+
+        """
+        codes, uniques = pd.factorize(formulae)
+        # Scanning all distinct formulae as one string is much faster than matching
+        # each formula separately. Every separator closes the terms of a formula
+        # and any other character makes the formula invalid.
+        matches = re.findall(
+            f"{TERM_PATTERN}|({FORMULA_SEPARATOR})|.",
+            FORMULA_SEPARATOR.join(uniques) + FORMULA_SEPARATOR,
+        )
+        symbols = pd.Series([m[0] for m in matches], dtype=object)
+        is_term = (symbols != "").values
+        is_separator = np.fromiter(
+            (m[2] != "" for m in matches), dtype=bool, count=len(matches)
+        )
+        formula_codes = np.cumsum(is_separator) - is_separator
+        elements = np.full(len(matches), -1, dtype=np.int64)
+        elements[is_term] = ELEMENT_INDEX.get_indexer(symbols.loc[is_term])
+        is_valid = np.bincount(formula_codes[is_term], minlength=len(uniques)) > 0
+        is_valid[formula_codes[~is_separator & (elements < 0)]] = False
+        # There are few distinct counts, which are converted only once.
+        number_codes, numbers = pd.factorize(
+            pd.Series([m[1] for m in matches], dtype=object).loc[is_term]
+        )
+        counts = np.array([int(n) if n else 1 for n in numbers], dtype=np.int64)[
+            number_codes
+        ]
+        formula_codes = formula_codes[is_term]
+        elements = elements[is_term]
+        keep = is_valid[formula_codes]
+        formula_codes, elements, counts = (
+            formula_codes[keep],
+            elements[keep],
+            counts[keep],
+        )
+        # Sum the counts of elements that occur more than once in a formula.
+        order = np.lexsort((elements, formula_codes))
+        formula_codes, elements = formula_codes[order], elements[order]
+        is_new = np.ones(len(order), dtype=bool)
+        is_new[1:] = (formula_codes[1:] != formula_codes[:-1]) | (
+            elements[1:] != elements[:-1]
+        )
+        starts = np.flatnonzero(is_new)
+        unique_data = np.add.reduceat(counts[order], starts).astype(np.int32)
+        unique_indices = elements[starts].astype(np.int16)
+        unique_indptr = np.zeros(len(uniques) + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(formula_codes[starts], minlength=len(uniques)),
+            out=unique_indptr[1:],
+        )
+        # Expand the distinct formulae to all rows.
+        # Missing and invalid formulae point to an empty sentinel range.
+        row_valid = np.append(is_valid, False)[codes]
+        positions = np.where(row_valid, codes, len(uniques))
+        bounds = np.append(unique_indptr, unique_indptr[-1])
+        starts, stops = bounds[positions], bounds[positions + 1]
+        indptr = np.zeros(len(codes) + 1, dtype=np.int64)
+        np.cumsum(stops - starts, out=indptr[1:])
+        entries = expand_ranges(starts, stops)
+        if (num_invalid := ((codes >= 0) & ~row_valid).sum()) > 0:
+            logger.warning("Could not parse %d formulae.", num_invalid)
+        return cls(
+            formulae.index,
+            indptr,
+            unique_indices[entries],
+            unique_data[entries],
+            row_valid,
+        )
+
+    @property
+    def rows(self) -> np.ndarray:
+        """Return the row of each stored count."""
+        return np.repeat(np.arange(len(self.index)), np.diff(self.indptr))
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the counts as a dense table with columns for present elements."""
+        present = np.unique(self.indices)
+        dense = np.zeros((len(self.index), len(present)), dtype=np.int32)
+        dense[self.rows, np.searchsorted(present, self.indices)] = self.data
+        return pd.DataFrame(
+            dense, index=self.index, columns=ELEMENT_INDEX[present]
+        ).loc[self.valid]
+
+    def get_counts(self, element: str) -> pd.Series:
+        """Return the count of one element in every valid formula."""
+        code = ELEMENT_INDEX.get_loc(element)
+        counts = np.zeros(len(self.index), dtype=np.int32)
+        mask = self.indices == code
+        counts[self.rows[mask]] = self.data[mask]
+        return pd.Series(counts, index=self.index).loc[self.valid]
+
+    def contains(self, elements: Iterable[str]) -> pd.Series:
+        """Return whether each formula contains all of the given elements."""
+        codes = ELEMENT_INDEX.get_indexer(list(elements))
+        hits = np.bincount(
+            self.rows[np.isin(self.indices, codes)], minlength=len(self.index)
+        )
+        return pd.Series(self.valid & (hits == len(codes)), index=self.index)
+
+    def consists_of(self, elements: Iterable[str]) -> pd.Series:
+        """Return whether each formula contains no other than the given elements."""
+        codes = ELEMENT_INDEX.get_indexer(list(elements))
+        others = np.bincount(
+            self.rows[~np.isin(self.indices, codes)], minlength=len(self.index)
+        )
+        return pd.Series(self.valid & (others == 0), index=self.index)
+
+    def monoisotopic_masses(self) -> pd.Series:
+        """
+        Compute the monoisotopic mass of every formula.
+
+        Formulae that are invalid or contain elements without a defined mass, such
+        as the generic residue R, have a missing mass.
+
+        """
+        masses = (
+            pd.Series(MONOISOTOPIC_MASSES).reindex(ELEMENT_INDEX).values.astype(float)
+        )
+        totals = np.bincount(
+            self.rows,
+            weights=self.data * masses[self.indices],
+            minlength=len(self.index),
+        ).astype(float)
+        totals[~self.valid] = np.nan
+        return pd.Series(totals, index=self.index)
@@ -0,0 +1,239 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide a bipartite graph of reactions and metabolites."""
+
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..index.identifier_index import expand_ranges
+from .stoichiometry import StoichiometricMatrix
+
+
+logger = logging.getLogger(__name__)
+
+
+class ReactionGraph:
+    """
+    Represent reactions and the metabolites that they involve as a bipartite graph.
+
+    The edges are stored twice as compressed sparse rows, once ordered by reaction
+    and once ordered by metabolite, such that the neighbors of any node are a
+    contiguous slice. Batch queries expand whole frontiers of nodes at once.
+
+    """
+
+    def __init__(
+        self,
+        reactions: pd.Index,
+        metabolites: pd.Index,
+        reaction_offsets: np.ndarray,
+        reaction_metabolites: np.ndarray,
+    ) -> None:
+        """
+        Initialize the graph from the edges ordered by reaction.
+
+        Parameters
+        ----------
+        reactions : pandas.Index
+            The reaction identifiers.
+        metabolites : pandas.Index
+            The metabolite identifiers.
+        reaction_offsets : numpy.ndarray
+            The offsets of each reaction's metabolites.
+        reaction_metabolites : numpy.ndarray
+            The metabolite codes of all reactions.
+
+        """
+        self.reactions = reactions
+        self.metabolites = metabolites
+        self._reaction_offsets = reaction_offsets
+        self._reaction_metabolites = reaction_metabolites
+        reaction_codes = np.repeat(
+            np.arange(len(reactions), dtype=np.int32), np.diff(reaction_offsets)
+        )
+        order = np.argsort(reaction_metabolites, kind="stable")
+        self._metabolite_reactions = reaction_codes[order]
+        self._metabolite_offsets = np.zeros(len(metabolites) + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(reaction_metabolites, minlength=len(metabolites)),
+            out=self._metabolite_offsets[1:],
+        )
+
+    @classmethod
+    def from_matrix(
+        cls, matrix: StoichiometricMatrix, collapse_compartments: bool = False
+    ) -> ReactionGraph:
+        """
+        Build the graph from a stoichiometric matrix.
+
+        Parameters
+        ----------
+        matrix : StoichiometricMatrix
+            The parsed reaction equations.
+        collapse_compartments : bool, optional
+            Whether to merge the compartmentalized metabolites of the same chemical
+            into one node (default false).
+
+        """
+        if not collapse_compartments:
+            return cls(
+                matrix.reactions, matrix.metabolites, matrix.indptr, matrix.indices
+            )
+        codes, compounds = pd.factorize(matrix.compounds(), sort=True)
+        columns = codes[matrix.indices]
+        rows = matrix.rows
+        # Remove duplicate edges, for example, of transport reactions.
+        order = np.lexsort((columns, rows))
+        rows, columns = rows[order], columns[order]
+        is_new = np.ones(len(rows), dtype=bool)
+        is_new[1:] = (rows[1:] != rows[:-1]) | (columns[1:] != columns[:-1])
+        offsets = np.zeros(len(matrix.reactions) + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(rows[is_new], minlength=len(matrix.reactions)),
+            out=offsets[1:],
+        )
+        return cls(
+            matrix.reactions,
+            pd.Index(compounds),
+            offsets,
+            columns[is_new].astype(np.int32),
+        )
+
+    def save(self, filename: Path) -> None:
+        """Store the graph in a compressed NumPy file."""
+        with Path(filename).open("wb") as handle:
+            np.savez_compressed(
+                handle,
+                reactions=self.reactions.values.astype(str),
+                metabolites=self.metabolites.values.astype(str),
+                reaction_offsets=self._reaction_offsets,
+                reaction_metabolites=self._reaction_metabolites,
+            )
+
+    @classmethod
+    def load(cls, filename: Path) -> ReactionGraph:
+        """Load a graph stored with `save`."""
+        with np.load(filename) as data:
+            return cls(
+                pd.Index(data["reactions"].astype(object)),
+                pd.Index(data["metabolites"].astype(object)),
+                data["reaction_offsets"],
+                data["reaction_metabolites"],
+            )
+
+    def degrees(self) -> pd.Series:
+        """Return the number of reactions that involve each metabolite."""
+        return pd.Series(np.diff(self._metabolite_offsets), index=self.metabolites)
+
+    def currency_metabolites(self, max_degree: int) -> pd.Index:
+        """Return the metabolites involved in more than a number of reactions."""
+        degrees = self.degrees()
+        return degrees.index[degrees.values > max_degree]
+
+    def get_reactions(self, metabolite: str) -> List[str]:
+        """Return the reactions that involve a metabolite."""
+        code = self.metabolites.get_loc(metabolite)
+        start, stop = self._metabolite_offsets[code], self._metabolite_offsets[code + 1]
+        return self.reactions.values[self._metabolite_reactions[start:stop]].tolist()
+
+    def get_metabolites(self, reaction: str) -> List[str]:
+        """Return the metabolites that a reaction involves."""
+        code = self.reactions.get_loc(reaction)
+        start, stop = self._reaction_offsets[code], self._reaction_offsets[code + 1]
+        return self.metabolites.values[self._reaction_metabolites[start:stop]].tolist()
+
+    def _step(self, frontier: np.ndarray, passable: np.ndarray) -> np.ndarray:
+        """Return the metabolites that share a reaction with any in the frontier."""
+        reactions = np.unique(
+            self._metabolite_reactions[
+                expand_ranges(
+                    self._metabolite_offsets[frontier],
+                    self._metabolite_offsets[frontier + 1],
+                )
+            ]
+        )
+        neighbors = np.unique(
+            self._reaction_metabolites[
+                expand_ranges(
+                    self._reaction_offsets[reactions],
+                    self._reaction_offsets[reactions + 1],
+                )
+            ]
+        )
+        return neighbors[passable[neighbors]]
+
+    def expand(
+        self,
+        metabolites: Iterable[str],
+        hops: int = 1,
+        max_degree: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        Find all metabolites within a number of reactions of the given ones.
+
+        The search proceeds breadth-first from all given metabolites at once.
+
+        Parameters
+        ----------
+        metabolites : iterable of str
+            The metabolites to start from. Unknown ones are ignored.
+        hops : int, optional
+            The maximum number of reactions between metabolites (default 1).
+        max_degree : int, optional
+            If given, metabolites involved in more reactions, typically currency
+            metabolites such as water or ATP, are neither traversed nor reported.
+
+        Returns
+        -------
+        pandas.DataFrame
+            A table with the columns ``metabolite`` and ``distance``, which is the
+            minimum number of reactions from any of the given metabolites. The
+            given metabolites have a distance of zero.
+
+        """
+        codes = self.metabolites.get_indexer(pd.Index(list(metabolites), dtype=object))
+        frontier = np.unique(codes[codes >= 0])
+        passable = np.ones(len(self.metabolites), dtype=bool)
+        if max_degree is not None:
+            passable = np.diff(self._metabolite_offsets) <= max_degree
+        distances = np.full(len(self.metabolites), -1, dtype=np.int32)
+        distances[frontier] = 0
+        for distance in range(1, hops + 1):
+            if len(frontier) == 0:
+                break
+            frontier = self._step(frontier[passable[frontier]], passable)
+            frontier = frontier[distances[frontier] < 0]
+            distances[frontier] = distance
+        reached = np.flatnonzero(distances >= 0)
+        reached = reached[np.argsort(distances[reached], kind="stable")]
+        return pd.DataFrame(
+            {
+                "metabolite": self.metabolites.values[reached],
+                "distance": distances[reached],
+            }
+        )
+
+    def neighbors(self, metabolite: str, max_degree: Optional[int] = None) -> List[str]:
+        """Return the metabolites that share at least one reaction with another."""
+        result = self.expand([metabolite], hops=1, max_degree=max_degree)
+        return result.loc[result["distance"] == 1, "metabolite"].tolist()
@@ -0,0 +1,251 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide a sparse stoichiometric matrix of MetaNetX reaction equations."""
+
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+
+COMPARTMENT_SEPARATOR = "@"
+
+
+def parse_equations(equations: pd.Series) -> pd.DataFrame:
+    """
+    Parse MetaNetX reaction equations into stoichiometric coefficients.
+
+    Equations have the form ``1 MNXM1@MNXD1 + 2 MNXM2@MNXD1 = 1 MNXM3@MNXD2``. All
+    equations are split at once by column-wise string operations.
+
+    Parameters
+    ----------
+    equations : pandas.Series
+        The equations indexed by reaction identifier.
+
+    Returns
+    -------
+    pandas.DataFrame
+        A table with the columns ``reaction``, ``metabolite``, and ``coefficient``
+        with one row per term. Coefficients of substrates are negative. Terms whose
+        coefficient is not a number, for example, of polymers, are omitted.
+
+    """
+    equations = equations.dropna()
+    sides = equations.str.split(r"\s*=\s*", n=1, expand=True)
+    if sides.shape[1] < 2:
+        sides[1] = None
+    if (num_invalid := sides[1].isnull().sum()) > 0:
+        logger.error("There are %d equations without an equals sign.", num_invalid)
+    terms = pd.concat(
+        [
+            sides[0].str.split(r"\s+\+\s+").explode().to_frame("term"),
+            sides[1].str.split(r"\s+\+\s+").explode().to_frame("term"),
+        ],
+        keys=[-1.0, 1.0],
+        names=["sign", "reaction"],
+    ).reset_index()
+    # Reactions without substrates or products have an empty side.
+    terms = terms.loc[terms["term"].str.len() > 0]
+    parts = terms["term"].str.extract(r"^\s*(\S+)\s+(\S+)\s*$")
+    coefficients = pd.to_numeric(parts[0], errors="coerce")
+    if (num_invalid := coefficients.isnull().sum()) > 0:
+        logger.warning(
+            "Ignoring %d terms without a numeric stoichiometric coefficient.",
+            num_invalid,
+        )
+    result = pd.DataFrame(
+        {
+            "reaction": terms["reaction"].values,
+            "metabolite": parts[1].values,
+            "coefficient": (terms["sign"] * coefficients).values,
+        }
+    )
+    return result.dropna().reset_index(drop=True)
+
+
+class StoichiometricMatrix:
+    """
+    Store the stoichiometry of reactions as a compressed sparse row matrix.
+
+    Rows are reactions and columns are compartmentalized metabolites, for example,
+    ``MNXM1@MNXD1``. Both are encoded as integer positions into sorted indexes of
+    their identifiers.
+
+    """
+
+    def __init__(
+        self,
+        reactions: pd.Index,
+        metabolites: pd.Index,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        data: np.ndarray,
+    ) -> None:
+        """
+        Initialize the matrix from its compressed sparse row parts.
+
+        Parameters
+        ----------
+        reactions : pandas.Index
+            The reaction identifiers of the rows.
+        metabolites : pandas.Index
+            The compartmentalized metabolite identifiers of the columns.
+        indptr : numpy.ndarray
+            The offsets of each row's entries.
+        indices : numpy.ndarray
+            The column of each entry.
+        data : numpy.ndarray
+            The stoichiometric coefficient of each entry.
+
+        """
+        self.reactions = reactions
+        self.metabolites = metabolites
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+
+    @classmethod
+    def from_equations(cls, equations: pd.Series) -> StoichiometricMatrix:
+        """
+        Build the matrix from MetaNetX reaction equations.
+
+        Coefficients of a metabolite that occurs on both sides of an equation are
+        summed. Entries that cancel out are not stored.
+
+        Parameters
+        ----------
+        equations : pandas.Series
+            The equations indexed by reaction identifier.
+
+        """
+        terms = parse_equations(equations)
+        row_codes, reactions = pd.factorize(terms["reaction"], sort=True)
+        col_codes, metabolites = pd.factorize(terms["metabolite"], sort=True)
+        order = np.lexsort((col_codes, row_codes))
+        row_codes = row_codes[order]
+        col_codes = col_codes[order]
+        is_new = np.ones(len(order), dtype=bool)
+        is_new[1:] = (row_codes[1:] != row_codes[:-1]) | (
+            col_codes[1:] != col_codes[:-1]
+        )
+        starts = np.flatnonzero(is_new)
+        data = np.add.reduceat(terms["coefficient"].values[order], starts)
+        nonzero = data != 0
+        rows = row_codes[starts][nonzero]
+        indptr = np.zeros(len(reactions) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(reactions)), out=indptr[1:])
+        logger.debug(
+            "Parsed %d reactions with %d metabolites and %d coefficients.",
+            len(reactions),
+            len(metabolites),
+            nonzero.sum(),
+        )
+        return cls(
+            reactions,
+            metabolites,
+            indptr,
+            col_codes[starts][nonzero].astype(np.int32),
+            data[nonzero],
+        )
+
+    @classmethod
+    def from_table(cls, properties: pd.DataFrame) -> StoichiometricMatrix:
+        """Build the matrix from (transformed) reaction properties."""
+        return cls.from_equations(properties.set_index("mnx_id")["equation"])
+
+    def save(self, filename: Path) -> None:
+        """Store the matrix in a compressed NumPy file."""
+        with Path(filename).open("wb") as handle:
+            np.savez_compressed(
+                handle,
+                reactions=self.reactions.values.astype(str),
+                metabolites=self.metabolites.values.astype(str),
+                indptr=self.indptr,
+                indices=self.indices,
+                data=self.data,
+            )
+
+    @classmethod
+    def load(cls, filename: Path) -> StoichiometricMatrix:
+        """Load a matrix stored with `save`."""
+        with np.load(filename) as data:
+            return cls(
+                pd.Index(data["reactions"].astype(object)),
+                pd.Index(data["metabolites"].astype(object)),
+                data["indptr"],
+                data["indices"],
+                data["data"],
+            )
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """Return the number of reactions and metabolites."""
+        return len(self.reactions), len(self.metabolites)
+
+    @property
+    def nnz(self) -> int:
+        """Return the number of stored coefficients."""
+        return len(self.data)
+
+    @property
+    def rows(self) -> np.ndarray:
+        """Return the row of each stored coefficient."""
+        return np.repeat(
+            np.arange(len(self.reactions), dtype=np.int32), np.diff(self.indptr)
+        )
+
+    def compounds(self) -> pd.Series:
+        """Return the chemical identifier of each metabolite without compartment."""
+        return (
+            pd.Series(self.metabolites, index=self.metabolites)
+            .str.split(COMPARTMENT_SEPARATOR, n=1)
+            .str[0]
+        )
+
+    def get_reaction(self, reaction: str) -> pd.Series:
+        """Return the coefficients of one reaction indexed by metabolite."""
+        row = self.reactions.get_loc(reaction)
+        start, stop = self.indptr[row], self.indptr[row + 1]
+        return pd.Series(
+            self.data[start:stop],
+            index=self.metabolites[self.indices[start:stop]],
+            name=reaction,
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the matrix in long format, one row per stored coefficient."""
+        return pd.DataFrame(
+            {
+                "reaction": self.reactions.values[self.rows],
+                "metabolite": self.metabolites.values[self.indices],
+                "coefficient": self.data,
+            }
+        )
+
+    def to_scipy(self):
+        """Return the matrix as a SciPy sparse matrix if SciPy is installed."""
+        from scipy.sparse import csr_matrix
+
+        return csr_matrix((self.data, self.indices, self.indptr), shape=self.shape)
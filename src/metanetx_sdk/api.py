@@ -20,11 +20,43 @@ import asyncio
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, List, Mapping, Optional
+from typing import Callable, Iterable, List, Mapping, Optional
+
+import pandas as pd
 
 from . import ftp
-from .extract import extract_table
-from .model import FTPConfigurationModel, SingleTableConfigurationModel
+from .analysis import (
+    ElementMatrix,
+    ReactionGraph,
+    StoichiometricMatrix,
+    check_balance,
+    find_clusters,
+)
+from .diff import diff_tables
+from .extract import convert_string_columns, extract_table
+from .index import (
+    BloomFilter,
+    IdentifierEncoding,
+    IdentifierIndex,
+    MappedIdentifierIndex,
+    NameIndex,
+    build_lookup_table,
+    write_identifier_index,
+    write_lookup_table,
+)
+from .index.identifier_index import COLUMNS as INDEX_COLUMNS
+from .load import infer_table_name, load_sqlite
+from .model import (
+    FTPConfigurationModel,
+    SingleTableConfigurationModel,
+    TableConfigurationModel,
+    TransformStatisticsModel,
+    ValidationResultModel,
+)
+from .rdf import EXACT_MATCH, SUBJECT_PREFIXES, export_triples
+from .server import Resolver, create_server
+from .translate import translate_file
+from .validate import log_validation, validate_table
 
 
 logger = logging.getLogger(__name__)
@@ -39,6 +71,7 @@ def pull(
     configuration: Optional[FTPConfigurationModel] = None,
     last_checked: Optional[datetime] = None,
     compress: bool = True,
+    keep_previous: bool = False,
 ) -> datetime:
     """
     Pull in changes to one or more files from the MetaNetX FTP server.
@@ -57,6 +90,10 @@ def pull(
         assumed that the files have never been checked before.
     compress : bool, optional
         Whether or not to compress the downloaded files with gzip (default True).
+    keep_previous : bool, optional
+        Whether or not to move outdated local files into the subdirectory
+        ``previous`` instead of overwriting them (default False). This is needed
+        for computing changesets with `diff_table`.
 
     Returns
     -------
@@ -85,18 +122,48 @@ def pull(
             last_checked,
             configuration.timezone,
             compress,
+            keep_previous,
         )
     )
     loop.close()
     return pull_on
 
 
+def validate_extracted_table(
+    data: pd.DataFrame, configuration: SingleTableConfigurationModel
+) -> List[ValidationResultModel]:
+    """
+    Validate an extracted MetaNetX table and log any violations.
+
+    Parameters
+    ----------
+    data : pandas.DataFrame
+        The extracted table.
+    configuration : metanetx_sdk.model.SingleTableConfigurationModel
+        The configuration of the specific table including its validation rules.
+
+    Returns
+    -------
+    list of metanetx_sdk.model.ValidationResultModel
+        The outcome of each validation rule.
+
+    """
+    logger.info("Validating...")
+    results = validate_table(data, configuration.validation)
+    log_validation(results)
+    return results
+
+
 def etl_table(
     filename: Path,
     output: Path,
     configuration: SingleTableConfigurationModel,
     mapping: Mapping,
     transform: Callable,
+    validate: bool = False,
+    encoding: Optional[IdentifierEncoding] = None,
+    string_storage: Optional[str] = None,
+    statistics_output: Optional[Path] = None,
 ) -> None:
     """
     Extract, transform, and load a MetaNetX table.
@@ -113,11 +180,575 @@ def etl_table(
         A mapping between MetaNetX resources and Identifiers.org registries.
     transform : typing.Callable
         The table-specific transformation function to apply.
+    validate : bool, optional
+        Whether or not to validate the extracted table against the configured rules
+        (default False).
+    encoding : metanetx_sdk.index.IdentifierEncoding, optional
+        If given, MetaNetX identifiers are stored as their integer codes.
+    string_storage : str, optional
+        If given, text is kept in compact string columns with this storage, for
+        example, ``pyarrow``, and columns with few distinct values are
+        dictionary-encoded.
+    statistics_output : pathlib.Path, optional
+        If given, statistics collected while transforming the table are stored as
+        JSON at this path. The transformation must accept a ``statistics``
+        argument.
 
     """
     logger.info("Extracting...")
-    data = extract_table(filename, configuration.columns, configuration.skip)
+    data = extract_table(
+        filename,
+        configuration.columns,
+        configuration.skip,
+        string_storage=string_storage,
+    )
+    if validate:
+        validate_extracted_table(data, configuration)
     logger.info("Transforming...")
-    processed = transform(data, mapping)
+    if statistics_output is None:
+        processed = transform(data, mapping)
+    else:
+        statistics = TransformStatisticsModel()
+        processed = transform(data, mapping, statistics=statistics)
+        statistics_output.write_text(statistics.json(indent=2))
+    if string_storage is not None:
+        processed = convert_string_columns(processed, string_storage, categorical=True)
+    if encoding is not None:
+        processed = encoding.encode_table(processed)
     logger.info("Loading...")
     processed.to_csv(output, **OUTPUT_OPTIONS)
+
+
+def diff_table(
+    previous: Path,
+    current: Path,
+    output: Path,
+    name: str,
+    configuration: SingleTableConfigurationModel,
+) -> None:
+    """
+    Extract two versions of a MetaNetX table and store their changeset.
+
+    The changeset consists of three tables ``<name>_added.tsv.gz``,
+    ``<name>_changed.tsv.gz``, and ``<name>_removed.tsv.gz``. The first two contain
+    complete rows from the current table while the latter contains only the key
+    columns of rows that no longer exist.
+
+    Parameters
+    ----------
+    previous : pathlib.Path
+        The previous version of the table.
+    current : pathlib.Path
+        The current version of the table.
+    output : pathlib.Path
+        The directory where to store the changeset tables.
+    name : str
+        The table name used as a prefix for the changeset tables.
+    configuration : metanetx_sdk.model.SingleTableConfigurationModel
+        The configuration to use for extracting the specific file.
+
+    """
+    logger.info("Extracting...")
+    previous_table = extract_table(previous, configuration.columns, configuration.skip)
+    current_table = extract_table(current, configuration.columns, configuration.skip)
+    logger.info("Comparing...")
+    changeset = diff_tables(previous_table, current_table, configuration.keys)
+    logger.info("Loading...")
+    output.mkdir(parents=True, exist_ok=True)
+    for kind, table in changeset._asdict().items():
+        table.to_csv(output / f"{name}_{kind}.tsv.gz", **OUTPUT_OPTIONS)
+
+
+def build_identifier_index(filenames: List[Path], output: Path) -> None:
+    """
+    Build a memory-mappable identifier index from transformed cross-references.
+
+    Parameters
+    ----------
+    filenames : list of pathlib.Path
+        Transformed cross-reference tables, for example, of chemicals, reactions,
+        and compartments.
+    output : pathlib.Path
+        Where to store the binary index file.
+
+    """
+    logger.info("Extracting...")
+    tables = [
+        pd.read_csv(name, sep="\t", usecols=INDEX_COLUMNS, dtype=str)
+        for name in filenames
+    ]
+    logger.info("Loading...")
+    write_identifier_index(tables, output)
+
+
+def build_bloom_filter(
+    filenames: List[Path], output: Path, false_positive_rate: float = 0.01
+) -> None:
+    """
+    Build Bloom filters of the cross-references of each namespace.
+
+    Parameters
+    ----------
+    filenames : list of pathlib.Path
+        Transformed cross-reference tables.
+    output : pathlib.Path
+        Where to store the filters.
+    false_positive_rate : float, optional
+        The probability that an unknown identifier passes the filter (default
+        0.01).
+
+    """
+    logger.info("Extracting and hashing...")
+    bloom_filter = BloomFilter.from_files(
+        filenames, false_positive_rate=false_positive_rate
+    )
+    logger.info(
+        "Built filters of %d namespaces with %d bytes.",
+        len(bloom_filter.prefixes),
+        bloom_filter.nbytes,
+    )
+    bloom_filter.save(output)
+
+
+def build_name_index(filenames: List[Path], output: Path) -> None:
+    """
+    Build a name and synonym search index from transformed chemical tables.
+
+    Parameters
+    ----------
+    filenames : list of pathlib.Path
+        Transformed chemical properties, whose ``name`` column is indexed, and
+        cross-references, whose ``description`` column is indexed.
+    output : pathlib.Path
+        Where to store the index.
+
+    """
+    properties = []
+    cross_references = []
+    for name in filenames:
+        columns = pd.read_csv(name, sep="\t", nrows=0).columns
+        if "name" in columns:
+            properties.append(name)
+        elif "description" in columns:
+            cross_references.append(name)
+        else:
+            raise ValueError(f"The table '{name}' has neither names nor descriptions.")
+    logger.info("Indexing names...")
+    index = NameIndex.from_files(properties, cross_references)
+    logger.info("Indexed %d distinct names.", len(index))
+    index.save(output)
+
+
+def build_stoichiometric_matrix(filename: Path, output: Path) -> None:
+    """
+    Parse all reaction equations into a sparse stoichiometric matrix.
+
+    Parameters
+    ----------
+    filename : pathlib.Path
+        Transformed reaction properties.
+    output : pathlib.Path
+        Where to store the matrix.
+
+    """
+    logger.info("Extracting...")
+    properties = pd.read_csv(
+        filename, sep="\t", usecols=["mnx_id", "equation"], dtype=str
+    )
+    logger.info("Parsing equations...")
+    matrix = StoichiometricMatrix.from_table(properties)
+    logger.info(
+        "Found %d reactions over %d metabolites with %d coefficients.",
+        *matrix.shape,
+        matrix.nnz,
+    )
+    matrix.save(output)
+
+
+def build_reaction_graph(
+    filename: Path, output: Path, collapse_compartments: bool = False
+) -> None:
+    """
+    Build a bipartite reaction and metabolite graph from reaction equations.
+
+    Parameters
+    ----------
+    filename : pathlib.Path
+        Transformed reaction properties.
+    output : pathlib.Path
+        Where to store the graph.
+    collapse_compartments : bool, optional
+        Whether to merge the compartmentalized metabolites of the same chemical
+        (default false).
+
+    """
+    logger.info("Extracting...")
+    properties = pd.read_csv(
+        filename, sep="\t", usecols=["mnx_id", "equation"], dtype=str
+    )
+    logger.info("Parsing equations...")
+    graph = ReactionGraph.from_matrix(
+        StoichiometricMatrix.from_table(properties),
+        collapse_compartments=collapse_compartments,
+    )
+    logger.info(
+        "Found %d reactions and %d metabolites.",
+        len(graph.reactions),
+        len(graph.metabolites),
+    )
+    graph.save(output)
+
+
+def check_reaction_balance(
+    reaction_file: Path,
+    chemical_files: List[Path],
+    output: Path,
+    residuals_output: Path,
+) -> None:
+    """
+    Recompute the element and charge balance of all reactions.
+
+    Parameters
+    ----------
+    reaction_file : pathlib.Path
+        Transformed reaction properties.
+    chemical_files : list of pathlib.Path
+        Transformed chemical properties.
+    output : pathlib.Path
+        Where to store the balance of each reaction.
+    residuals_output : pathlib.Path
+        Where to store the residual of each unbalanced element.
+
+    """
+    logger.info("Extracting...")
+    reactions = pd.read_csv(
+        reaction_file, sep="\t", usecols=["mnx_id", "equation"], dtype=str
+    )
+    chemicals = pd.concat(
+        [
+            pd.read_csv(
+                name, sep="\t", usecols=["mnx_id", "formula", "charge"], dtype=str
+            )
+            for name in chemical_files
+        ],
+        ignore_index=True,
+    ).drop_duplicates("mnx_id")
+    logger.info("Parsing equations and formulae...")
+    matrix = StoichiometricMatrix.from_table(reactions)
+    chemicals = chemicals.set_index("mnx_id")
+    elements = ElementMatrix.from_formulae(chemicals["formula"])
+    logger.info("Checking balance...")
+    summary, residuals = check_balance(matrix, elements, chemicals["charge"])
+    logger.info(
+        "Found %d balanced, %d unbalanced, and %d undetermined reactions.",
+        (summary["is_balanced"] == "B").sum(),
+        (summary["is_balanced"] == "U").sum(),
+        summary["is_balanced"].isnull().sum(),
+    )
+    summary.to_csv(output, **OUTPUT_OPTIONS)
+    residuals.to_csv(residuals_output, **OUTPUT_OPTIONS)
+
+
+def find_cross_reference_clusters(
+    filenames: List[Path], output: Path, ambiguous_output: Path
+) -> None:
+    """
+    Find clusters of MetaNetX entries connected by shared cross-references.
+
+    Parameters
+    ----------
+    filenames : list of pathlib.Path
+        Transformed cross-reference tables of one kind.
+    output : pathlib.Path
+        Where to store the cluster of each MetaNetX identifier.
+    ambiguous_output : pathlib.Path
+        Where to store the external identifiers that refer to several entries.
+
+    """
+    logger.info("Extracting...")
+    cross_references = pd.concat(
+        [
+            pd.read_csv(
+                name, sep="\t", usecols=["mnx_id", "prefix", "identifier"], dtype=str
+            )
+            for name in filenames
+        ],
+        ignore_index=True,
+    )
+    logger.info("Finding clusters...")
+    clusters, ambiguous = find_clusters(cross_references)
+    logger.info(
+        "Found %d clusters with more than one entry and %d ambiguous identifiers.",
+        clusters.loc[clusters["num_mnx_ids"] > 1, "cluster"].nunique(),
+        len(ambiguous),
+    )
+    clusters.to_csv(output, **OUTPUT_OPTIONS)
+    ambiguous.to_csv(ambiguous_output, **OUTPUT_OPTIONS)
+
+
+def build_identifier_encoding(
+    filenames: List[Path], output: Path, configuration: TableConfigurationModel
+) -> None:
+    """
+    Build a shared integer encoding of the MetaNetX identifiers of a release.
+
+    Parameters
+    ----------
+    filenames : list of pathlib.Path
+        Raw MetaNetX tables of the release. The kind of each table is inferred from
+        its file name, for example, ``chem_prop.tsv.gz``.
+    output : pathlib.Path
+        Where to store the encoding.
+    configuration : metanetx_sdk.model.TableConfigurationModel
+        The table configuration of the release.
+
+    """
+    known = [name for name in TableConfigurationModel.__fields__ if name != "version"]
+    tables = []
+    logger.info("Extracting...")
+    for filename in filenames:
+        name = infer_table_name(filename, known)
+        if name not in known:
+            raise ValueError(f"Cannot infer the MetaNetX table of '{filename}'.")
+        config = getattr(configuration, name)
+        tables.append(extract_table(filename, config.columns, config.skip))
+    encoding = IdentifierEncoding.from_tables(tables)
+    logger.info("Encoded %d distinct identifiers.", len(encoding))
+    encoding.save(output)
+
+
+def build_lookup(
+    cross_references: Path, properties: Path, output: Path, columns: List[str]
+) -> None:
+    """
+    Materialize cross-references joined with the properties of their entries.
+
+    Parameters
+    ----------
+    cross_references : pathlib.Path
+        Transformed cross-references.
+    properties : pathlib.Path
+        Transformed properties of the same kind.
+    output : pathlib.Path
+        Where to store the lookup table. Files with the suffix ``.parquet`` are
+        written in the columnar Parquet format, which requires PyArrow, and others
+        as tab-separated values.
+    columns : list of str
+        The property columns to include.
+
+    """
+    logger.info("Extracting...")
+    xref = pd.read_csv(
+        cross_references,
+        sep="\t",
+        usecols=["mnx_id", "prefix", "identifier", "description"],
+        dtype=str,
+    )
+    prop = pd.read_csv(
+        properties,
+        sep="\t",
+        usecols=["mnx_id"] + columns,
+        dtype={"mnx_id": str, **{c: str for c in columns if c != "mass"}},
+    )
+    logger.info("Joining...")
+    table = build_lookup_table(xref, prop, columns)
+    logger.info("Loading...")
+    write_lookup_table(table, output)
+
+
+def export_rdf(
+    filenames: List[Path],
+    output: Path,
+    subject_prefix: Optional[str] = None,
+    predicate: str = EXACT_MATCH,
+    chunksize: int = 1_000_000,
+) -> None:
+    """
+    Stream transformed cross-reference tables into N-Triples.
+
+    Parameters
+    ----------
+    filenames : list of pathlib.Path
+        Transformed cross-reference tables of one kind.
+    output : pathlib.Path
+        The output file. Compressed if the file name ends with ``.gz``.
+    subject_prefix : str, optional
+        The Identifiers.org prefix of the MetaNetX identifiers. By default, it is
+        inferred from the file names, for example, ``chem_xref.tsv.gz`` contains
+        ``metanetx.chemical`` identifiers.
+    predicate : str, optional
+        The IRI that relates MetaNetX entries with their cross-references (default
+        ``skos:exactMatch``).
+    chunksize : int, optional
+        The number of rows that are formatted at a time (default 1,000,000).
+
+    """
+    if subject_prefix is None:
+        kinds = {
+            infer_table_name(name, [f"{kind}_xref" for kind in SUBJECT_PREFIXES])
+            for name in filenames
+        }
+        prefixes = {SUBJECT_PREFIXES.get(kind.split("_")[0]) for kind in kinds}
+        if len(prefixes) != 1 or None in prefixes:
+            raise ValueError(
+                "Cannot infer a single MetaNetX namespace from the file names. "
+                "Please specify the subject prefix."
+            )
+        subject_prefix = prefixes.pop()
+    logger.info("Exporting %s cross-references...", subject_prefix)
+    num_triples = export_triples(
+        filenames, output, subject_prefix, predicate=predicate, chunksize=chunksize
+    )
+    logger.info("Wrote %d triples.", num_triples)
+
+
+def export_sqlite(filenames: List[Path], database: Path) -> None:
+    """
+    Load transformed tables into a single, indexed SQLite database.
+
+    Parameters
+    ----------
+    filenames : list of pathlib.Path
+        Transformed tables. The database table names are inferred from the file
+        names, for example, ``chem_prop.tsv.gz`` is loaded into ``chem_prop``.
+    database : pathlib.Path
+        The SQLite database file. Existing tables of the same names are replaced.
+
+    """
+    known = [name for name in TableConfigurationModel.__fields__ if name != "version"]
+    tables = {}
+    for filename in filenames:
+        name = infer_table_name(filename, known)
+        if name in tables:
+            raise ValueError(
+                f"Both '{tables[name]}' and '{filename}' would be loaded into the "
+                f"table '{name}'."
+            )
+        tables[name] = filename
+    load_sqlite(tables, database)
+
+
+def map_identifiers(
+    input_file: Path,
+    output_file: Path,
+    source: str,
+    target: str,
+    index_file: Optional[Path] = None,
+    xref_files: Iterable[Path] = (),
+    chunksize: int = 1_000_000,
+    bloom_file: Optional[Path] = None,
+) -> None:
+    """
+    Translate a file of identifiers from one namespace to another.
+
+    Parameters
+    ----------
+    input_file : pathlib.Path
+        A file with one identifier per line.
+    output_file : pathlib.Path
+        Where to store the translations.
+    source : str
+        The Identifiers.org prefix of the given identifiers.
+    target : str
+        The Identifiers.org prefix to translate to.
+    index_file : pathlib.Path, optional
+        A binary identifier index as built by `build_identifier_index`. Takes
+        precedence over the cross-reference tables.
+    xref_files : iterable of pathlib.Path, optional
+        Transformed cross-reference tables from which to build an index in memory.
+    chunksize : int, optional
+        The number of identifiers that are translated at a time (default 1,000,000).
+    bloom_file : pathlib.Path, optional
+        A Bloom filter as built by `build_bloom_filter` that rejects most unknown
+        identifiers without probing the index.
+
+    """
+    bloom_filter = None if bloom_file is None else BloomFilter.load(bloom_file)
+    if index_file is not None:
+        with MappedIdentifierIndex(index_file) as index:
+            translate_file(
+                input_file,
+                output_file,
+                index,
+                source,
+                target,
+                chunksize,
+                bloom_filter=bloom_filter,
+            )
+        return
+    xref_files = list(xref_files)
+    if not xref_files:
+        raise ValueError("Either an index file or cross-reference tables are required.")
+    logger.info("Indexing cross-references...")
+    index = IdentifierIndex.from_files(xref_files)
+    translate_file(
+        input_file,
+        output_file,
+        index,
+        source,
+        target,
+        chunksize,
+        bloom_filter=bloom_filter,
+    )
+
+
+def serve(
+    host: str,
+    port: int,
+    index_file: Optional[Path] = None,
+    xref_files: Iterable[Path] = (),
+    depr_files: Iterable[Path] = (),
+    bloom_file: Optional[Path] = None,
+) -> None:
+    """
+    Load identifier mappings once and answer queries until interrupted.
+
+    Parameters
+    ----------
+    host : str
+        The address to bind to.
+    port : int
+        The port to listen on.
+    index_file : pathlib.Path, optional
+        A binary identifier index as built by `build_identifier_index`. Takes
+        precedence over the cross-reference tables.
+    xref_files : iterable of pathlib.Path, optional
+        Transformed cross-reference tables from which to build an index in memory.
+    depr_files : iterable of pathlib.Path, optional
+        Transformed deprecation tables for mapping deprecated identifiers.
+    bloom_file : pathlib.Path, optional
+        A Bloom filter as built by `build_bloom_filter` that rejects most unknown
+        identifiers without probing the index.
+
+    """
+    xref_files = list(xref_files)
+    if index_file is not None:
+        index = MappedIdentifierIndex(index_file)
+    elif xref_files:
+        logger.info("Indexing cross-references...")
+        index = IdentifierIndex.from_files(xref_files)
+    else:
+        raise ValueError("Either an index file or cross-reference tables are required.")
+    depr_files = list(depr_files)
+    deprecations = None
+    if depr_files:
+        deprecations = pd.concat(
+            [
+                pd.read_csv(
+                    name, sep="\t", usecols=["deprecated_id", "current_id"], dtype=str
+                )
+                for name in depr_files
+            ],
+            ignore_index=True,
+        )
+    bloom_filter = None if bloom_file is None else BloomFilter.load(bloom_file)
+    server = create_server(Resolver(index, deprecations, bloom_filter), host, port)
+    logger.info("Listening on http://%s:%d.", *server.server_address[:2])
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if isinstance(index, MappedIdentifierIndex):
+            index.close()
@@ -24,8 +24,12 @@ import click_log
 from dateutil import parser
 
 from .. import api
-from ..model import FTPConfigurationModel
+from ..model import FTPConfigurationModel, get_release_registry
+from ..server import DEFAULT_HOST, DEFAULT_PORT
+from .diff import diff
 from .etl import etl
+from .search import search
+from .translate import map_identifiers
 
 
 logger = logging.getLogger("metanetx_sdk")
@@ -56,20 +60,34 @@ def cli():
     show_default=True,
     help="Gzip the pulled in files.",
 )
+@click.option(
+    "--keep-previous/--no-keep-previous",
+    default=False,
+    show_default=True,
+    help="Move outdated files into a subdirectory 'previous' instead of "
+    "overwriting them.",
+)
 @click.option(
     "--version",
-    type=click.Choice(["4.1"]),
-    default="4.1",
+    type=click.Choice(get_release_registry().versions),
+    default=get_release_registry().latest,
     show_default=True,
     help="The MetaNetX release version.",
 )
+@click.option(
+    "--by-release/--no-by-release",
+    default=False,
+    show_default=True,
+    help="Store files in a subdirectory named after the release version such that "
+    "multiple releases can share one working directory.",
+)
 @click.argument(
     "working_dir",
     metavar="<METANETX DIRECTORY>",
     type=click.Path(exists=True, file_okay=False, writable=True),
 )
 @click.argument("files", metavar="[FILENAME] ...", type=click.Path(), nargs=-1)
-def pull(compress, version, working_dir, files):
+def pull(compress, keep_previous, version, by_release, working_dir, files):
     """
     Load missing or outdated files from the MetaNetX FTP server.
 
@@ -85,6 +103,9 @@ def pull(compress, version, working_dir, files):
     async_logger.setLevel(logger.level)
     aioftp_logger = logging.getLogger("aioftp")
     aioftp_logger.setLevel(logger.level)
+    if by_release:
+        working_dir = get_release_registry().release_directory(working_dir, version)
+        working_dir.mkdir(exist_ok=True)
     # The MetaNetX FTP server is in Switzerland but does not support timezones.
     last = Path(working_dir) / "last.txt"
     if last.is_file():
@@ -94,10 +115,82 @@ def pull(compress, version, working_dir, files):
         last_checked = None
     config = FTPConfigurationModel.load(version)
     checked_on = api.pull(
-        working_dir, files, config, last_checked=last_checked, compress=compress
+        working_dir,
+        files,
+        config,
+        last_checked=last_checked,
+        compress=compress,
+        keep_previous=keep_previous,
     )
     with last.open("w") as file_handle:
         file_handle.write(checked_on.isoformat())
 
 
+@cli.command()
+@click.help_option("--help", "-h")
+@click.option(
+    "--host",
+    default=DEFAULT_HOST,
+    show_default=True,
+    help="The address to listen on. Only bind to other than loopback on trusted "
+    "networks.",
+)
+@click.option(
+    "--port",
+    type=click.IntRange(min=0, max=65535),
+    default=DEFAULT_PORT,
+    show_default=True,
+    help="The port to listen on.",
+)
+@click.option(
+    "--index",
+    "index_file",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+    help="A binary identifier index as built by 'etl identifier-index'.",
+)
+@click.option(
+    "--xref",
+    "xref_files",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+    multiple=True,
+    help="A transformed cross-references table. Can be given multiple times and is "
+    "ignored if an index is given.",
+)
+@click.option(
+    "--depr",
+    "depr_files",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+    multiple=True,
+    help="A transformed deprecation table. Can be given multiple times.",
+)
+@click.option(
+    "--bloom",
+    "bloom_file",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+    help="A Bloom filter as built by 'etl bloom-filter' for rejecting unknown "
+    "identifiers before probing the index.",
+)
+def serve(host, port, index_file, xref_files, depr_files, bloom_file):
+    """
+    Keep identifier mappings in memory and answer batched queries over HTTP.
+
+    Use the lightweight client `metanetx_sdk.client.MetaNetXClient` to avoid the
+    start-up cost of this command line interface for every lookup.
+
+    """
+    if index_file is None and not xref_files:
+        raise click.UsageError("Either --index or --xref is required.")
+    api.serve(
+        host,
+        port,
+        index_file=None if index_file is None else Path(index_file),
+        xref_files=[Path(name) for name in xref_files],
+        depr_files=[Path(name) for name in depr_files],
+        bloom_file=None if bloom_file is None else Path(bloom_file),
+    )
+
+
 cli.add_command(etl)
+cli.add_command(diff)
+cli.add_command(map_identifiers)
+cli.add_command(search)
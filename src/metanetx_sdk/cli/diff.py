@@ -0,0 +1,76 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide a command for computing changesets between MetaNetX table versions."""
+
+
+import logging
+from pathlib import Path
+
+import click
+
+from .. import api
+from ..model import TableConfigurationModel, get_release_registry
+
+
+logger = logging.getLogger(__name__)
+
+
+TABLES = [name for name in TableConfigurationModel.__fields__ if name != "version"]
+
+
+@click.command()
+@click.help_option("--help", "-h")
+@click.option(
+    "--version",
+    type=click.Choice(get_release_registry().versions),
+    default=get_release_registry().latest,
+    show_default=True,
+    help="The MetaNetX release version.",
+)
+@click.argument("table", metavar="<TABLE>", type=click.Choice(TABLES))
+@click.argument(
+    "previous",
+    metavar="<PREVIOUS FILE>",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+)
+@click.argument(
+    "current",
+    metavar="<CURRENT FILE>",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+)
+@click.argument(
+    "output",
+    metavar="<OUTPUT DIRECTORY>",
+    type=click.Path(file_okay=False, dir_okay=True, writable=True),
+)
+def diff(version, table, previous, current, output):
+    """
+    Compute the rows added, removed, and changed between two table versions.
+
+    TABLE is the name of the MetaNetX table, for example, chem_xref.
+
+    PREVIOUS FILE and CURRENT FILE are paths to raw MetaNetX source tables, for
+    example, as kept by `pull --keep-previous`.
+
+    OUTPUT DIRECTORY is where the changeset tables are stored.
+
+    """
+    logger.info("Computing changeset for '%s'.", table)
+    config = TableConfigurationModel.load(version)
+    api.diff_table(
+        Path(previous), Path(current), Path(output), table, getattr(config, table)
+    )
+    logger.info("Complete.")
@@ -18,11 +18,14 @@
 
 import logging
 from pathlib import Path
+from typing import Optional
 
 import click
 
 from .. import api, extract, transform
-from ..model import TableConfigurationModel
+from ..index import CHEMICAL_COLUMNS, REACTION_COLUMNS, IdentifierEncoding
+from ..model import TableConfigurationModel, get_release_registry
+from ..rdf import EXACT_MATCH
 
 
 logger = logging.getLogger(__name__)
@@ -30,9 +33,61 @@ logger = logging.getLogger(__name__)
 
 @click.group()
 @click.help_option("--help", "-h")
-def etl():
+@click.option(
+    "--version",
+    type=click.Choice(get_release_registry().versions),
+    default=get_release_registry().latest,
+    show_default=True,
+    help="The MetaNetX release version.",
+)
+@click.option(
+    "--validate/--no-validate",
+    default=False,
+    show_default=True,
+    help="Validate extracted tables against the configured rules.",
+)
+@click.option(
+    "--encoding",
+    metavar="<ENCODING FILE>",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+    help="Store MetaNetX identifiers as the integer codes of an encoding created "
+    "by the encoding command.",
+)
+@click.option(
+    "--string-storage",
+    type=click.Choice(["python", "pyarrow"]),
+    help="Keep text in pandas string columns with the given storage and "
+    "dictionary-encode columns with few distinct values. Only the pyarrow "
+    "storage, which requires the optional PyArrow package, stores text compactly.",
+)
+@click.option(
+    "--statistics/--no-statistics",
+    default=False,
+    show_default=True,
+    help="Write statistics on the namespaces of transformed properties and "
+    "cross-references as JSON next to each output, for example, "
+    "chem_xref_statistics.json.",
+)
+@click.pass_context
+def etl(context, version, validate, encoding, string_storage, statistics):
     """Subcommand for processing MetaNetX tables."""
-    pass
+    context.ensure_object(dict)
+    context.obj["statistics"] = statistics
+    context.obj["version"] = version
+    context.obj["validate"] = validate
+    context.obj["string_storage"] = string_storage
+    context.obj["encoding"] = (
+        None if encoding is None else IdentifierEncoding.load(Path(encoding))
+    )
+
+
+def _statistics_path(output: str, statistics: bool) -> Optional[Path]:
+    """Return the path of the statistics next to a transformed table if enabled."""
+    if not statistics:
+        return None
+    output = Path(output)
+    stem, _, _ = output.name.partition(".")
+    return output.with_name(f"{stem}_statistics.json")
 
 
 @etl.command()
@@ -47,7 +102,8 @@ def etl():
     metavar="<OUTPUT FILE>",
     type=click.Path(exists=False, file_okay=True, dir_okay=False),
 )
-def chem_depr(filename, output):
+@click.pass_context
+def chem_depr(context, filename, output):
     """
     Extract and transform a table with deprecated chemical identifiers.
 
@@ -57,12 +113,20 @@ def chem_depr(filename, output):
 
     """
     logger.info("Processing deprecated chemical identifiers.")
-    config = TableConfigurationModel.load()
+    config = TableConfigurationModel.load(context.obj["version"])
     logger.info("Extracting...")
     deprecated = extract.extract_table(
-        Path(filename), config.chem_depr.columns, config.chem_depr.skip
+        Path(filename),
+        config.chem_depr.columns,
+        config.chem_depr.skip,
+        string_storage=context.obj["string_storage"],
     )
+    if context.obj["validate"]:
+        api.validate_extracted_table(deprecated, config.chem_depr)
     logger.info("Transforming...")
+    deprecated = transform.transform_deprecated_identifiers(deprecated)
+    if context.obj["encoding"] is not None:
+        deprecated = context.obj["encoding"].encode_table(deprecated)
     logger.info("Loading...")
     deprecated.to_csv(Path(output), **api.OUTPUT_OPTIONS)
     logger.info("Complete.")
@@ -80,7 +144,8 @@ def chem_depr(filename, output):
     metavar="<OUTPUT FILE>",
     type=click.Path(exists=False, file_okay=True, dir_okay=False),
 )
-def chem_prop(filename, output):
+@click.pass_context
+def chem_prop(context, filename, output):
     """
     Extract and transform a chemical properties table.
 
@@ -90,7 +155,7 @@ def chem_prop(filename, output):
 
     """
     logger.info("Processing chemical properties.")
-    config = TableConfigurationModel.load()
+    config = TableConfigurationModel.load(context.obj["version"])
     mapping = extract.extract_chemical_prefix_mapping()
     api.etl_table(
         Path(filename),
@@ -98,6 +163,10 @@ def chem_prop(filename, output):
         config.chem_prop,
         mapping,
         transform.transform_chemical_properties,
+        validate=context.obj["validate"],
+        encoding=context.obj["encoding"],
+        string_storage=context.obj["string_storage"],
+        statistics_output=_statistics_path(output, context.obj["statistics"]),
     )
     logger.info("Complete.")
 
@@ -114,7 +183,8 @@ def chem_prop(filename, output):
     metavar="<OUTPUT FILE>",
     type=click.Path(exists=False, file_okay=True, dir_okay=False),
 )
-def chem_xref(filename, output):
+@click.pass_context
+def chem_xref(context, filename, output):
     """
     Extract and transform a chemical cross-references table.
 
@@ -124,7 +194,7 @@ def chem_xref(filename, output):
 
     """
     logger.info("Processing chemical cross-references.")
-    config = TableConfigurationModel.load()
+    config = TableConfigurationModel.load(context.obj["version"])
     mapping = extract.extract_chemical_prefix_mapping()
     api.etl_table(
         Path(filename),
@@ -132,6 +202,10 @@ def chem_xref(filename, output):
         config.chem_xref,
         mapping,
         transform.transform_chemical_cross_references,
+        validate=context.obj["validate"],
+        encoding=context.obj["encoding"],
+        string_storage=context.obj["string_storage"],
+        statistics_output=_statistics_path(output, context.obj["statistics"]),
     )
     logger.info("Complete.")
 
@@ -148,7 +222,8 @@ def chem_xref(filename, output):
     metavar="<OUTPUT FILE>",
     type=click.Path(exists=False, file_okay=True, dir_okay=False),
 )
-def comp_depr(filename, output):
+@click.pass_context
+def comp_depr(context, filename, output):
     """
     Extract and transform a table with deprecated compartment identifiers.
 
@@ -158,12 +233,20 @@ def comp_depr(filename, output):
 
     """
     logger.info("Processing deprecated compartment identifiers.")
-    config = TableConfigurationModel.load()
+    config = TableConfigurationModel.load(context.obj["version"])
     logger.info("Extracting...")
     deprecated = extract.extract_table(
-        Path(filename), config.comp_depr.columns, config.comp_depr.skip
+        Path(filename),
+        config.comp_depr.columns,
+        config.comp_depr.skip,
+        string_storage=context.obj["string_storage"],
     )
+    if context.obj["validate"]:
+        api.validate_extracted_table(deprecated, config.comp_depr)
     logger.info("Transforming...")
+    deprecated = transform.transform_deprecated_identifiers(deprecated)
+    if context.obj["encoding"] is not None:
+        deprecated = context.obj["encoding"].encode_table(deprecated)
     logger.info("Loading...")
     deprecated.to_csv(Path(output), **api.OUTPUT_OPTIONS)
     logger.info("Complete.")
@@ -181,7 +264,8 @@ def comp_depr(filename, output):
     metavar="<OUTPUT FILE>",
     type=click.Path(exists=False, file_okay=True, dir_okay=False),
 )
-def comp_prop(filename, output):
+@click.pass_context
+def comp_prop(context, filename, output):
     """
     Extract and transform a compartment properties table.
 
@@ -191,7 +275,7 @@ def comp_prop(filename, output):
 
     """
     logger.info("Processing compartment properties.")
-    config = TableConfigurationModel.load()
+    config = TableConfigurationModel.load(context.obj["version"])
     mapping = extract.extract_compartment_prefix_mapping()
     api.etl_table(
         Path(filename),
@@ -199,6 +283,10 @@ def comp_prop(filename, output):
         config.comp_prop,
         mapping,
         transform.transform_compartment_properties,
+        validate=context.obj["validate"],
+        encoding=context.obj["encoding"],
+        string_storage=context.obj["string_storage"],
+        statistics_output=_statistics_path(output, context.obj["statistics"]),
     )
     logger.info("Complete.")
 
@@ -215,7 +303,8 @@ def comp_prop(filename, output):
     metavar="<OUTPUT FILE>",
     type=click.Path(exists=False, file_okay=True, dir_okay=False),
 )
-def comp_xref(filename, output):
+@click.pass_context
+def comp_xref(context, filename, output):
     """
     Extract and transform a compartment cross-references table.
 
@@ -225,7 +314,7 @@ def comp_xref(filename, output):
 
     """
     logger.info("Processing compartment cross-references.")
-    config = TableConfigurationModel.load()
+    config = TableConfigurationModel.load(context.obj["version"])
     mapping = extract.extract_compartment_prefix_mapping()
     api.etl_table(
         Path(filename),
@@ -233,6 +322,10 @@ def comp_xref(filename, output):
         config.comp_xref,
         mapping,
         transform.transform_compartment_cross_references,
+        validate=context.obj["validate"],
+        encoding=context.obj["encoding"],
+        string_storage=context.obj["string_storage"],
+        statistics_output=_statistics_path(output, context.obj["statistics"]),
     )
     logger.info("Complete.")
 
@@ -249,7 +342,8 @@ def comp_xref(filename, output):
     metavar="<OUTPUT FILE>",
     type=click.Path(exists=False, file_okay=True, dir_okay=False),
 )
-def reac_depr(filename, output):
+@click.pass_context
+def reac_depr(context, filename, output):
     """
     Extract and transform a table with deprecated reaction identifiers.
 
@@ -258,13 +352,21 @@ def reac_depr(filename, output):
     OUTPUT FILE is the path for the transformed table output.
 
     """
-    logger.info("Processing deprecated compartment identifiers.")
-    config = TableConfigurationModel.load()
+    logger.info("Processing deprecated reaction identifiers.")
+    config = TableConfigurationModel.load(context.obj["version"])
     logger.info("Extracting...")
     deprecated = extract.extract_table(
-        Path(filename), config.reac_depr.columns, config.reac_depr.skip
+        Path(filename),
+        config.reac_depr.columns,
+        config.reac_depr.skip,
+        string_storage=context.obj["string_storage"],
     )
+    if context.obj["validate"]:
+        api.validate_extracted_table(deprecated, config.reac_depr)
     logger.info("Transforming...")
+    deprecated = transform.transform_deprecated_identifiers(deprecated)
+    if context.obj["encoding"] is not None:
+        deprecated = context.obj["encoding"].encode_table(deprecated)
     logger.info("Loading...")
     deprecated.to_csv(Path(output), **api.OUTPUT_OPTIONS)
     logger.info("Complete.")
@@ -282,7 +384,8 @@ def reac_depr(filename, output):
     metavar="<OUTPUT FILE>",
     type=click.Path(exists=False, file_okay=True, dir_okay=False),
 )
-def reac_prop(filename, output):
+@click.pass_context
+def reac_prop(context, filename, output):
     """
     Extract and transform a reaction properties table.
 
@@ -292,7 +395,7 @@ def reac_prop(filename, output):
 
     """
     logger.info("Processing reaction properties.")
-    config = TableConfigurationModel.load()
+    config = TableConfigurationModel.load(context.obj["version"])
     mapping = extract.extract_reaction_prefix_mapping()
     api.etl_table(
         Path(filename),
@@ -300,6 +403,10 @@ def reac_prop(filename, output):
         config.reac_prop,
         mapping,
         transform.transform_reaction_properties,
+        validate=context.obj["validate"],
+        encoding=context.obj["encoding"],
+        string_storage=context.obj["string_storage"],
+        statistics_output=_statistics_path(output, context.obj["statistics"]),
     )
     logger.info("Complete.")
 
@@ -316,7 +423,8 @@ def reac_prop(filename, output):
     metavar="<OUTPUT FILE>",
     type=click.Path(exists=False, file_okay=True, dir_okay=False),
 )
-def reac_xref(filename, output):
+@click.pass_context
+def reac_xref(context, filename, output):
     """
     Extract and transform a reaction cross-references table.
 
@@ -326,7 +434,7 @@ def reac_xref(filename, output):
 
     """
     logger.info("Processing reaction cross-references.")
-    config = TableConfigurationModel.load()
+    config = TableConfigurationModel.load(context.obj["version"])
     mapping = extract.extract_reaction_prefix_mapping()
     api.etl_table(
         Path(filename),
@@ -334,5 +442,456 @@ def reac_xref(filename, output):
         config.reac_xref,
         mapping,
         transform.transform_reaction_cross_references,
+        validate=context.obj["validate"],
+        encoding=context.obj["encoding"],
+        string_storage=context.obj["string_storage"],
+        statistics_output=_statistics_path(output, context.obj["statistics"]),
+    )
+    logger.info("Complete.")
+
+
+@etl.command()
+@click.help_option("--help", "-h")
+@click.argument(
+    "output",
+    metavar="<OUTPUT FILE>",
+    type=click.Path(exists=False, file_okay=True, dir_okay=False),
+)
+@click.argument(
+    "filenames",
+    metavar="<XREF FILE> ...",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+    nargs=-1,
+    required=True,
+)
+def identifier_index(output, filenames):
+    """
+    Build a memory-mappable index of transformed cross-reference tables.
+
+    OUTPUT FILE is the path for the binary index file.
+
+    XREF FILE is the path to a transformed cross-references table, for example, the
+    output of the chem-xref command. Name any number of tables.
+
+    """
+    logger.info("Building identifier index.")
+    api.build_identifier_index([Path(name) for name in filenames], Path(output))
+    logger.info("Complete.")
+
+
+@etl.command()
+@click.help_option("--help", "-h")
+@click.argument(
+    "database",
+    metavar="<DATABASE>",
+    type=click.Path(exists=False, file_okay=True, dir_okay=False),
+)
+@click.argument(
+    "filenames",
+    metavar="<TABLE FILE> ...",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+    nargs=-1,
+    required=True,
+)
+def sqlite(database, filenames):
+    """
+    Load transformed tables into a single SQLite database.
+
+    DATABASE is the path to the SQLite database file.
+
+    TABLE FILE is the path to a transformed table, for example, the output of the
+    chem-prop command. Each table is named after the MetaNetX table that occurs in
+    its file name. Name any number of tables.
+
+    """
+    logger.info("Loading tables into SQLite.")
+    api.export_sqlite([Path(name) for name in filenames], Path(database))
+    logger.info("Complete.")
+
+
+@etl.command()
+@click.help_option("--help", "-h")
+@click.argument(
+    "output",
+    metavar="<OUTPUT FILE>",
+    type=click.Path(exists=False, file_okay=True, dir_okay=False),
+)
+@click.argument(
+    "filenames",
+    metavar="<TABLE FILE> ...",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+    nargs=-1,
+    required=True,
+)
+def name_index(output, filenames):
+    """
+    Build a search index over chemical names and synonyms.
+
+    OUTPUT FILE is the path for the index file.
+
+    TABLE FILE is the path to transformed chemical properties or cross-references,
+    for example, the output of the chem-prop and chem-xref commands.
+
+    """
+    logger.info("Building name index.")
+    api.build_name_index([Path(name) for name in filenames], Path(output))
+    logger.info("Complete.")
+
+
+@etl.command()
+@click.help_option("--help", "-h")
+@click.argument(
+    "filename",
+    metavar="<REAC PROP FILE>",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+)
+@click.argument(
+    "output",
+    metavar="<OUTPUT FILE>",
+    type=click.Path(exists=False, file_okay=True, dir_okay=False),
+)
+def stoichiometry(filename, output):
+    """
+    Parse all reaction equations into a sparse stoichiometric matrix.
+
+    REAC PROP FILE is the path to the transformed reaction properties, for example,
+    the output of the reac-prop command.
+
+    OUTPUT FILE is the path for the compressed NumPy (.npz) matrix file.
+
+    """
+    logger.info("Building stoichiometric matrix.")
+    api.build_stoichiometric_matrix(Path(filename), Path(output))
+    logger.info("Complete.")
+
+
+@etl.command()
+@click.help_option("--help", "-h")
+@click.option(
+    "--collapse-compartments/--keep-compartments",
+    default=False,
+    show_default=True,
+    help="Merge the compartmentalized metabolites of the same chemical.",
+)
+@click.argument(
+    "filename",
+    metavar="<REAC PROP FILE>",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+)
+@click.argument(
+    "output",
+    metavar="<OUTPUT FILE>",
+    type=click.Path(exists=False, file_okay=True, dir_okay=False),
+)
+def reaction_graph(collapse_compartments, filename, output):
+    """
+    Build a bipartite graph of reactions and the metabolites that they involve.
+
+    REAC PROP FILE is the path to the transformed reaction properties, for example,
+    the output of the reac-prop command.
+
+    OUTPUT FILE is the path for the compressed NumPy (.npz) graph file.
+
+    """
+    logger.info("Building reaction graph.")
+    api.build_reaction_graph(
+        Path(filename), Path(output), collapse_compartments=collapse_compartments
+    )
+    logger.info("Complete.")
+
+
+@etl.command()
+@click.help_option("--help", "-h")
+@click.option(
+    "--residuals",
+    metavar="<PATH>",
+    type=click.Path(exists=False, file_okay=True, dir_okay=False),
+    help="The output path for the element residuals (default next to OUTPUT FILE "
+    "with a _residuals suffix).",
+)
+@click.argument(
+    "reaction_file",
+    metavar="<REAC PROP FILE>",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+)
+@click.argument(
+    "output",
+    metavar="<OUTPUT FILE>",
+    type=click.Path(exists=False, file_okay=True, dir_okay=False),
+)
+@click.argument(
+    "chemical_files",
+    metavar="<CHEM PROP FILE> ...",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+    nargs=-1,
+    required=True,
+)
+def balance(residuals, reaction_file, output, chemical_files):
+    """
+    Recompute the element and charge balance of all reactions.
+
+    REAC PROP FILE is the path to the transformed reaction properties, for example,
+    the output of the reac-prop command.
+
+    OUTPUT FILE is the path for the tab-separated balance of each reaction.
+
+    CHEM PROP FILE are the paths to transformed chemical properties, for example,
+    the output of the chem-prop command.
+
+    """
+    output = Path(output)
+    if residuals is None:
+        stem, dot, suffixes = output.name.partition(".")
+        residuals = output.with_name(f"{stem}_residuals{dot}{suffixes}")
+    logger.info("Checking reaction balance.")
+    api.check_reaction_balance(
+        Path(reaction_file), [Path(f) for f in chemical_files], output, Path(residuals)
+    )
+    logger.info("Complete.")
+
+
+@etl.command()
+@click.help_option("--help", "-h")
+@click.option(
+    "--ambiguous",
+    metavar="<PATH>",
+    type=click.Path(exists=False, file_okay=True, dir_okay=False),
+    help="The output path for the ambiguous identifiers (default next to OUTPUT "
+    "FILE with an _ambiguous suffix).",
+)
+@click.argument(
+    "output",
+    metavar="<OUTPUT FILE>",
+    type=click.Path(exists=False, file_okay=True, dir_okay=False),
+)
+@click.argument(
+    "filenames",
+    metavar="<XREF FILE> ...",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+    nargs=-1,
+    required=True,
+)
+def clusters(ambiguous, output, filenames):
+    """
+    Find clusters of MetaNetX entries connected by shared cross-references.
+
+    OUTPUT FILE is the path for the tab-separated cluster of each MetaNetX
+    identifier.
+
+    XREF FILE are the paths to transformed cross-reference tables of one kind, for
+    example, the output of the chem-xref command.
+
+    """
+    output = Path(output)
+    if ambiguous is None:
+        stem, dot, suffixes = output.name.partition(".")
+        ambiguous = output.with_name(f"{stem}_ambiguous{dot}{suffixes}")
+    logger.info("Finding cross-reference clusters.")
+    api.find_cross_reference_clusters(
+        [Path(f) for f in filenames], output, Path(ambiguous)
+    )
+    logger.info("Complete.")
+
+
+@etl.command()
+@click.help_option("--help", "-h")
+@click.argument(
+    "output",
+    metavar="<OUTPUT FILE>",
+    type=click.Path(exists=False, file_okay=True, dir_okay=False),
+)
+@click.argument(
+    "filenames",
+    metavar="<INPUT FILE> ...",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+    nargs=-1,
+    required=True,
+)
+@click.pass_context
+def encoding(context, output, filenames):
+    """
+    Build a shared integer encoding of the MetaNetX identifiers of a release.
+
+    OUTPUT FILE is the path for the compressed NumPy (.npz) encoding file.
+
+    INPUT FILE are the paths to raw MetaNetX source tables, for example,
+    chem_prop.tsv.gz and chem_depr.tsv.gz, whose kind is inferred from their names.
+
+    """
+    logger.info("Building identifier encoding.")
+    api.build_identifier_encoding(
+        [Path(f) for f in filenames],
+        Path(output),
+        TableConfigurationModel.load(context.obj["version"]),
+    )
+    logger.info("Complete.")
+
+
+@etl.command()
+@click.help_option("--help", "-h")
+@click.argument(
+    "cross_references",
+    metavar="<CHEM XREF FILE>",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+)
+@click.argument(
+    "properties",
+    metavar="<CHEM PROP FILE>",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+)
+@click.argument(
+    "output",
+    metavar="<OUTPUT FILE>",
+    type=click.Path(exists=False, file_okay=True, dir_okay=False),
+)
+def chem_lookup(cross_references, properties, output):
+    """
+    Join chemical cross-references with the properties of their entries.
+
+    CHEM XREF FILE is the path to the transformed chemical cross-references.
+
+    CHEM PROP FILE is the path to the transformed chemical properties.
+
+    OUTPUT FILE is the path for the lookup table sorted by prefix and identifier.
+    Use the suffix .parquet for the columnar Parquet format (requires PyArrow).
+
+    """
+    logger.info("Building chemical lookup table.")
+    api.build_lookup(
+        Path(cross_references), Path(properties), Path(output), CHEMICAL_COLUMNS
+    )
+    logger.info("Complete.")
+
+
+@etl.command()
+@click.help_option("--help", "-h")
+@click.argument(
+    "cross_references",
+    metavar="<REAC XREF FILE>",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+)
+@click.argument(
+    "properties",
+    metavar="<REAC PROP FILE>",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+)
+@click.argument(
+    "output",
+    metavar="<OUTPUT FILE>",
+    type=click.Path(exists=False, file_okay=True, dir_okay=False),
+)
+def reac_lookup(cross_references, properties, output):
+    """
+    Join reaction cross-references with the properties of their entries.
+
+    REAC XREF FILE is the path to the transformed reaction cross-references.
+
+    REAC PROP FILE is the path to the transformed reaction properties.
+
+    OUTPUT FILE is the path for the lookup table sorted by prefix and identifier.
+    Use the suffix .parquet for the columnar Parquet format (requires PyArrow).
+
+    """
+    logger.info("Building reaction lookup table.")
+    api.build_lookup(
+        Path(cross_references), Path(properties), Path(output), REACTION_COLUMNS
+    )
+    logger.info("Complete.")
+
+
+@etl.command()
+@click.help_option("--help", "-h")
+@click.option(
+    "--false-positive-rate",
+    type=click.FloatRange(min=0.0, max=1.0),
+    default=0.01,
+    show_default=True,
+    help="The probability that an unknown identifier passes the filter.",
+)
+@click.argument(
+    "output",
+    metavar="<OUTPUT FILE>",
+    type=click.Path(exists=False, file_okay=True, dir_okay=False),
+)
+@click.argument(
+    "filenames",
+    metavar="<XREF FILE> ...",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+    nargs=-1,
+    required=True,
+)
+def bloom_filter(false_positive_rate, output, filenames):
+    """
+    Build Bloom filters that reject unknown identifiers of each namespace.
+
+    OUTPUT FILE is the path for the compressed NumPy (.npz) filter file.
+
+    XREF FILE are the paths to transformed cross-reference tables, for example,
+    the output of the chem-xref command.
+
+    """
+    logger.info("Building Bloom filters.")
+    api.build_bloom_filter(
+        [Path(f) for f in filenames],
+        Path(output),
+        false_positive_rate=false_positive_rate,
+    )
+    logger.info("Complete.")
+
+
+@etl.command()
+@click.help_option("--help", "-h")
+@click.option(
+    "--subject-prefix",
+    type=click.Choice(
+        ["metanetx.chemical", "metanetx.compartment", "metanetx.reaction"]
+    ),
+    help="The namespace of the MetaNetX identifiers (default inferred from the "
+    "file names).",
+)
+@click.option(
+    "--predicate",
+    metavar="<IRI>",
+    default=EXACT_MATCH,
+    show_default=True,
+    help="The predicate relating MetaNetX entries with their cross-references.",
+)
+@click.option(
+    "--chunksize",
+    type=click.IntRange(min=1),
+    default=1_000_000,
+    show_default=True,
+    help="The number of rows that are formatted at a time.",
+)
+@click.argument(
+    "output",
+    metavar="<OUTPUT FILE>",
+    type=click.Path(exists=False, file_okay=True, dir_okay=False),
+)
+@click.argument(
+    "filenames",
+    metavar="<XREF FILE> ...",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+    nargs=-1,
+    required=True,
+)
+def rdf(subject_prefix, predicate, chunksize, output, filenames):
+    """
+    Export cross-references as N-Triples with Identifiers.org IRIs.
+
+    OUTPUT FILE is the path for the N-Triples, which are also valid Turtle, and
+    compressed if the name ends with .gz, for example, chem_xref.nt.gz.
+
+    XREF FILE are the paths to transformed cross-reference tables of one kind, for
+    example, the output of the chem-xref command.
+
+    """
+    logger.info("Exporting cross-references as RDF.")
+    api.export_rdf(
+        [Path(f) for f in filenames],
+        Path(output),
+        subject_prefix=subject_prefix,
+        predicate=predicate,
+        chunksize=chunksize,
     )
     logger.info("Complete.")
@@ -0,0 +1,182 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide commands for searching prebuilt indexes."""
+
+
+import logging
+from pathlib import Path
+
+import click
+import pandas as pd
+
+from ..index import LookupTable, NameIndex, StructureIndex
+
+
+logger = logging.getLogger(__name__)
+
+
+@click.group()
+@click.help_option("--help", "-h")
+def search():
+    """Subcommand for searching prebuilt indexes."""
+    pass
+
+
+@search.command()
+@click.help_option("--help", "-h")
+@click.option(
+    "--prefix/--fuzzy",
+    default=False,
+    show_default=True,
+    help="Find names that start with the query rather than similar names.",
+)
+@click.option(
+    "--limit",
+    type=click.IntRange(min=1),
+    default=10,
+    show_default=True,
+    help="The maximum number of names to report.",
+)
+@click.option(
+    "--min-score",
+    type=click.FloatRange(min=0.0, max=1.0),
+    default=0.3,
+    show_default=True,
+    help="The minimum similarity of a fuzzy match.",
+)
+@click.argument(
+    "index_file",
+    metavar="<INDEX FILE>",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+)
+@click.argument("query", metavar="<QUERY>")
+def name(prefix, limit, min_score, index_file, query):
+    """
+    Search chemicals by name or synonym.
+
+    INDEX FILE is the path to an index built by 'etl name-index'.
+
+    QUERY is a chemical name, possibly misspelled or incomplete.
+
+    """
+    index = NameIndex.load(index_file)
+    if prefix:
+        result = index.prefix_search(query, limit=limit)
+    else:
+        result = index.search(query, limit=limit, min_score=min_score)
+    click.echo(result.to_csv(sep="\t", index=False), nl=False)
+
+
+@search.command()
+@click.help_option("--help", "-h")
+@click.option(
+    "--skeleton/--full",
+    default=False,
+    show_default=True,
+    help="Match only the first block of the InChIKeys, which ignores "
+    "stereochemistry and protonation.",
+)
+@click.argument(
+    "properties",
+    metavar="<CHEM PROP FILE>",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+)
+@click.argument("inchi_keys", metavar="<INCHIKEY> ...", nargs=-1, required=True)
+def inchi_key(skeleton, properties, inchi_keys):
+    """
+    Find chemicals by their InChIKeys.
+
+    CHEM PROP FILE is the path to the transformed chemical properties.
+
+    INCHIKEY is a standard InChIKey. Name any number of keys.
+
+    """
+    index = StructureIndex.from_files([Path(properties)])
+    result = index.find_inchi_keys(inchi_keys, skeleton=skeleton)
+    click.echo(result.to_csv(sep="\t", index=False), nl=False)
+
+
+@search.command()
+@click.help_option("--help", "-h")
+@click.option(
+    "--tolerance",
+    type=click.FloatRange(min=0.0),
+    default=5.0,
+    show_default=True,
+    help="The half-width of the mass window around each query mass.",
+)
+@click.option(
+    "--ppm/--dalton",
+    default=True,
+    show_default=True,
+    help="Whether the tolerance is in parts per million or in Dalton.",
+)
+@click.argument(
+    "properties",
+    metavar="<CHEM PROP FILE>",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+)
+@click.argument(
+    "masses",
+    metavar="<MASS FILE>",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False, allow_dash=True),
+)
+def mass(tolerance, ppm, properties, masses):
+    """
+    Annotate a batch of monoisotopic masses with candidate chemicals.
+
+    CHEM PROP FILE is the path to the transformed chemical properties.
+
+    MASS FILE is the path to a file with one neutral mass per line or - to read
+    from standard input.
+
+    """
+    index = StructureIndex.from_files([Path(properties)])
+    queries = pd.read_csv(
+        click.get_text_stream("stdin") if masses == "-" else masses,
+        header=None,
+        usecols=[0],
+        sep="\t",
+        dtype=float,
+    ).iloc[:, 0]
+    result = index.find_masses(queries, tolerance=tolerance, ppm=ppm)
+    click.echo(result.to_csv(sep="\t", index=False), nl=False)
+
+
+@search.command()
+@click.help_option("--help", "-h")
+@click.argument(
+    "lookup_file",
+    metavar="<LOOKUP FILE>",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+)
+@click.argument("prefix", metavar="<PREFIX>")
+@click.argument("identifiers", metavar="<IDENTIFIER> ...", nargs=-1, required=True)
+def xref(lookup_file, prefix, identifiers):
+    """
+    Look up external identifiers with their MetaNetX entries and properties.
+
+    LOOKUP FILE is the path to a table built by 'etl chem-lookup' or
+    'etl reac-lookup'.
+
+    PREFIX is the Identifiers.org prefix of the identifiers, for example,
+    kegg.compound.
+
+    IDENTIFIER is an identifier in that namespace. Name any number of identifiers.
+
+    """
+    result = LookupTable.from_file(Path(lookup_file)).find(prefix, identifiers)
+    click.echo(result.to_csv(sep="\t", index=False), nl=False)
@@ -0,0 +1,113 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide a command for translating identifiers between namespaces."""
+
+
+import logging
+from pathlib import Path
+
+import click
+
+from .. import api
+
+
+logger = logging.getLogger(__name__)
+
+
+@click.command(name="map")
+@click.help_option("--help", "-h")
+@click.option(
+    "--source",
+    "-s",
+    required=True,
+    help="The Identifiers.org prefix of the input identifiers, e.g., bigg.metabolite.",
+)
+@click.option(
+    "--target",
+    "-t",
+    required=True,
+    help="The Identifiers.org prefix to translate to, e.g., kegg.compound.",
+)
+@click.option(
+    "--index",
+    "index_file",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+    help="A binary identifier index as built by 'etl identifier-index'.",
+)
+@click.option(
+    "--xref",
+    "xref_files",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+    multiple=True,
+    help="A transformed cross-references table. Can be given multiple times and is "
+    "ignored if an index is given.",
+)
+@click.option(
+    "--chunksize",
+    type=click.IntRange(min=1),
+    default=1_000_000,
+    show_default=True,
+    help="The number of identifiers that are translated at a time.",
+)
+@click.option(
+    "--bloom",
+    "bloom_file",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+    help="A Bloom filter as built by 'etl bloom-filter' for rejecting unknown "
+    "identifiers before probing the index.",
+)
+@click.argument(
+    "input_file",
+    metavar="<INPUT FILE>",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+)
+@click.argument(
+    "output_file",
+    metavar="<OUTPUT FILE>",
+    type=click.Path(exists=False, file_okay=True, dir_okay=False),
+)
+def map_identifiers(
+    source,
+    target,
+    index_file,
+    xref_files,
+    chunksize,
+    bloom_file,
+    input_file,
+    output_file,
+):
+    """
+    Translate identifiers from one namespace to another via MetaNetX.
+
+    INPUT FILE is the path to a file with one identifier per line.
+
+    OUTPUT FILE is the path for a table with the columns source, mnx_id, and target.
+
+    """
+    if index_file is None and not xref_files:
+        raise click.UsageError("Either --index or --xref is required.")
+    logger.info("Translating identifiers from '%s' to '%s'.", source, target)
+    api.map_identifiers(
+        Path(input_file),
+        Path(output_file),
+        source,
+        target,
+        index_file=None if index_file is None else Path(index_file),
+        xref_files=[Path(name) for name in xref_files],
+        chunksize=chunksize,
+        bloom_file=None if bloom_file is None else Path(bloom_file),
+    )
+    logger.info("Complete.")
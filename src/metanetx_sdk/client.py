@@ -0,0 +1,136 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Provide a lightweight client for the local resolver server.
+
+This module deliberately depends on the standard library only such that short
+scripts do not pay for importing pandas.
+
+"""
+
+
+import json
+from http.client import HTTPConnection, HTTPException
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+__all__ = ("MetaNetXClient",)
+
+
+class MetaNetXClient:
+    """Query a server started with ``mnx-sdk serve`` over a persistent connection."""
+
+    def __init__(
+        self, host: str = "127.0.0.1", port: int = 8765, timeout: float = 30.0
+    ) -> None:
+        """
+        Initialize the client.
+
+        Parameters
+        ----------
+        host : str, optional
+            The address of the server (default loopback).
+        port : int, optional
+            The port of the server (default 8765).
+        timeout : float, optional
+            The time in seconds to wait for a response (default 30).
+
+        """
+        self._connection = HTTPConnection(host, port, timeout=timeout)
+
+    def close(self) -> None:
+        """Close the connection to the server."""
+        self._connection.close()
+
+    def __enter__(self) -> "MetaNetXClient":
+        """Return the client for use as a context manager."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close the connection when leaving the context."""
+        self.close()
+
+    def _request(self, method: str, path: str, payload: Optional[dict] = None):
+        """Send a request, reconnecting once if the server closed the connection."""
+        body = None if payload is None else json.dumps(payload).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        for attempt in range(2):
+            try:
+                self._connection.request(method, path, body=body, headers=headers)
+                response = self._connection.getresponse()
+                data = response.read()
+                break
+            except (ConnectionError, HTTPException):
+                self._connection.close()
+                if attempt > 0:
+                    raise
+        if response.status != 200:
+            # Error pages, for example, of a proxy need not be JSON objects.
+            try:
+                content = json.loads(data)
+            except ValueError:
+                content = None
+            error = (
+                content.get("error", response.reason)
+                if isinstance(content, dict)
+                else response.reason
+            )
+            raise RuntimeError(f"The server responded with {response.status}: {error}")
+        try:
+            return json.loads(data)
+        except ValueError:
+            raise RuntimeError("The server responded with invalid JSON.") from None
+
+    def health(self) -> dict:
+        """Return the status of the server and the size of the loaded data."""
+        return self._request("GET", "/health")
+
+    def resolve(self, prefix: str, identifiers: Iterable[str]) -> Dict[str, List[str]]:
+        """Map cross-references of one namespace to MetaNetX identifiers."""
+        return self._request(
+            "POST",
+            "/resolve",
+            {"prefix": prefix, "identifiers": list(identifiers)},
+        )["results"]
+
+    def cross_references(
+        self, mnx_ids: Iterable[str], prefix: Optional[str] = None
+    ) -> Dict[str, List[Tuple[str, str]]]:
+        """Map MetaNetX identifiers to pairs of namespace prefix and identifier."""
+        results = self._request(
+            "POST",
+            "/cross-references",
+            {"mnx_ids": list(mnx_ids), "prefix": prefix},
+        )["results"]
+        return {
+            mnx_id: [tuple(pair) for pair in pairs] for mnx_id, pairs in results.items()
+        }
+
+    def translate(
+        self, source: str, target: str, identifiers: Iterable[str]
+    ) -> Dict[str, List[str]]:
+        """Translate identifiers from one namespace to another."""
+        return self._request(
+            "POST",
+            "/translate",
+            {"source": source, "target": target, "identifiers": list(identifiers)},
+        )["results"]
+
+    def current_identifiers(self, identifiers: Iterable[str]) -> Dict[str, List[str]]:
+        """Map deprecated MetaNetX identifiers to their current identifiers."""
+        return self._request("POST", "/current", {"identifiers": list(identifiers)})[
+            "results"
+        ]
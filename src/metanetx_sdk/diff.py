@@ -0,0 +1,149 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide functions for computing row-level changesets between table versions."""
+
+
+import logging
+from typing import List, NamedTuple
+
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+
+class Changeset(NamedTuple):
+    """Describe the row-level differences between two versions of a table."""
+
+    added: pd.DataFrame
+    removed: pd.DataFrame
+    changed: pd.DataFrame
+
+
+def _hash_rows(table: pd.DataFrame, keys: List[str]) -> pd.DataFrame:
+    """Return the key columns, a hash of all other columns, and the row position."""
+    values = [column for column in table.columns if column not in keys]
+    result = table[keys].copy()
+    if values:
+        result["row_hash"] = pd.util.hash_pandas_object(
+            table[values], index=False
+        ).values
+    else:
+        result["row_hash"] = 0
+    result["position"] = range(len(table))
+    return result
+
+
+def _verify_keys(table: pd.DataFrame, keys: List[str], name: str) -> None:
+    """Raise an error if the key columns do not uniquely identify each row."""
+    if (num_duplicated := table.duplicated(keys).sum()) > 0:
+        raise ValueError(
+            f"The key columns {', '.join(keys)} do not uniquely identify the rows of "
+            f"the {name} table ({num_duplicated} duplicates)."
+        )
+
+
+def diff_tables(
+    previous: pd.DataFrame, current: pd.DataFrame, keys: List[str]
+) -> Changeset:
+    """
+    Compute the rows that were added, removed, or changed between two tables.
+
+    Rows are matched on their key columns with a hash join and the remaining
+    columns are compared by their row hashes, such that the whole comparison runs in
+    roughly linear time.
+
+    Parameters
+    ----------
+    previous : pandas.DataFrame
+        The previous version of a table.
+    current : pandas.DataFrame
+        The current version of the same table.
+    keys : list of str
+        The columns which together uniquely identify each row.
+
+    Returns
+    -------
+    Changeset
+        The added and changed rows as they appear in the current table and only
+        the key columns of removed rows.
+
+    Raises
+    ------
+    ValueError
+        If the tables' columns differ or the keys are not unique.
+
+    """
+    if list(previous.columns) != list(current.columns):
+        raise ValueError("The columns of the previous and current table differ.")
+    _verify_keys(previous, keys, "previous")
+    _verify_keys(current, keys, "current")
+    merged = _hash_rows(previous, keys).merge(
+        _hash_rows(current, keys),
+        how="outer",
+        on=keys,
+        suffixes=("_previous", "_current"),
+        indicator=True,
+        sort=False,
+    )
+    added = merged["_merge"] == "right_only"
+    removed = merged["_merge"] == "left_only"
+    changed = (merged["_merge"] == "both") & (
+        merged["row_hash_previous"] != merged["row_hash_current"]
+    )
+    logger.info(
+        "%d rows were added, %d removed, and %d changed.",
+        added.sum(),
+        removed.sum(),
+        changed.sum(),
+    )
+    return Changeset(
+        added=current.iloc[merged.loc[added, "position_current"].astype(int)],
+        removed=merged.loc[removed, keys].reset_index(drop=True),
+        changed=current.iloc[merged.loc[changed, "position_current"].astype(int)],
+    )
+
+
+def apply_changeset(
+    table: pd.DataFrame, changeset: Changeset, keys: List[str]
+) -> pd.DataFrame:
+    """
+    Apply a changeset to a previous version of a table.
+
+    Parameters
+    ----------
+    table : pandas.DataFrame
+        The previous version of a table that the changeset was computed against.
+    changeset : Changeset
+        The differences to the current version of the table.
+    keys : list of str
+        The columns which together uniquely identify each row.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The current version of the table. Updated and new rows are appended at the
+        end.
+
+    """
+    outdated = pd.concat(
+        [changeset.removed[keys], changeset.changed[keys]], ignore_index=True
+    )
+    index = pd.MultiIndex.from_frame(table[keys])
+    mask = index.isin(pd.MultiIndex.from_frame(outdated))
+    return pd.concat(
+        [table.loc[~mask], changeset.changed, changeset.added], ignore_index=True
+    )
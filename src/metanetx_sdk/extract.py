@@ -18,7 +18,7 @@
 
 from importlib.resources import open_text
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 import pandas as pd
 
@@ -46,7 +46,59 @@ def extract_reaction_prefix_mapping():
     return mapping
 
 
-def extract_table(filename: Path, columns: List[str], skip: int) -> pd.DataFrame:
+# Columns with fewer distinct values than this fraction of rows become categorical.
+MAX_CATEGORY_RATIO = 0.01
+
+
+def convert_string_columns(
+    table: pd.DataFrame, storage: str, categorical: bool = False
+) -> pd.DataFrame:
+    """
+    Store the text columns of a table as compact string columns.
+
+    Parameters
+    ----------
+    table : pandas.DataFrame
+        A table with text columns of Python string objects.
+    storage : str
+        The storage of the pandas string type, either ``pyarrow``, which requires
+        the optional PyArrow package, or ``python``. Only PyArrow stores text more
+        compactly, ``python`` keeps the same string objects in a dedicated type.
+    categorical : bool, optional
+        Whether to store columns with few distinct values, such as resource
+        prefixes, as dictionary-encoded categorical columns (default False).
+        Categorical columns no longer accept new values and should only be created
+        after transformation.
+
+    Returns
+    -------
+    pandas.DataFrame
+        A copy of the table with converted columns.
+
+    """
+    dtype = pd.StringDtype(storage)
+    # A shallow copy suffices since columns are replaced rather than modified.
+    table = table.copy(deep=False)
+    for column in table.columns:
+        if not (
+            pd.api.types.is_object_dtype(table[column])
+            or pd.api.types.is_string_dtype(table[column])
+        ) or pd.api.types.is_categorical_dtype(table[column]):
+            continue
+        if categorical and table[column].nunique() <= MAX_CATEGORY_RATIO * len(table):
+            table[column] = table[column].astype(dtype).astype("category")
+        elif table[column].dtype != dtype:
+            table[column] = table[column].astype(dtype)
+    return table
+
+
+def extract_table(
+    filename: Path,
+    columns: List[str],
+    skip: int,
+    string_storage: Optional[str] = None,
+    chunksize: int = 1_000_000,
+) -> pd.DataFrame:
     """
     Extract tabular MetaNetX data.
 
@@ -61,10 +113,41 @@ def extract_table(filename: Path, columns: List[str], skip: int) -> pd.DataFrame
         The column headers to use for this table.
     skip : int
         The number of initial lines in the file to skip.
+    string_storage : str, optional
+        If given, text columns are converted to the pandas string type with this
+        storage, for example, ``pyarrow``, see `convert_string_columns`. With
+        ``pyarrow``, the file is parsed in chunks that are converted one by one
+        such that Python string objects of the whole table never exist at the same
+        time.
+    chunksize : int, optional
+        The number of rows per chunk when converting strings to PyArrow storage
+        (default 1 million).
 
     Returns
     -------
     pandas.DataFrame
 
     """
-    return pd.read_csv(filename, sep="\t", header=None, names=columns, skiprows=skip)
+    if string_storage != "pyarrow":
+        table = pd.read_csv(
+            filename, sep="\t", header=None, names=columns, skiprows=skip
+        )
+        # Python string storage holds the same objects, so parsing in chunks would
+        # not lower peak memory.
+        if string_storage is None:
+            return table
+        return convert_string_columns(table, string_storage)
+    chunks = pd.read_csv(
+        filename,
+        sep="\t",
+        header=None,
+        names=columns,
+        skiprows=skip,
+        chunksize=chunksize,
+    )
+    table = pd.concat(
+        [convert_string_columns(chunk, string_storage) for chunk in chunks],
+        ignore_index=True,
+    )
+    # Chunks without any text in a column may have inferred another type.
+    return convert_string_columns(table, string_storage)
@@ -41,6 +41,7 @@ async def update_file(
     local_timezone: timezone,
     compress: bool = True,
     timeout: Union[float, int, None] = 5,
+    keep_previous: bool = False,
 ) -> None:
     """
     Retrieve a file from an FTP server if it is newer than a local version.
@@ -62,6 +63,10 @@ async def update_file(
     timeout : float, int, or None, optional
         The timeout in seconds for FTP operations (default 5 s). Can be disabled by
         setting `None`.
+    keep_previous : bool, optional
+        Whether or not to move an outdated local file into a subdirectory
+        ``previous`` of the working directory rather than overwriting it
+        (default False).
 
     """
     async with aioftp.Client.context(
@@ -87,23 +92,39 @@ async def update_file(
             return
 
         logger.info("Retrieving updated file version.")
+        # Download next to the target so that the local file is only replaced by a
+        # complete transfer.
+        partial = local_filename.with_name(f"{local_filename.name}.part")
         try:
-            if compress:
-                handle = gzip.open(local_filename, mode="wb")
-            else:
-                handle = local_filename.open("wb")
-            transferred = 0
-            # TODO (Moritz): May want to increase the socket timeout here.
-            async with client.download_stream(filename) as stream:
-                async for block in stream.iter_by_block():
-                    handle.write(block)
-                    transferred += len(block)
-            assert transferred == info.size, "Not all bytes were transferred."
+            with (
+                gzip.open(partial, mode="wb") if compress else partial.open("wb")
+            ) as handle:
+                transferred = 0
+                # TODO (Moritz): May want to increase the socket timeout here.
+                async with client.download_stream(filename) as stream:
+                    async for block in stream.iter_by_block():
+                        handle.write(block)
+                        transferred += len(block)
         except IOError as error:
             logger.error("Failed to download '%s'.", filename)
             logger.debug("", exc_info=error)
-        finally:
-            handle.close()
+            partial.unlink(missing_ok=True)
+            return
+        if transferred != info.size:
+            logger.error(
+                "Failed to download '%s'. Only %d of %d bytes were transferred.",
+                filename,
+                transferred,
+                info.size,
+            )
+            partial.unlink(missing_ok=True)
+            return
+        if keep_previous and local_filename.is_file():
+            previous = local_filename.parent / "previous"
+            previous.mkdir(exist_ok=True)
+            logger.info("Keeping previous file version in '%s'.", previous)
+            local_filename.replace(previous / local_filename.name)
+        partial.replace(local_filename)
 
 
 async def update_tables(
@@ -114,6 +135,7 @@ async def update_tables(
     last_checked: datetime,
     local_tz: timezone,
     compress: bool,
+    keep_previous: bool = False,
 ) -> None:
     """
     Load all given files if newer versions exist.
@@ -136,6 +158,8 @@ async def update_tables(
         A timezone that the FTP server is in, for example, Europe/Zurich.
     compress : bool
         Whether or not to gzip compress downloaded files.
+    keep_previous : bool, optional
+        Whether or not to keep outdated local files (default False).
 
     """
     tasks = [
@@ -147,6 +171,7 @@ async def update_tables(
             last_checked,
             local_tz,
             compress=compress,
+            keep_previous=keep_previous,
         )
         for filename in files
     ]
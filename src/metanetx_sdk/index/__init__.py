@@ -0,0 +1,31 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide indices for looking up MetaNetX identifiers."""
+
+
+from .bloom_filter import BloomFilter
+from .identifier_encoding import IdentifierEncoding
+from .identifier_index import IdentifierIndex
+from .lookup_table import (
+    CHEMICAL_COLUMNS,
+    REACTION_COLUMNS,
+    LookupTable,
+    build_lookup_table,
+    write_lookup_table,
+)
+from .mapped_identifier_index import MappedIdentifierIndex, write_identifier_index
+from .name_index import NameIndex
+from .structure_index import StructureIndex
@@ -0,0 +1,223 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide Bloom filters for rejecting unknown identifiers per namespace."""
+
+
+from __future__ import annotations
+
+import logging
+import math
+import zlib
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from .identifier_index import COLUMNS
+
+
+logger = logging.getLogger(__name__)
+
+
+# The starting value of the second checksum, which makes it independent of the first.
+SECOND_SEED = 0x9747B28C
+
+
+def _positions(identifiers: Iterable[str], size: int, hashes: int) -> np.ndarray:
+    """Return the probed bit positions of each identifier by double hashing."""
+    encoded = [i.encode("utf-8") for i in identifiers]
+    first = np.fromiter((zlib.crc32(b) for b in encoded), np.uint64, len(encoded))
+    second = np.fromiter(
+        (zlib.crc32(b, SECOND_SEED) | 1 for b in encoded), np.uint64, len(encoded)
+    )
+    steps = np.arange(hashes, dtype=np.uint64)
+    return (
+        (first[:, np.newaxis] + steps * second[:, np.newaxis]) % np.uint64(size)
+    ).astype(np.int64)
+
+
+class BloomFilter:
+    """
+    Test membership of identifiers with false positives but no false negatives.
+
+    The bit array of each namespace is sized for the requested false-positive rate
+    and probed at positions derived from two CRC-32 checksums of an identifier.
+    All namespaces are stored as slices of one packed bit array.
+
+    """
+
+    def __init__(
+        self,
+        prefixes: pd.Index,
+        offsets: np.ndarray,
+        sizes: np.ndarray,
+        num_hashes: np.ndarray,
+        bits: np.ndarray,
+    ) -> None:
+        """
+        Initialize the filter from its parts.
+
+        Parameters
+        ----------
+        prefixes : pandas.Index
+            The namespace prefixes.
+        offsets : numpy.ndarray
+            The byte offset of each namespace's bits.
+        sizes : numpy.ndarray
+            The number of bits of each namespace.
+        num_hashes : numpy.ndarray
+            The number of probed bits of each namespace.
+        bits : numpy.ndarray
+            The packed bits of all namespaces in little-endian bit order.
+
+        """
+        self.prefixes = prefixes
+        self._offsets = offsets
+        self._sizes = sizes
+        self._num_hashes = num_hashes
+        self._bits = bits
+        # Plain Python objects avoid NumPy scalar overhead for single queries.
+        self._namespaces = {
+            prefix: (int(offsets[i]), int(sizes[i]), int(num_hashes[i]))
+            for i, prefix in enumerate(prefixes)
+        }
+        self._bytes = bits.tobytes()
+
+    @classmethod
+    def from_tables(
+        cls, tables: Iterable[pd.DataFrame], false_positive_rate: float = 0.01
+    ) -> BloomFilter:
+        """
+        Build a filter from transformed cross-reference tables.
+
+        Parameters
+        ----------
+        tables : iterable of pandas.DataFrame
+            Tables with the columns ``prefix`` and ``identifier``.
+        false_positive_rate : float, optional
+            The probability that an unknown identifier passes the filter (default
+            0.01).
+
+        """
+        if not 0.0 < false_positive_rate < 1.0:
+            raise ValueError("The false-positive rate must lie between 0 and 1.")
+        table = (
+            pd.concat([t[COLUMNS[1:]] for t in tables], ignore_index=True)
+            .dropna()
+            .drop_duplicates()
+        )
+        prefixes = []
+        sizes = []
+        num_hashes = []
+        chunks = []
+        for prefix, identifiers in table.groupby("prefix", sort=True)["identifier"]:
+            count = len(identifiers)
+            # The optimal number of bits and probes for the false-positive rate.
+            num_bytes = math.ceil(
+                -count * math.log(false_positive_rate) / math.log(2) ** 2 / 8
+            )
+            size = 8 * max(num_bytes, 1)
+            hashes = max(round(size / count * math.log(2)), 1)
+            positions = _positions(identifiers.values, size, hashes)
+            bits = np.zeros(size, dtype=bool)
+            bits[positions.ravel()] = True
+            chunks.append(np.packbits(bits, bitorder="little"))
+            prefixes.append(prefix)
+            sizes.append(size)
+            num_hashes.append(hashes)
+        offsets = np.zeros(len(chunks) + 1, dtype=np.int64)
+        np.cumsum([len(c) for c in chunks], out=offsets[1:])
+        logger.debug(
+            "Built Bloom filters of %d namespaces with %d bytes.",
+            len(prefixes),
+            offsets[-1],
+        )
+        return cls(
+            pd.Index(prefixes, dtype=object),
+            offsets[:-1],
+            np.asarray(sizes, dtype=np.int64),
+            np.asarray(num_hashes, dtype=np.int64),
+            np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.uint8),
+        )
+
+    @classmethod
+    def from_files(
+        cls, filenames: Iterable[Path], false_positive_rate: float = 0.01
+    ) -> BloomFilter:
+        """Build a filter from transformed cross-reference files."""
+        return cls.from_tables(
+            (
+                pd.read_csv(name, sep="\t", usecols=COLUMNS[1:], dtype=str)
+                for name in filenames
+            ),
+            false_positive_rate=false_positive_rate,
+        )
+
+    def save(self, filename: Path) -> None:
+        """Store the filter in a compressed NumPy file."""
+        with Path(filename).open("wb") as handle:
+            np.savez_compressed(
+                handle,
+                prefixes=self.prefixes.values.astype(str),
+                offsets=self._offsets,
+                sizes=self._sizes,
+                num_hashes=self._num_hashes,
+                bits=self._bits,
+            )
+
+    @classmethod
+    def load(cls, filename: Path) -> BloomFilter:
+        """Load a filter stored with `save`."""
+        with np.load(filename) as data:
+            return cls(
+                pd.Index(data["prefixes"].astype(object)),
+                data["offsets"],
+                data["sizes"],
+                data["num_hashes"],
+                data["bits"],
+            )
+
+    @property
+    def nbytes(self) -> int:
+        """Return the size of the bit arrays of all namespaces in bytes."""
+        return self._bits.nbytes
+
+    def might_contain(self, prefix: str, identifier: str) -> bool:
+        """Return whether an identifier possibly exists, false if it surely not."""
+        if (namespace := self._namespaces.get(prefix)) is None:
+            return False
+        offset, size, hashes = namespace
+        encoded = identifier.encode("utf-8")
+        position = zlib.crc32(encoded)
+        step = zlib.crc32(encoded, SECOND_SEED) | 1
+        bits = self._bytes
+        for _ in range(hashes):
+            bit = position % size
+            if not bits[offset + (bit >> 3)] >> (bit & 7) & 1:
+                return False
+            position += step
+        return True
+
+    def might_contain_many(self, prefix: str, identifiers: Iterable[str]) -> np.ndarray:
+        """Return whether each identifier of one namespace possibly exists."""
+        identifiers = list(identifiers)
+        if (namespace := self._namespaces.get(prefix)) is None:
+            return np.zeros(len(identifiers), dtype=bool)
+        offset, size, hashes = namespace
+        positions = _positions(identifiers, size, hashes)
+        found = (self._bits[offset + (positions >> 3)] >> (positions & 7)) & 1
+        return found.all(axis=1)
@@ -0,0 +1,151 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide a shared integer encoding of MetaNetX identifiers."""
+
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+
+# The columns of processed tables that contain MetaNetX identifiers.
+ENCODED_COLUMNS = ("mnx_id", "deprecated_id", "current_id")
+
+
+class IdentifierEncoding:
+    """
+    Map MetaNetX identifiers to compact integer codes shared by all tables.
+
+    The codes are the positions of the identifiers in sorted order such that an
+    encoding built from the same release is always identical. Encoded tables can
+    be joined on their integer columns and decoded with a single array lookup.
+
+    """
+
+    def __init__(self, identifiers: np.ndarray) -> None:
+        """
+        Initialize the encoding from sorted, distinct identifiers.
+
+        Parameters
+        ----------
+        identifiers : numpy.ndarray
+            The identifiers whose positions are their codes.
+
+        """
+        self.identifiers = pd.Index(identifiers, dtype=object)
+        # Missing codes index the appended sentinel on decoding.
+        self._lookup = np.append(self.identifiers.values, None)
+
+    @classmethod
+    def from_tables(cls, tables: Iterable[pd.DataFrame]) -> IdentifierEncoding:
+        """Build an encoding from all identifier columns of the given tables."""
+        identifiers = pd.concat(
+            [
+                table[column]
+                for table in tables
+                for column in ENCODED_COLUMNS
+                if column in table.columns
+            ],
+            ignore_index=True,
+        )
+        return cls(np.sort(identifiers.dropna().unique()))
+
+    def save(self, filename: Path) -> None:
+        """Store the encoding in a compressed NumPy file."""
+        with Path(filename).open("wb") as handle:
+            np.savez_compressed(handle, identifiers=self.identifiers.values.astype(str))
+
+    @classmethod
+    def load(cls, filename: Path) -> IdentifierEncoding:
+        """Load an encoding stored with `save`."""
+        with np.load(filename) as data:
+            return cls(data["identifiers"].astype(object))
+
+    def __len__(self) -> int:
+        """Return the number of encoded identifiers."""
+        return len(self.identifiers)
+
+    def encode(self, identifiers: Iterable[str]) -> np.ndarray:
+        """Return the codes of identifiers with -1 for unknown or missing ones."""
+        if not isinstance(identifiers, (pd.Series, pd.Index)):
+            identifiers = pd.Index(list(identifiers), dtype=object)
+        return self.identifiers.get_indexer(identifiers).astype(np.int32)
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        """Return the identifiers of codes with None for the missing code -1."""
+        return self._lookup[np.asarray(codes)]
+
+    def encode_table(
+        self, table: pd.DataFrame, allow_unknown: bool = False
+    ) -> pd.DataFrame:
+        """
+        Replace the identifier columns of a table with their integer codes.
+
+        Columns that are already integer codes are left unchanged.
+
+        Parameters
+        ----------
+        table : pandas.DataFrame
+            A table with one or more identifier columns.
+        allow_unknown : bool, optional
+            Whether identifiers without a code are encoded as -1 and thus lost
+            rather than raising an error (default False).
+
+        Raises
+        ------
+        ValueError
+            If a column contains identifiers without a code and unknown identifiers
+            are not allowed.
+
+        """
+        result = table.copy()
+        for column in ENCODED_COLUMNS:
+            if column not in result.columns or pd.api.types.is_integer_dtype(
+                result[column]
+            ):
+                continue
+            codes = self.encode(result[column])
+            if (num_unknown := (codes[result[column].notnull().values] < 0).sum()) > 0:
+                message = (
+                    f"There are {num_unknown} identifiers in column '{column}' "
+                    f"without a code."
+                )
+                if not allow_unknown:
+                    raise ValueError(
+                        f"{message} Please build the encoding from all tables of "
+                        f"the release."
+                    )
+                logger.warning(message)
+            result[column] = codes
+        return result
+
+    def decode_table(self, table: pd.DataFrame) -> pd.DataFrame:
+        """Replace the integer identifier columns of a table with identifiers."""
+        result = table.copy()
+        for column in ENCODED_COLUMNS:
+            if column in result.columns and pd.api.types.is_integer_dtype(
+                result[column]
+            ):
+                result[column] = self.decode(result[column].values)
+        return result
@@ -0,0 +1,266 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide an in-memory index of cross-references to MetaNetX identifiers."""
+
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+if TYPE_CHECKING:
+    from .bloom_filter import BloomFilter
+
+
+logger = logging.getLogger(__name__)
+
+
+COLUMNS = ["mnx_id", "prefix", "identifier"]
+
+
+def expand_ranges(starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+    """Return the concatenation of all the integer ranges ``[start, stop)``."""
+    lengths = stops - starts
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return offsets + np.arange(lengths.sum())
+
+
+class IdentifierIndex:
+    """
+    Map pairs of namespace prefix and identifier to MetaNetX identifiers and back.
+
+    The index is built from transformed cross-reference tables. Each distinct
+    prefix, identifier, and MetaNetX identifier string is stored once and referred to
+    by integer codes. Every namespace has its own hash index over its identifiers
+    that points into a compressed array of MetaNetX identifier codes. The reverse
+    direction is a second set of offsets into the rows sorted by MetaNetX
+    identifier.
+
+    """
+
+    def __init__(
+        self,
+        prefixes: pd.Series,
+        identifiers: pd.Series,
+        mnx_ids: pd.Series,
+    ) -> None:
+        """
+        Build the index from aligned columns of cross-references.
+
+        Parameters
+        ----------
+        prefixes : pandas.Series
+            The Identifiers.org namespace prefix of each cross-reference.
+        identifiers : pandas.Series
+            The identifier of each cross-reference within its namespace.
+        mnx_ids : pandas.Series
+            The MetaNetX identifier that each cross-reference maps to.
+
+        """
+        table = pd.DataFrame(
+            {
+                "prefix": prefixes.values,
+                "identifier": identifiers.values,
+                "mnx_id": mnx_ids.values,
+            }
+        ).dropna()
+        # Only the few distinct prefixes and MetaNetX identifiers are sorted. All
+        # further sorting happens on integer codes.
+        prefix_codes, self._prefixes = pd.factorize(table["prefix"], sort=True)
+        identifier_codes, identifiers = pd.factorize(table["identifier"])
+        mnx_codes, self._mnx_ids = pd.factorize(table["mnx_id"], sort=True)
+        order = np.lexsort((mnx_codes, identifier_codes, prefix_codes))
+        prefix_codes = prefix_codes[order]
+        identifier_codes = identifier_codes[order]
+        mnx_codes = mnx_codes[order]
+        is_new_key = np.ones(len(order), dtype=bool)
+        is_new_key[1:] = (prefix_codes[1:] != prefix_codes[:-1]) | (
+            identifier_codes[1:] != identifier_codes[:-1]
+        )
+        is_unique = is_new_key.copy()
+        is_unique[1:] |= mnx_codes[1:] != mnx_codes[:-1]
+        self._identifiers = np.asarray(identifiers, dtype=object)
+        self._row_prefixes = prefix_codes[is_unique].astype(np.int16)
+        self._row_identifiers = identifier_codes[is_unique].astype(np.int32)
+        self._row_mnx_ids = mnx_codes[is_unique].astype(np.int32)
+        key_offsets = np.append(
+            np.flatnonzero(is_new_key[is_unique]), len(self._row_mnx_ids)
+        )
+        key_prefixes = self._row_prefixes[key_offsets[:-1]]
+        prefix_offsets = np.searchsorted(
+            key_prefixes, np.arange(len(self._prefixes) + 1)
+        )
+        self._lookup: Dict[str, Tuple[pd.Index, np.ndarray]] = {}
+        for code, prefix in enumerate(self._prefixes):
+            start, stop = prefix_offsets[code], prefix_offsets[code + 1]
+            offsets = key_offsets[start : stop + 1]
+            self._lookup[prefix] = (
+                pd.Index(self._identifiers[self._row_identifiers[offsets[:-1]]]),
+                offsets,
+            )
+        self._reverse_rows = np.argsort(self._row_mnx_ids, kind="stable")
+        self._reverse_offsets = np.zeros(len(self._mnx_ids) + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(self._row_mnx_ids, minlength=len(self._mnx_ids)),
+            out=self._reverse_offsets[1:],
+        )
+        logger.debug(
+            "Indexed %d cross-references in %d namespaces.",
+            len(self),
+            len(self._lookup),
+        )
+
+    @classmethod
+    def from_tables(cls, tables: Iterable[pd.DataFrame]) -> IdentifierIndex:
+        """Build an index from transformed cross-reference tables."""
+        table = pd.concat([t[COLUMNS] for t in tables], ignore_index=True)
+        return cls(table["prefix"], table["identifier"], table["mnx_id"])
+
+    @classmethod
+    def from_files(cls, filenames: Iterable[Path]) -> IdentifierIndex:
+        """Build an index from transformed cross-reference table files."""
+        return cls.from_tables(
+            pd.read_csv(name, sep="\t", usecols=COLUMNS, dtype=str)
+            for name in filenames
+        )
+
+    def __len__(self) -> int:
+        """Return the number of indexed cross-references."""
+        return len(self._row_mnx_ids)
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        """Test whether a pair of prefix and identifier is indexed."""
+        return len(self.resolve(*key)) > 0
+
+    @property
+    def prefixes(self) -> List[str]:
+        """Return the indexed namespace prefixes."""
+        return self._prefixes.tolist()
+
+    def resolve(self, prefix: str, identifier: str) -> List[str]:
+        """
+        Return the MetaNetX identifiers of a single cross-reference.
+
+        Parameters
+        ----------
+        prefix : str
+            The Identifiers.org namespace prefix, for example, kegg.compound.
+        identifier : str
+            The identifier within the namespace, for example, C00002.
+
+        Returns
+        -------
+        list of str
+            All MetaNetX identifiers that the cross-reference maps to. Empty if the
+            cross-reference is not known.
+
+        """
+        try:
+            index, offsets = self._lookup[prefix]
+            position = index.get_loc(identifier)
+        except KeyError:
+            return []
+        codes = self._row_mnx_ids[offsets[position] : offsets[position + 1]]
+        return self._mnx_ids.values[codes].tolist()
+
+    def resolve_many(
+        self,
+        prefix: str,
+        identifiers: Iterable[str],
+        bloom_filter: Optional[BloomFilter] = None,
+    ) -> pd.DataFrame:
+        """
+        Return the MetaNetX identifiers of many cross-references in one namespace.
+
+        Parameters
+        ----------
+        prefix : str
+            The Identifiers.org namespace prefix, for example, kegg.compound.
+        identifiers : iterable of str
+            The identifiers within the namespace.
+        bloom_filter : BloomFilter, optional
+            Filters of the indexed cross-references that reject most unknown
+            identifiers before they probe the index.
+
+        Returns
+        -------
+        pandas.DataFrame
+            A table with the columns ``identifier`` and ``mnx_id`` that contains one
+            row per mapping in the order of the given identifiers. Unknown
+            identifiers are omitted.
+
+        """
+        identifiers = np.asarray(list(identifiers), dtype=object)
+        if bloom_filter is not None:
+            identifiers = identifiers[
+                bloom_filter.might_contain_many(prefix, identifiers)
+            ]
+        if prefix not in self._lookup:
+            return pd.DataFrame({"identifier": [], "mnx_id": []}, dtype=object)
+        index, offsets = self._lookup[prefix]
+        positions = index.get_indexer(pd.Index(identifiers, dtype=object))
+        found = np.flatnonzero(positions >= 0)
+        starts = offsets[positions[found]]
+        stops = offsets[positions[found] + 1]
+        rows = expand_ranges(starts, stops)
+        return pd.DataFrame(
+            {
+                "identifier": np.repeat(identifiers[found], stops - starts),
+                "mnx_id": self._mnx_ids.values[self._row_mnx_ids[rows]],
+            }
+        )
+
+    def cross_references(
+        self, mnx_ids: Iterable[str], prefix: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Return the cross-references of one or more MetaNetX identifiers.
+
+        Parameters
+        ----------
+        mnx_ids : iterable of str
+            The MetaNetX identifiers to look up.
+        prefix : str, optional
+            Restrict the cross-references to a single namespace.
+
+        Returns
+        -------
+        pandas.DataFrame
+            A table with the columns ``mnx_id``, ``prefix``, and ``identifier``.
+            Unknown MetaNetX identifiers are omitted.
+
+        """
+        mnx_ids = pd.Index(list(mnx_ids), dtype=object)
+        codes = self._mnx_ids.get_indexer(mnx_ids)
+        found = np.flatnonzero(codes >= 0)
+        starts = self._reverse_offsets[codes[found]]
+        stops = self._reverse_offsets[codes[found] + 1]
+        rows = self._reverse_rows[expand_ranges(starts, stops)]
+        result = pd.DataFrame(
+            {
+                "mnx_id": np.repeat(mnx_ids.values[found], stops - starts),
+                "prefix": self._prefixes.values[self._row_prefixes[rows]],
+                "identifier": self._identifiers[self._row_identifiers[rows]],
+            }
+        )
+        if prefix is not None:
+            result = result.loc[result["prefix"] == prefix].reset_index(drop=True)
+        return result
@@ -0,0 +1,151 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide denormalized lookup tables of cross-references and properties."""
+
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Iterable, List
+
+import numpy as np
+import pandas as pd
+
+from .identifier_index import expand_ranges
+
+
+logger = logging.getLogger(__name__)
+
+
+KEY_COLUMNS = ["prefix", "identifier"]
+CHEMICAL_COLUMNS = ["name", "formula", "charge", "mass", "inchi_key"]
+REACTION_COLUMNS = ["equation", "ec_number", "is_balanced", "is_transport"]
+
+
+def build_lookup_table(
+    cross_references: pd.DataFrame,
+    properties: pd.DataFrame,
+    columns: List[str],
+) -> pd.DataFrame:
+    """
+    Join cross-references with the properties of their MetaNetX entries.
+
+    Parameters
+    ----------
+    cross_references : pandas.DataFrame
+        Transformed cross-references with the columns ``mnx_id``, ``prefix``,
+        ``identifier``, and ``description``.
+    properties : pandas.DataFrame
+        Transformed properties with the column ``mnx_id`` and the given columns.
+    columns : list of str
+        The property columns to include, for example, `CHEMICAL_COLUMNS`.
+
+    Returns
+    -------
+    pandas.DataFrame
+        A table with the columns ``prefix``, ``identifier``, ``mnx_id``,
+        ``description``, and the property columns sorted by prefix and identifier.
+        An identifier that refers to several MetaNetX entries has one row each.
+
+    """
+    table = (
+        cross_references[KEY_COLUMNS + ["mnx_id", "description"]]
+        .dropna(subset=KEY_COLUMNS)
+        .merge(
+            properties[["mnx_id"] + columns].drop_duplicates("mnx_id"),
+            on="mnx_id",
+            how="left",
+            sort=False,
+        )
+    )
+    return table.sort_values(KEY_COLUMNS, kind="stable", ignore_index=True)
+
+
+def write_lookup_table(table: pd.DataFrame, filename: Path) -> None:
+    """Write a lookup table as Parquet or, otherwise, as tab-separated values."""
+    if Path(filename).suffix == ".parquet":
+        table.to_parquet(filename, index=False)
+    else:
+        table.to_csv(filename, sep="\t", index=False)
+
+
+class LookupTable:
+    """
+    Find the MetaNetX entries and their properties of external identifiers.
+
+    The rows are sorted by prefix and identifier such that a batch of identifiers
+    is found by binary search within the rows of their prefix.
+
+    """
+
+    def __init__(self, table: pd.DataFrame) -> None:
+        """
+        Initialize the lookup from a table built by `build_lookup_table`.
+
+        Parameters
+        ----------
+        table : pandas.DataFrame
+            A lookup table sorted by prefix and identifier.
+
+        """
+        self.table = table
+        self._prefixes = table["prefix"].values.astype(object)
+        self._identifiers = table["identifier"].values.astype(object)
+
+    @classmethod
+    def from_file(cls, filename: Path) -> LookupTable:
+        """Load a lookup table written by `write_lookup_table`."""
+        if Path(filename).suffix == ".parquet":
+            return cls(pd.read_parquet(filename))
+        return cls(
+            pd.read_csv(
+                filename,
+                sep="\t",
+                dtype={"prefix": str, "identifier": str, "mnx_id": str},
+            )
+        )
+
+    def find(self, prefix: str, identifiers: Iterable[str]) -> pd.DataFrame:
+        """
+        Find the rows of identifiers from one namespace.
+
+        Parameters
+        ----------
+        prefix : str
+            The Identifiers.org prefix, for example, ``kegg.compound``.
+        identifiers : iterable of str
+            The identifiers within the namespace.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The matching rows in the order of the given identifiers. Unknown
+            identifiers are omitted.
+
+        """
+        start = np.searchsorted(self._prefixes, prefix, side="left")
+        stop = np.searchsorted(self._prefixes, prefix, side="right")
+        queries = np.asarray(list(identifiers), dtype=object)
+        block = self._identifiers[start:stop]
+        # Searching sorted queries visits the block in order for better locality.
+        order = np.argsort(queries, kind="stable")
+        starts = np.empty(len(queries), dtype=np.int64)
+        stops = np.empty(len(queries), dtype=np.int64)
+        starts[order] = np.searchsorted(block, queries[order], side="left")
+        stops[order] = np.searchsorted(block, queries[order], side="right")
+        rows = expand_ranges(start + starts, start + stops)
+        return self.table.iloc[rows].reset_index(drop=True)
@@ -0,0 +1,424 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide a persistent identifier index that is memory-mapped read-only."""
+
+
+from __future__ import annotations
+
+import logging
+import mmap
+import struct
+import zlib
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .bloom_filter import BloomFilter
+from .identifier_index import COLUMNS, expand_ranges
+
+
+logger = logging.getLogger(__name__)
+
+
+MAGIC = b"MNXIDX01"
+# The separator between prefix and identifier sorts before any character that
+# occurs in prefixes such that all keys of one namespace are contiguous.
+SEPARATOR = "\t"
+SECTIONS = (
+    "key_offsets",
+    "keys",
+    "row_offsets",
+    "rows",
+    "mnx_offsets",
+    "mnx_ids",
+    "reverse_offsets",
+    "reverse_rows",
+    "slots",
+)
+HEADER = struct.Struct(f"<8s{2 * len(SECTIONS)}Q")
+
+
+def _encode_strings(strings: np.ndarray) -> Tuple[np.ndarray, bytes]:
+    """Return the byte offsets and the concatenated UTF-8 encoding of strings."""
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.uint64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return offsets, b"".join(encoded)
+
+
+def _build_hash_table(keys: List[bytes]) -> np.ndarray:
+    """
+    Return an open addressing hash table of key positions with linear probing.
+
+    Slots contain the position of a key plus one such that zero marks an empty
+    slot. The table has at least twice as many slots as there are keys.
+
+    """
+    size = 1 << max(int(2 * len(keys)).bit_length(), 3)
+    mask = size - 1
+    slots = np.zeros(size, dtype=np.uint32)
+    candidates = np.array([zlib.crc32(k) & mask for k in keys], dtype=np.int64)
+    pending = np.arange(len(keys), dtype=np.int64)
+    while len(pending) > 0:
+        # Every free slot is claimed by the first pending key that probes it.
+        free = slots[candidates] == 0
+        _, first = np.unique(candidates[free], return_index=True)
+        placed = np.flatnonzero(free)[first]
+        slots[candidates[placed]] = pending[placed] + 1
+        remaining = np.ones(len(pending), dtype=bool)
+        remaining[placed] = False
+        pending = pending[remaining]
+        candidates = (candidates[remaining] + 1) & mask
+    return slots
+
+
+def write_identifier_index(tables: Iterable[pd.DataFrame], filename: Path) -> None:
+    """
+    Write an identifier index that can be memory-mapped to a binary file.
+
+    The file consists of a header that records the position and size of each
+    section followed by the 8-byte aligned sections. Keys are the UTF-8 encoded
+    pairs of prefix and identifier in sorted order. Keys are found through a hash
+    table of CRC-32 checksums whereas MetaNetX identifiers are found by binary
+    search, both directly on the mapped bytes.
+
+    Parameters
+    ----------
+    tables : iterable of pandas.DataFrame
+        Transformed cross-reference tables with the columns ``mnx_id``,
+        ``prefix``, and ``identifier``.
+    filename : pathlib.Path
+        The output location of the binary index.
+
+    """
+    table = (
+        pd.concat([t[COLUMNS] for t in tables], ignore_index=True)
+        .dropna()
+        .drop_duplicates()
+    )
+    keys = table["prefix"] + SEPARATOR + table["identifier"]
+    key_codes, key_uniques = pd.factorize(keys, sort=True)
+    mnx_codes, mnx_uniques = pd.factorize(table["mnx_id"], sort=True)
+    order = np.lexsort((mnx_codes, key_codes))
+    key_codes = key_codes[order]
+    mnx_codes = mnx_codes[order].astype(np.int32)
+    row_offsets = np.searchsorted(key_codes, np.arange(len(key_uniques) + 1)).astype(
+        np.uint64
+    )
+    reverse_rows = np.argsort(mnx_codes, kind="stable")
+    reverse_offsets = np.zeros(len(mnx_uniques) + 1, dtype=np.uint64)
+    np.cumsum(
+        np.bincount(mnx_codes, minlength=len(mnx_uniques)), out=reverse_offsets[1:]
+    )
+    encoded_keys = [k.encode("utf-8") for k in key_uniques.values]
+    key_offsets = np.zeros(len(encoded_keys) + 1, dtype=np.uint64)
+    np.cumsum([len(k) for k in encoded_keys], out=key_offsets[1:])
+    mnx_offsets, mnx_bytes = _encode_strings(mnx_uniques.values)
+    sections = [
+        key_offsets.tobytes(),
+        b"".join(encoded_keys),
+        row_offsets.tobytes(),
+        mnx_codes.tobytes(),
+        mnx_offsets.tobytes(),
+        mnx_bytes,
+        reverse_offsets.tobytes(),
+        # The key of each row in the order of MetaNetX identifiers.
+        key_codes[reverse_rows].astype(np.uint64).tobytes(),
+        _build_hash_table(encoded_keys).tobytes(),
+    ]
+    starts = []
+    position = HEADER.size
+    for section in sections:
+        position += -position % 8
+        starts.append(position)
+        position += len(section)
+    with filename.open("wb") as handle:
+        handle.write(
+            HEADER.pack(
+                MAGIC,
+                *(
+                    value
+                    for start, section in zip(starts, sections)
+                    for value in (start, len(section))
+                ),
+            )
+        )
+        for start, section in zip(starts, sections):
+            handle.write(b"\x00" * (start - handle.tell()))
+            handle.write(section)
+    logger.info(
+        "Wrote %d cross-references of %d identifiers to '%s'.",
+        len(table),
+        len(mnx_uniques),
+        filename,
+    )
+
+
+class MappedIdentifierIndex:
+    """
+    Resolve cross-references with a binary index file mapped into memory.
+
+    Opening the index only reads its header. All lookups operate directly on the
+    mapped pages, which the operating system shares between all processes that
+    map the same file.
+
+    """
+
+    def __init__(self, filename: Path) -> None:
+        """
+        Map an index file written by `write_identifier_index` into memory.
+
+        Parameters
+        ----------
+        filename : pathlib.Path
+            The location of the binary index file.
+
+        """
+        with Path(filename).open("rb") as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, *layout = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError(f"'{filename}' is not an identifier index file.")
+        self._views = [memoryview(self._map)]
+        sections = {
+            name: self._add_view(self._views[0][start : start + size])
+            for name, start, size in zip(SECTIONS, layout[::2], layout[1::2])
+        }
+        # Slicing the memory map directly is the fastest way to obtain bytes.
+        self._keys_start = layout[2 * SECTIONS.index("keys")]
+        self._mnx_ids_start = layout[2 * SECTIONS.index("mnx_ids")]
+        # Casting the views yields native integers on item access.
+        self._key_offsets = self._add_view(sections["key_offsets"].cast("Q"))
+        self._row_offsets = self._add_view(sections["row_offsets"].cast("Q"))
+        self._rows = self._add_view(sections["rows"].cast("i"))
+        self._mnx_offsets = self._add_view(sections["mnx_offsets"].cast("Q"))
+        self._reverse_offsets = self._add_view(sections["reverse_offsets"].cast("Q"))
+        self._reverse_rows = self._add_view(sections["reverse_rows"].cast("Q"))
+        self._slots = self._add_view(sections["slots"].cast("I"))
+
+    def _add_view(self, view: memoryview) -> memoryview:
+        """Keep track of a view on the memory map such that it can be released."""
+        self._views.append(view)
+        return view
+
+    def close(self) -> None:
+        """Release the memory map."""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._map.close()
+
+    def __enter__(self) -> MappedIdentifierIndex:
+        """Return the index as a context manager."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Release the memory map on leaving the context."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of indexed cross-references."""
+        return len(self._rows)
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        """Test whether a pair of prefix and identifier is indexed."""
+        return self._find_key(self._encode_key(*key)) >= 0
+
+    @staticmethod
+    def _encode_key(prefix: str, identifier: str) -> bytes:
+        """Return the binary key of a cross-reference."""
+        return f"{prefix}{SEPARATOR}{identifier}".encode("utf-8")
+
+    def _get_key(self, position: int) -> bytes:
+        """Return the binary key at the given position."""
+        start = self._keys_start
+        return self._map[
+            start
+            + self._key_offsets[position] : start
+            + self._key_offsets[position + 1]
+        ]
+
+    def _get_mnx_id(self, code: int) -> bytes:
+        """Return the encoded MetaNetX identifier with the given code."""
+        start = self._mnx_ids_start
+        return self._map[
+            start + self._mnx_offsets[code] : start + self._mnx_offsets[code + 1]
+        ]
+
+    @staticmethod
+    def _bisect(target: bytes, size: int, get: Callable[[int], bytes]) -> int:
+        """Return the position of the first item that is not less than the target."""
+        low, high = 0, size
+        while low < high:
+            middle = (low + high) // 2
+            if get(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _find_key(self, key: bytes) -> int:
+        """Return the position of a binary key or -1 if it is missing."""
+        mask = len(self._slots) - 1
+        slot = zlib.crc32(key) & mask
+        while (value := self._slots[slot]) > 0:
+            if self._get_key(value - 1) == key:
+                return value - 1
+            slot = (slot + 1) & mask
+        return -1
+
+    def _find_mnx_id(self, mnx_id: str) -> int:
+        """Return the code of a MetaNetX identifier or -1 if it is missing."""
+        target = mnx_id.encode("utf-8")
+        size = len(self._mnx_offsets) - 1
+        code = self._bisect(target, size, self._get_mnx_id)
+        if code < size and self._get_mnx_id(code) == target:
+            return code
+        return -1
+
+    @property
+    def prefixes(self) -> List[str]:
+        """Return the indexed namespace prefixes."""
+        result = []
+        size = len(self._key_offsets) - 1
+        position = 0
+        while position < size:
+            prefix = self._get_key(position).split(SEPARATOR.encode("utf-8"), 1)[0]
+            result.append(prefix.decode("utf-8"))
+            # Skip to the first key of the next namespace.
+            upper = prefix + bytes([ord(SEPARATOR) + 1])
+            position = self._bisect(upper, size, self._get_key)
+        return result
+
+    def resolve(self, prefix: str, identifier: str) -> List[str]:
+        """
+        Return the MetaNetX identifiers of a single cross-reference.
+
+        Parameters
+        ----------
+        prefix : str
+            The Identifiers.org namespace prefix, for example, kegg.compound.
+        identifier : str
+            The identifier within the namespace, for example, C00002.
+
+        Returns
+        -------
+        list of str
+            All MetaNetX identifiers that the cross-reference maps to. Empty if the
+            cross-reference is not known.
+
+        """
+        position = self._find_key(self._encode_key(prefix, identifier))
+        if position < 0:
+            return []
+        return [
+            self._get_mnx_id(self._rows[row]).decode("utf-8")
+            for row in range(
+                self._row_offsets[position], self._row_offsets[position + 1]
+            )
+        ]
+
+    def resolve_many(
+        self,
+        prefix: str,
+        identifiers: Iterable[str],
+        bloom_filter: Optional[BloomFilter] = None,
+    ) -> pd.DataFrame:
+        """
+        Return the MetaNetX identifiers of many cross-references in one namespace.
+
+        Parameters
+        ----------
+        prefix : str
+            The Identifiers.org namespace prefix, for example, kegg.compound.
+        identifiers : iterable of str
+            The identifiers within the namespace.
+        bloom_filter : BloomFilter, optional
+            Filters of the indexed cross-references that reject most unknown
+            identifiers before they probe the index.
+
+        Returns
+        -------
+        pandas.DataFrame
+            A table with the columns ``identifier`` and ``mnx_id`` that contains one
+            row per mapping in the order of the given identifiers. Unknown
+            identifiers are omitted.
+
+        """
+        if bloom_filter is not None:
+            identifiers = list(identifiers)
+            identifiers = [
+                identifier
+                for identifier, keep in zip(
+                    identifiers, bloom_filter.might_contain_many(prefix, identifiers)
+                )
+                if keep
+            ]
+        found = []
+        mnx_ids = []
+        for identifier in identifiers:
+            for mnx_id in self.resolve(prefix, identifier):
+                found.append(identifier)
+                mnx_ids.append(mnx_id)
+        return pd.DataFrame({"identifier": found, "mnx_id": mnx_ids}, dtype=object)
+
+    def cross_references(
+        self, mnx_ids: Iterable[str], prefix: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Return the cross-references of one or more MetaNetX identifiers.
+
+        Parameters
+        ----------
+        mnx_ids : iterable of str
+            The MetaNetX identifiers to look up.
+        prefix : str, optional
+            Restrict the cross-references to a single namespace.
+
+        Returns
+        -------
+        pandas.DataFrame
+            A table with the columns ``mnx_id``, ``prefix``, and ``identifier``.
+            Unknown MetaNetX identifiers are omitted.
+
+        """
+        mnx_ids = np.asarray(list(mnx_ids), dtype=object)
+        codes = np.array([self._find_mnx_id(m) for m in mnx_ids], dtype=np.int64)
+        found = np.flatnonzero(codes >= 0)
+        starts = np.array(
+            [self._reverse_offsets[c] for c in codes[found].tolist()], dtype=np.int64
+        )
+        stops = np.array(
+            [self._reverse_offsets[c + 1] for c in codes[found].tolist()],
+            dtype=np.int64,
+        )
+        pairs = [
+            self._get_key(self._reverse_rows[row]).decode("utf-8").split(SEPARATOR, 1)
+            for row in expand_ranges(starts, stops).tolist()
+        ]
+        result = pd.DataFrame(
+            {
+                "mnx_id": np.repeat(mnx_ids[found], stops - starts),
+                "prefix": [pair[0] for pair in pairs],
+                "identifier": [pair[1] for pair in pairs],
+            }
+        )
+        if prefix is not None:
+            result = result.loc[result["prefix"] == prefix].reset_index(drop=True)
+        return result
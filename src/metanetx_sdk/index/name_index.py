@@ -0,0 +1,395 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide a search index over chemical names and synonyms."""
+
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Iterable, List, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from .identifier_index import expand_ranges
+
+
+logger = logging.getLogger(__name__)
+
+
+# MetaNetX separates multiple synonyms in cross-reference descriptions.
+SYNONYM_SEPARATOR = "||"
+NGRAM_SIZE = 3
+RESULT_COLUMNS = ["name", "mnx_id", "score"]
+
+
+def normalize_names(names: pd.Series) -> pd.Series:
+    """Return names in lower case with runs of non-word characters as one space."""
+    return (
+        names.str.lower()
+        .str.replace(r"[\W_]+", " ", regex=True)
+        .str.strip()
+        .replace("", np.nan)
+    )
+
+
+def _ngrams(name: str) -> List[str]:
+    """Return the distinct character n-grams of a padded, normalized name."""
+    padded = f" {name} "
+    return list(
+        {padded[i : i + NGRAM_SIZE] for i in range(len(padded) - NGRAM_SIZE + 1)}
+    )
+
+
+class InvertedIndex(NamedTuple):
+    """Map terms to the sorted codes of the names that contain them."""
+
+    keys: pd.Index
+    offsets: np.ndarray
+    postings: np.ndarray
+    counts: np.ndarray
+
+    @classmethod
+    def from_terms(cls, terms: List[List[str]]) -> InvertedIndex:
+        """Build an inverted index from the distinct terms of each name."""
+        counts = np.fromiter((len(t) for t in terms), dtype=np.int32, count=len(terms))
+        codes, keys = pd.factorize(
+            pd.Series(
+                [term for name_terms in terms for term in name_terms], dtype=object
+            )
+        )
+        postings = np.repeat(np.arange(len(terms), dtype=np.int32), counts)
+        # A stable sort keeps the postings of each term in ascending order.
+        order = np.argsort(codes, kind="stable")
+        offsets = np.zeros(len(keys) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(codes, minlength=len(keys)), out=offsets[1:])
+        return cls(pd.Index(keys, dtype=object), offsets, postings[order], counts)
+
+    def get_postings(self, terms: List[str]) -> List[np.ndarray]:
+        """Return the postings of all known terms from the rarest to the most common."""
+        codes = self.keys.get_indexer(pd.Index(terms, dtype=object))
+        codes = codes[codes >= 0]
+        codes = codes[np.argsort(self.offsets[codes + 1] - self.offsets[codes])]
+        return [self.postings[self.offsets[c] : self.offsets[c + 1]] for c in codes]
+
+    @staticmethod
+    def count_shared(
+        postings: List[np.ndarray], candidates: np.ndarray, size: int
+    ) -> np.ndarray:
+        """Count the postings that contain each of the sorted candidates."""
+        if not postings:
+            return np.zeros(len(candidates), dtype=np.int64)
+        if len(candidates) * 32 >= sum(len(p) for p in postings):
+            return np.bincount(np.concatenate(postings), minlength=size)[candidates]
+        # Few candidates are cheaper to find in the sorted postings.
+        shared = np.zeros(len(candidates), dtype=np.int64)
+        for posting in postings:
+            positions = np.searchsorted(posting, candidates)
+            positions[positions == len(posting)] = 0
+            shared += posting[positions] == candidates
+        return shared
+
+
+def _encode(strings: Iterable[str]) -> np.ndarray:
+    """Encode strings without line breaks as one byte array."""
+    return np.frombuffer("\n".join(strings).encode("utf-8"), dtype=np.uint8)
+
+
+def _decode(data: np.ndarray) -> List[str]:
+    """Decode a byte array of strings separated by line breaks."""
+    # Splitting an empty string would yield a single empty string.
+    if len(data) == 0:
+        return []
+    return data.tobytes().decode("utf-8").split("\n")
+
+
+class NameIndex:
+    """
+    Search chemical names and synonyms by tokens, character n-grams, or prefix.
+
+    Names are normalized to lower case with punctuation removed. Every distinct
+    normalized name is stored once in sorted order, which allows for prefix search
+    by bisection. Two inverted indexes, one over word tokens and one over character
+    trigrams, map terms to names. Fuzzy matches are found through the trigrams and
+    ranked by the mean of the Jaccard similarity of their token sets and that of
+    their trigram sets.
+
+    """
+
+    def __init__(
+        self,
+        names: List[str],
+        labels: List[str],
+        name_offsets: np.ndarray,
+        name_mnx_ids: np.ndarray,
+        mnx_ids: List[str],
+        tokens: InvertedIndex,
+        ngrams: InvertedIndex,
+    ) -> None:
+        """
+        Initialize the index from its parts.
+
+        Use `from_tables` or `load` rather than this constructor.
+
+        Parameters
+        ----------
+        names : list of str
+            The sorted, distinct, normalized names.
+        labels : list of str
+            One original spelling of each name.
+        name_offsets : numpy.ndarray
+            The offsets of each name's MetaNetX identifier codes.
+        name_mnx_ids : numpy.ndarray
+            The MetaNetX identifier codes of all names.
+        mnx_ids : list of str
+            The MetaNetX identifiers.
+        tokens : InvertedIndex
+            The names containing each word token.
+        ngrams : InvertedIndex
+            The names containing each character trigram.
+
+        """
+        self._names = pd.Index(names, dtype=object)
+        self._labels = np.asarray(labels, dtype=object)
+        self._name_offsets = name_offsets
+        self._name_mnx_ids = name_mnx_ids
+        self._mnx_ids = np.asarray(mnx_ids, dtype=object)
+        self._tokens = tokens
+        self._ngrams = ngrams
+        # Build the hash tables of the terms now rather than on the first query.
+        tokens.keys.get_indexer(pd.Index([""], dtype=object))
+        ngrams.keys.get_indexer(pd.Index([""], dtype=object))
+        logger.debug(
+            "Indexed %d names with %d tokens and %d n-grams.",
+            len(self._names),
+            len(tokens.keys),
+            len(ngrams.keys),
+        )
+
+    @classmethod
+    def from_tables(
+        cls,
+        properties: Iterable[pd.DataFrame] = (),
+        cross_references: Iterable[pd.DataFrame] = (),
+    ) -> NameIndex:
+        """
+        Build an index from transformed tables.
+
+        Parameters
+        ----------
+        properties : iterable of pandas.DataFrame, optional
+            Tables with the columns ``mnx_id`` and ``name``.
+        cross_references : iterable of pandas.DataFrame, optional
+            Tables with the columns ``mnx_id`` and ``description``, whose synonyms
+            are separated by ``||``.
+
+        """
+        parts = [t[["mnx_id", "name"]] for t in properties]
+        for table in cross_references:
+            synonyms = table[["mnx_id", "description"]].rename(
+                columns={"description": "name"}
+            )
+            synonyms["name"] = synonyms["name"].str.split(
+                SYNONYM_SEPARATOR, regex=False
+            )
+            parts.append(synonyms.explode("name"))
+        table = pd.concat(parts, ignore_index=True).dropna()
+        table["name"] = table["name"].str.strip().str.replace("\n", " ", regex=False)
+        table["normalized"] = normalize_names(table["name"])
+        table = table.dropna().drop_duplicates(["normalized", "mnx_id"])
+        name_codes, names = pd.factorize(table["normalized"], sort=True)
+        mnx_codes, mnx_ids = pd.factorize(table["mnx_id"], sort=True)
+        order = np.lexsort((mnx_codes, name_codes))
+        name_offsets = np.zeros(len(names) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(name_codes, minlength=len(names)), out=name_offsets[1:])
+        labels = table["name"].values[order][name_offsets[:-1]]
+        return cls(
+            names.tolist(),
+            labels.tolist(),
+            name_offsets,
+            mnx_codes[order].astype(np.int32),
+            mnx_ids.tolist(),
+            InvertedIndex.from_terms([list(set(name.split(" "))) for name in names]),
+            InvertedIndex.from_terms([_ngrams(name) for name in names]),
+        )
+
+    @classmethod
+    def from_files(
+        cls, properties: Iterable[Path] = (), cross_references: Iterable[Path] = ()
+    ) -> NameIndex:
+        """Build an index from transformed property and cross-reference files."""
+        return cls.from_tables(
+            (
+                pd.read_csv(name, sep="\t", usecols=["mnx_id", "name"], dtype=str)
+                for name in properties
+            ),
+            (
+                pd.read_csv(
+                    name, sep="\t", usecols=["mnx_id", "description"], dtype=str
+                )
+                for name in cross_references
+            ),
+        )
+
+    def save(self, filename: Path) -> None:
+        """Store the index in a compressed NumPy file."""
+        arrays = {
+            "names": _encode(self._names),
+            "labels": _encode(self._labels),
+            "name_offsets": self._name_offsets,
+            "name_mnx_ids": self._name_mnx_ids,
+            "mnx_ids": _encode(self._mnx_ids),
+        }
+        for name, inverted in [("tokens", self._tokens), ("ngrams", self._ngrams)]:
+            arrays[f"{name}_keys"] = _encode(inverted.keys)
+            arrays[f"{name}_offsets"] = inverted.offsets
+            arrays[f"{name}_postings"] = inverted.postings
+            arrays[f"{name}_counts"] = inverted.counts
+        with Path(filename).open("wb") as handle:
+            np.savez_compressed(handle, **arrays)
+
+    @classmethod
+    def load(cls, filename: Path) -> NameIndex:
+        """Load an index stored with `save`."""
+        with np.load(filename) as data:
+            inverted = {
+                name: InvertedIndex(
+                    pd.Index(_decode(data[f"{name}_keys"]), dtype=object),
+                    data[f"{name}_offsets"],
+                    data[f"{name}_postings"],
+                    data[f"{name}_counts"],
+                )
+                for name in ["tokens", "ngrams"]
+            }
+            return cls(
+                _decode(data["names"]),
+                _decode(data["labels"]),
+                data["name_offsets"],
+                data["name_mnx_ids"],
+                _decode(data["mnx_ids"]),
+                **inverted,
+            )
+
+    def __len__(self) -> int:
+        """Return the number of distinct, normalized names."""
+        return len(self._names)
+
+    def _to_frame(self, name_codes: np.ndarray, scores: np.ndarray) -> pd.DataFrame:
+        """Expand names to one row per MetaNetX identifier."""
+        starts = self._name_offsets[name_codes]
+        stops = self._name_offsets[name_codes + 1]
+        lengths = stops - starts
+        return pd.DataFrame(
+            {
+                "name": np.repeat(self._labels[name_codes], lengths),
+                "mnx_id": self._mnx_ids[
+                    self._name_mnx_ids[expand_ranges(starts, stops)]
+                ],
+                "score": np.repeat(scores, lengths),
+            },
+            columns=RESULT_COLUMNS,
+        )
+
+    def search(
+        self, query: str, limit: int = 10, min_score: float = 0.3
+    ) -> pd.DataFrame:
+        """
+        Return the names that best match a query.
+
+        Parameters
+        ----------
+        query : str
+            A name, possibly misspelled or incomplete.
+        limit : int, optional
+            The maximum number of names to return (default 10).
+        min_score : float, optional
+            The minimum Jaccard similarity between the trigrams of the query and
+            those of a name (default 0.3).
+
+        Returns
+        -------
+        pandas.DataFrame
+            A table with the columns ``name``, ``mnx_id``, and ``score`` with one
+            row per MetaNetX identifier of each matching name, ordered by
+            decreasing score. An exact match after normalization scores one.
+
+        """
+        normalized = normalize_names(pd.Series([query], dtype=object)).iloc[0]
+        if pd.isnull(normalized):
+            return pd.DataFrame(columns=RESULT_COLUMNS)
+        ngrams = _ngrams(normalized)
+        postings = self._ngrams.get_postings(ngrams)
+        # A name reaches the minimum similarity only if it shares a minimum number
+        # of n-grams with the query and thus at least one of the rarest n-grams.
+        min_shared = max(int(np.ceil(min_score * len(ngrams))), 1)
+        if len(postings) < min_shared:
+            return pd.DataFrame(columns=RESULT_COLUMNS)
+        candidates = np.flatnonzero(
+            np.bincount(
+                np.concatenate(postings[: len(postings) - min_shared + 1]),
+                minlength=len(self._names),
+            )
+        )
+        shared = InvertedIndex.count_shared(postings, candidates, len(self._names))
+        similarity = shared / (len(ngrams) + self._ngrams.counts[candidates] - shared)
+        keep = similarity >= min_score
+        candidates = candidates[keep]
+        tokens = list(set(normalized.split(" ")))
+        shared = InvertedIndex.count_shared(
+            self._tokens.get_postings(tokens), candidates, len(self._names)
+        )
+        scores = 0.5 * (
+            similarity[keep]
+            + shared / (len(tokens) + self._tokens.counts[candidates] - shared)
+        )
+        if len(candidates) > limit:
+            best = np.argpartition(-scores, limit - 1)[:limit]
+            candidates = candidates[best]
+            scores = scores[best]
+        order = np.argsort(-scores, kind="stable")
+        return self._to_frame(candidates[order], scores[order])
+
+    def prefix_search(self, prefix: str, limit: int = 10) -> pd.DataFrame:
+        """
+        Return the names that start with a prefix in alphabetical order.
+
+        Parameters
+        ----------
+        prefix : str
+            The beginning of a name.
+        limit : int, optional
+            The maximum number of names to return (default 10).
+
+        Returns
+        -------
+        pandas.DataFrame
+            A table with the columns ``name``, ``mnx_id``, and ``score``, where the
+            score is the fraction of the name covered by the prefix.
+
+        """
+        normalized = normalize_names(pd.Series([prefix], dtype=object)).iloc[0]
+        if pd.isnull(normalized):
+            return pd.DataFrame(columns=RESULT_COLUMNS)
+        start = self._names.searchsorted(normalized, side="left")
+        stop = self._names.searchsorted(normalized + "\U0010ffff", side="left")
+        codes = np.arange(start, min(stop, start + limit))
+        lengths = np.fromiter(
+            (len(name) for name in self._names.values[codes]),
+            dtype=float,
+            count=len(codes),
+        )
+        return self._to_frame(codes, len(normalized) / lengths)
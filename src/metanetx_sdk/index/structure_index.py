@@ -0,0 +1,193 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide an index of chemical structures by InChIKey and mass."""
+
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Iterable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .identifier_index import expand_ranges
+
+
+logger = logging.getLogger(__name__)
+
+
+COLUMNS = ["mnx_id", "inchi_key", "formula", "mass"]
+# The first block of an InChIKey encodes the molecular skeleton (connectivity).
+SKELETON_LENGTH = 14
+
+
+class StructureIndex:
+    """
+    Look up chemicals by InChIKey, InChIKey skeleton, or monoisotopic mass.
+
+    InChIKeys and their first blocks are found through hash indexes that point
+    into the chemicals sorted by InChIKey. Masses are kept in a sorted array such
+    that a whole batch of mass windows is resolved by binary search at once.
+
+    """
+
+    def __init__(self, properties: pd.DataFrame) -> None:
+        """
+        Build the index from transformed chemical properties.
+
+        Parameters
+        ----------
+        properties : pandas.DataFrame
+            A table with the columns ``mnx_id``, ``inchi_key``, ``formula``, and
+            ``mass``.
+
+        """
+        table = properties[COLUMNS].drop_duplicates("mnx_id")
+        keyed = table.dropna(subset=["inchi_key"]).sort_values(
+            "inchi_key", ignore_index=True
+        )
+        self._key_mnx_ids = keyed["mnx_id"].values.astype(object)
+        self._keys, self._key_offsets = self._group(keyed["inchi_key"])
+        self._skeletons, self._skeleton_offsets = self._group(
+            keyed["inchi_key"].str.slice(0, SKELETON_LENGTH)
+        )
+        weighed = table.assign(mass=pd.to_numeric(table["mass"], errors="coerce"))
+        weighed = weighed.dropna(subset=["mass"]).sort_values(
+            "mass", kind="stable", ignore_index=True
+        )
+        self._masses = weighed["mass"].values.astype(np.float64)
+        self._mass_mnx_ids = weighed["mnx_id"].values.astype(object)
+        self._mass_formulae = weighed["formula"].values.astype(object)
+        logger.debug(
+            "Indexed %d InChIKeys and %d masses.", len(self._keys), len(self._masses)
+        )
+
+    @staticmethod
+    def _group(sorted_keys: pd.Series) -> Tuple[pd.Index, np.ndarray]:
+        """Return the distinct sorted keys as a hash index and their row offsets."""
+        is_new = np.ones(len(sorted_keys), dtype=bool)
+        is_new[1:] = sorted_keys.values[1:] != sorted_keys.values[:-1]
+        offsets = np.append(np.flatnonzero(is_new), len(sorted_keys))
+        return pd.Index(sorted_keys.values[is_new], dtype=object), offsets
+
+    @classmethod
+    def from_files(cls, filenames: Iterable[Path]) -> StructureIndex:
+        """Build an index from transformed chemical property files."""
+        return cls(
+            pd.concat(
+                [
+                    pd.read_csv(
+                        name,
+                        sep="\t",
+                        usecols=COLUMNS,
+                        dtype={"mnx_id": str, "inchi_key": str, "formula": str},
+                    )
+                    for name in filenames
+                ],
+                ignore_index=True,
+            )
+        )
+
+    def _lookup(
+        self, keys: pd.Index, offsets: np.ndarray, queries: List[str], values: List[str]
+    ) -> pd.DataFrame:
+        """Find all chemicals whose key equals the value of each query."""
+        positions = keys.get_indexer(pd.Index(values, dtype=object))
+        found = np.flatnonzero(positions >= 0)
+        starts = offsets[positions[found]]
+        stops = offsets[positions[found] + 1]
+        return pd.DataFrame(
+            {
+                "query": np.repeat(
+                    np.asarray(queries, dtype=object)[found], stops - starts
+                ),
+                "mnx_id": self._key_mnx_ids[expand_ranges(starts, stops)],
+            }
+        )
+
+    def find_inchi_keys(
+        self, inchi_keys: Iterable[str], skeleton: bool = False
+    ) -> pd.DataFrame:
+        """
+        Find chemicals by their InChIKeys.
+
+        Parameters
+        ----------
+        inchi_keys : iterable of str
+            Full InChIKeys, for example, ZKHQWZAMYRWXGA-KQYNXXCUSA-N.
+        skeleton : bool, optional
+            Match only the first block of the keys, which ignores stereochemistry,
+            isotopes, and protonation (default false).
+
+        Returns
+        -------
+        pandas.DataFrame
+            A table with the columns ``query`` and ``mnx_id``. Unknown keys are
+            omitted.
+
+        """
+        queries = list(inchi_keys)
+        if skeleton:
+            return self._lookup(
+                self._skeletons,
+                self._skeleton_offsets,
+                queries,
+                [key[:SKELETON_LENGTH] for key in queries],
+            )
+        return self._lookup(self._keys, self._key_offsets, queries, queries)
+
+    def find_masses(
+        self, masses: Iterable[float], tolerance: float = 5.0, ppm: bool = True
+    ) -> pd.DataFrame:
+        """
+        Find chemicals whose monoisotopic mass lies within a window of each mass.
+
+        Parameters
+        ----------
+        masses : iterable of float
+            Neutral monoisotopic masses, for example, from a mass spectrometry run.
+        tolerance : float, optional
+            The half-width of each window (default 5).
+        ppm : bool, optional
+            Whether the tolerance is in parts per million of each mass or otherwise
+            in Dalton (default true).
+
+        Returns
+        -------
+        pandas.DataFrame
+            A table with the columns ``query``, ``mnx_id``, ``formula``, ``mass``,
+            and ``error_ppm`` with one row per matching chemical in the order of
+            the given masses and then by increasing mass. Masses without matches
+            are omitted.
+
+        """
+        queries = np.asarray(list(masses), dtype=np.float64)
+        width = queries * tolerance * 1e-6 if ppm else np.full_like(queries, tolerance)
+        starts = np.searchsorted(self._masses, queries - width, side="left")
+        stops = np.searchsorted(self._masses, queries + width, side="right")
+        rows = expand_ranges(starts, stops)
+        repeated = np.repeat(queries, stops - starts)
+        return pd.DataFrame(
+            {
+                "query": repeated,
+                "mnx_id": self._mass_mnx_ids[rows],
+                "formula": self._mass_formulae[rows],
+                "mass": self._masses[rows],
+                "error_ppm": (self._masses[rows] - repeated) / repeated * 1e6,
+            }
+        )
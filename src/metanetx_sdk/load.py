@@ -0,0 +1,196 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide functions for loading transformed tables into other storage."""
+
+
+import logging
+import re
+import sqlite3
+from pathlib import Path
+from typing import List, Mapping, Tuple
+
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+
+# Columns, or groups of columns, that are looked up frequently.
+SQLITE_INDEXES: List[Tuple[str, ...]] = [
+    ("mnx_id",),
+    ("prefix", "identifier"),
+    ("inchi_key",),
+    ("deprecated_id",),
+    ("current_id",),
+]
+
+# The SQL types of numeric columns. All other columns are text, such that
+# identifiers keep leading zeros no matter what values a chunk happens to contain.
+SQLITE_NUMERIC_COLUMNS = {
+    "charge": "INTEGER",
+    "mass": "REAL",
+}
+
+# Trade durability for speed while loading. A new database is simply rebuilt if
+# loading fails, so only its journal is disabled, see `load_sqlite`.
+SQLITE_LOAD_PRAGMAS = [
+    "PRAGMA synchronous = OFF",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -262144",
+    "PRAGMA locking_mode = EXCLUSIVE",
+]
+
+
+def _quote(name: str) -> str:
+    """Quote an SQL identifier."""
+    return '"{}"'.format(name.replace('"', '""'))
+
+
+def load_sqlite_table(
+    connection: sqlite3.Connection, name: str, filename: Path, chunksize: int
+) -> int:
+    """
+    Bulk insert a transformed table into an SQLite database within a transaction.
+
+    Parameters
+    ----------
+    connection : sqlite3.Connection
+        An open connection to the database.
+    name : str
+        The name of the database table, which is replaced if it exists.
+    filename : pathlib.Path
+        The transformed table.
+    chunksize : int
+        The number of rows that are read and inserted at a time.
+
+    Returns
+    -------
+    int
+        The number of inserted rows.
+
+    """
+    columns = pd.read_csv(filename, sep="\t", nrows=0).columns
+    types = {column: SQLITE_NUMERIC_COLUMNS.get(column, "TEXT") for column in columns}
+    connection.execute(f"DROP TABLE IF EXISTS {_quote(name)}")
+    connection.execute(
+        f"CREATE TABLE {_quote(name)} "
+        f"({', '.join(f'{_quote(c)} {t}' for c, t in types.items())})"
+    )
+    insert = f"INSERT INTO {_quote(name)} VALUES ({', '.join('?' * len(columns))})"
+    num_rows = 0
+    for chunk in pd.read_csv(
+        filename,
+        sep="\t",
+        # Numeric columns are read as floats which SQLite stores as integers in
+        # INTEGER columns if they are whole numbers.
+        dtype={
+            column: float if column in SQLITE_NUMERIC_COLUMNS else str
+            for column in columns
+        },
+        chunksize=chunksize,
+    ):
+        # Convert to native Python objects and missing values to `NULL`.
+        chunk = chunk.astype(object).where(chunk.notnull(), None)
+        connection.executemany(insert, chunk.itertuples(index=False, name=None))
+        num_rows += len(chunk)
+    return num_rows
+
+
+def create_sqlite_indexes(connection: sqlite3.Connection, name: str) -> None:
+    """Create indexes on all frequently looked up columns of a table."""
+    columns = {
+        row[1] for row in connection.execute(f"PRAGMA table_info({_quote(name)})")
+    }
+    for index in SQLITE_INDEXES:
+        if not columns.issuperset(index):
+            continue
+        index_name = _quote(f"ix_{name}_{'_'.join(index)}")
+        logger.debug("Creating index %s.", index_name)
+        connection.execute(
+            f"CREATE INDEX IF NOT EXISTS {index_name} ON {_quote(name)} "
+            f"({', '.join(_quote(c) for c in index)})"
+        )
+
+
+def load_sqlite(
+    tables: Mapping[str, Path], database: Path, chunksize: int = 100_000
+) -> None:
+    """
+    Load transformed tables into a single SQLite database.
+
+    All tables are inserted in a single transaction. Journaling is disabled for a
+    new database only, such that loading into an existing one can be rolled back
+    if it fails. Indexes are created after all rows are inserted, which is much
+    faster than updating them with every insert.
+
+    Parameters
+    ----------
+    tables : typing.Mapping
+        A mapping from database table names to transformed table files.
+    database : pathlib.Path
+        The SQLite database file, which is created if it does not exist.
+    chunksize : int, optional
+        The number of rows that are read and inserted at a time (default 100,000).
+
+    """
+    is_new = not database.exists()
+    connection = sqlite3.connect(str(database), isolation_level=None)
+    try:
+        if is_new:
+            connection.execute("PRAGMA journal_mode = OFF")
+        for pragma in SQLITE_LOAD_PRAGMAS:
+            connection.execute(pragma)
+        connection.execute("BEGIN")
+        for name, filename in tables.items():
+            logger.info("Loading table '%s'.", name)
+            num_rows = load_sqlite_table(connection, name, filename, chunksize)
+            logger.info("Inserted %d rows.", num_rows)
+        connection.execute("COMMIT")
+        logger.info("Creating indexes...")
+        connection.execute("BEGIN")
+        for name in tables:
+            create_sqlite_indexes(connection, name)
+        connection.execute("COMMIT")
+        connection.execute("ANALYZE")
+        if is_new:
+            connection.execute("PRAGMA journal_mode = DELETE")
+    finally:
+        connection.close()
+
+
+def infer_table_name(filename: Path, known: List[str]) -> str:
+    """
+    Infer a database table name from a file name.
+
+    Parameters
+    ----------
+    filename : pathlib.Path
+        A table file, for example, ``transformed_chem_prop.tsv.gz``.
+    known : list of str
+        Known table names to look for in the file name, for example, chem_prop.
+
+    Returns
+    -------
+    str
+        The first known table name that occurs in the file name or otherwise the
+        file name without suffixes and any non-word characters replaced.
+
+    """
+    stem = filename.name.split(".", 1)[0]
+    for name in known:
+        if name in stem:
+            return name
+    return re.sub(r"\W", "_", stem)
@@ -18,7 +18,10 @@
 
 from .ftp_configuration_model import FTPConfigurationModel
 from .path_info_model import PathInfoModel
+from .release_registry import ReleaseRegistry, get_release_registry
 from .table_configuration_model import (
     SingleTableConfigurationModel,
     TableConfigurationModel,
 )
+from .transform_statistics_model import TransformStatisticsModel
+from .validation_model import ValidationResultModel, ValidationRuleModel
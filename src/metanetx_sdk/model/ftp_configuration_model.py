@@ -19,16 +19,12 @@
 from __future__ import annotations
 
 import datetime
-from importlib.resources import open_text
 from pathlib import PurePosixPath
 from typing import List, Optional
 
 import pytz
-import toml
 from pydantic import BaseModel
 
-from .. import data
-
 
 class FTPPath(PurePosixPath):
     """Define an FTP path data type."""
@@ -77,6 +73,11 @@ class FTPConfigurationModel(BaseModel):
     version: str
     timezone: Timezone
 
+    class Config:
+        """Configure the model to be immutable since instances are cached."""
+
+        allow_mutation = False
+
     @property
     def directory(self) -> PurePosixPath:
         """Return the compound working directory for the FTP server."""
@@ -85,8 +86,6 @@ class FTPConfigurationModel(BaseModel):
     @classmethod
     def load(cls, version: Optional[str] = None) -> FTPConfigurationModel:
         """Load the packaged FTP configuration."""
-        with open_text(data, "metanetx.toml") as handle:
-            obj = toml.load(handle)
-        if version is None:
-            version = obj["latest"]
-        return cls(version=version, **obj[version]["ftp"])
+        from .release_registry import get_release_registry
+
+        return get_release_registry().ftp(version)
@@ -0,0 +1,119 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide a registry of cached MetaNetX release configurations."""
+
+
+from __future__ import annotations
+
+import threading
+from functools import lru_cache
+from importlib.resources import open_text
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import toml
+
+from .. import data
+from .ftp_configuration_model import FTPConfigurationModel
+from .table_configuration_model import TableConfigurationModel
+
+
+class ReleaseRegistry:
+    """
+    Provide the validated configuration of each known MetaNetX release.
+
+    The configuration file is parsed once. The configuration models of each release
+    are validated lazily on first access and cached afterwards.
+
+    """
+
+    def __init__(self, configuration: Mapping[str, Any]) -> None:
+        """
+        Initialize the registry from a parsed configuration mapping.
+
+        Parameters
+        ----------
+        configuration : typing.Mapping
+            The parsed release configuration with one table per release version and
+            a key ``latest`` naming the default version.
+
+        """
+        self._configuration = configuration
+        self._ftp: Dict[str, FTPConfigurationModel] = {}
+        self._tables: Dict[str, TableConfigurationModel] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_file(cls, filename: Path) -> ReleaseRegistry:
+        """Create a registry from a TOML configuration file."""
+        with filename.open() as handle:
+            return cls(toml.load(handle))
+
+    @property
+    def latest(self) -> str:
+        """Return the latest known release version."""
+        return self._configuration["latest"]
+
+    @property
+    def versions(self) -> List[str]:
+        """Return all known release versions."""
+        return sorted(
+            key for key, value in self._configuration.items() if isinstance(value, dict)
+        )
+
+    def _get_release(self, version: Optional[str]) -> Tuple[str, Mapping[str, Any]]:
+        """Return the normalized version and the raw configuration of a release."""
+        if version is None:
+            version = self.latest
+        try:
+            return version, self._configuration[version]
+        except KeyError:
+            raise ValueError(
+                f"Unknown MetaNetX release '{version}'. Known releases are "
+                f"{', '.join(self.versions)}."
+            ) from None
+
+    def ftp(self, version: Optional[str] = None) -> FTPConfigurationModel:
+        """Return the FTP configuration of a release (default latest)."""
+        version, release = self._get_release(version)
+        with self._lock:
+            if version not in self._ftp:
+                self._ftp[version] = FTPConfigurationModel(
+                    version=version, **release["ftp"]
+                )
+            return self._ftp[version]
+
+    def tables(self, version: Optional[str] = None) -> TableConfigurationModel:
+        """Return the table configuration of a release (default latest)."""
+        version, release = self._get_release(version)
+        with self._lock:
+            if version not in self._tables:
+                self._tables[version] = TableConfigurationModel(
+                    version=version, **release
+                )
+            return self._tables[version]
+
+    def release_directory(self, directory: Path, version: Optional[str] = None) -> Path:
+        """Return a release-specific subdirectory of a working directory."""
+        version, _ = self._get_release(version)
+        return Path(directory) / version
+
+
+@lru_cache(maxsize=None)
+def get_release_registry() -> ReleaseRegistry:
+    """Return the registry of the packaged release configuration."""
+    with open_text(data, "metanetx.toml") as handle:
+        return ReleaseRegistry(toml.load(handle))
@@ -18,20 +18,25 @@
 
 from __future__ import annotations
 
-from importlib.resources import open_text
 from typing import List, Optional
 
-import toml
 from pydantic import BaseModel
 
-from .. import data
+from .validation_model import ValidationRuleModel
 
 
 class SingleTableConfigurationModel(BaseModel):
     """Describe the configuration needed for a single table."""
 
     columns: List[str]
+    keys: List[str]
     skip: int
+    validation: List[ValidationRuleModel] = []
+
+    class Config:
+        """Configure the model to be immutable since instances are cached."""
+
+        allow_mutation = False
 
 
 class TableConfigurationModel(BaseModel):
@@ -48,11 +53,14 @@ class TableConfigurationModel(BaseModel):
     reac_xref: SingleTableConfigurationModel
     version: str
 
+    class Config:
+        """Configure the model to be immutable since instances are cached."""
+
+        allow_mutation = False
+
     @classmethod
     def load(cls, version: Optional[str] = None) -> TableConfigurationModel:
         """Load the configuration from the packaged file."""
-        with open_text(data, "metanetx.toml") as handle:
-            obj = toml.load(handle)
-        if version is None:
-            version = obj["latest"]
-        return cls(version=version, **obj[version])
+        from .release_registry import get_release_registry
+
+        return get_release_registry().tables(version)
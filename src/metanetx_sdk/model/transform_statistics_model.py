@@ -0,0 +1,32 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide a data model for statistics collected while transforming tables."""
+
+
+from typing import Dict, List
+
+from pydantic import BaseModel
+
+
+class TransformStatisticsModel(BaseModel):
+    """Describe the namespaces and completeness of a transformed table."""
+
+    num_rows: int = 0
+    num_missing_prefix: int = 0
+    num_duplicates: int = 0
+    prefix_counts: Dict[str, int] = {}
+    unhandled_prefixes: List[str] = []
+    missing_values: Dict[str, int] = {}
@@ -0,0 +1,58 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide data models for validating extracted tables."""
+
+
+from typing import Any, Dict, List, Literal, Optional
+
+from pydantic import BaseModel, root_validator
+
+
+class ValidationRuleModel(BaseModel):
+    """Describe a rule that every value of a table column must satisfy."""
+
+    column: str
+    check: Literal["pattern", "integer", "numeric", "flag"]
+    pattern: Optional[str] = None
+    values: List[str] = []
+    allow_missing: bool = True
+
+    class Config:
+        """Configure the model to be immutable since instances are cached."""
+
+        allow_mutation = False
+
+    @root_validator(skip_on_failure=True)
+    def check_arguments(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        """Ensure that the arguments needed by the check are present."""
+        if values["check"] == "pattern" and not values.get("pattern"):
+            raise ValueError("A pattern check requires a regular expression.")
+        if values["check"] == "flag" and not values.get("values"):
+            raise ValueError("A flag check requires the allowed values.")
+        return values
+
+    @property
+    def name(self) -> str:
+        """Return a descriptive name for the rule."""
+        return f"{self.column}:{self.check}"
+
+
+class ValidationResultModel(BaseModel):
+    """Describe the outcome of applying a validation rule to a table."""
+
+    rule: ValidationRuleModel
+    violations: int
+    samples: List[Dict[str, Any]]
@@ -0,0 +1,163 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide a streaming export of cross-references as RDF triples."""
+
+
+import gzip
+import logging
+import re
+from pathlib import Path
+from typing import Iterable, TextIO
+from urllib.parse import quote
+
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+
+IDENTIFIERS_ORG = "https://identifiers.org/"
+EXACT_MATCH = "http://www.w3.org/2004/02/skos/core#exactMatch"
+# The MetaNetX namespaces of the identifiers in each kind of cross-reference table.
+SUBJECT_PREFIXES = {
+    "chem": "metanetx.chemical",
+    "comp": "metanetx.compartment",
+    "reac": "metanetx.reaction",
+}
+# Characters that are not allowed in IRIs of N-Triples.
+INVALID_IRI_CHARACTERS = re.compile(r"[\x00-\x20<>\"{}|^`\\]")
+
+
+def _compact_identifiers(prefix: pd.Series, identifier: pd.Series) -> pd.Series:
+    """Return the compact identifiers of the pairs with invalid characters escaped."""
+    compact = prefix + ":" + identifier
+    # Scanning all identifiers at once is much faster in the common case that none
+    # need escaping.
+    if INVALID_IRI_CHARACTERS.search("".join(compact.values)) is None:
+        return compact
+    invalid = compact.str.contains(INVALID_IRI_CHARACTERS)
+    compact.loc[invalid] = compact.loc[invalid].map(
+        lambda value: quote(value, safe=":/")
+    )
+    return compact
+
+
+def format_triples(
+    cross_references: pd.DataFrame,
+    subject_prefix: str,
+    predicate: str = EXACT_MATCH,
+) -> str:
+    """
+    Format cross-references as N-Triples with Identifiers.org IRIs.
+
+    All lines of the table are built by column-wise string concatenation.
+
+    Parameters
+    ----------
+    cross_references : pandas.DataFrame
+        Transformed cross-references with the columns ``mnx_id``, ``prefix``, and
+        ``identifier``.
+    subject_prefix : str
+        The Identifiers.org prefix of the MetaNetX identifiers, for example,
+        ``metanetx.chemical``.
+    predicate : str, optional
+        The IRI that relates MetaNetX entries with their cross-references (default
+        ``skos:exactMatch``).
+
+    Returns
+    -------
+    str
+        One triple per line. Rows with missing values and cross-references to the
+        MetaNetX identifiers themselves are omitted.
+
+    """
+    table = cross_references[["mnx_id", "prefix", "identifier"]].dropna()
+    table = table.loc[
+        (table["prefix"] != subject_prefix) | (table["identifier"] != table["mnx_id"])
+    ]
+    if table.empty:
+        return ""
+    subjects = _compact_identifiers(
+        pd.Series(subject_prefix, index=table.index), table["mnx_id"]
+    )
+    objects = _compact_identifiers(table["prefix"], table["identifier"])
+    lines = (
+        f"<{IDENTIFIERS_ORG}"
+        + subjects
+        + f"> <{predicate}> <{IDENTIFIERS_ORG}"
+        + objects
+        + "> .\n"
+    )
+    return "".join(lines.values)
+
+
+def _open(filename: Path) -> TextIO:
+    """Open a text file for writing that is compressed if its name ends in .gz."""
+    if filename.suffix == ".gz":
+        # A medium compression level keeps compression from dominating export time.
+        return gzip.open(filename, "wt", encoding="utf-8", compresslevel=6)
+    return filename.open("w", encoding="utf-8")
+
+
+def export_triples(
+    filenames: Iterable[Path],
+    output: Path,
+    subject_prefix: str,
+    predicate: str = EXACT_MATCH,
+    chunksize: int = 1_000_000,
+) -> int:
+    """
+    Stream cross-reference tables into an N-Triples file.
+
+    The tables are read and formatted in chunks such that memory usage does not
+    grow with their size. N-Triples are also valid Turtle.
+
+    Parameters
+    ----------
+    filenames : iterable of pathlib.Path
+        Transformed cross-reference tables of one kind.
+    output : pathlib.Path
+        The output file. Compressed if the file name ends with ``.gz``.
+    subject_prefix : str
+        The Identifiers.org prefix of the MetaNetX identifiers, for example,
+        ``metanetx.chemical``.
+    predicate : str, optional
+        The IRI that relates MetaNetX entries with their cross-references (default
+        ``skos:exactMatch``).
+    chunksize : int, optional
+        The number of rows that are formatted at a time (default 1,000,000).
+
+    Returns
+    -------
+    int
+        The number of written triples.
+
+    """
+    num_triples = 0
+    with _open(Path(output)) as handle:
+        for filename in filenames:
+            for chunk in pd.read_csv(
+                filename,
+                sep="\t",
+                usecols=["mnx_id", "prefix", "identifier"],
+                dtype=str,
+                chunksize=chunksize,
+            ):
+                triples = format_triples(chunk, subject_prefix, predicate)
+                handle.write(triples)
+                num_triples += triples.count("\n")
+                logger.debug("Wrote %d triples.", num_triples)
+    return num_triples
@@ -0,0 +1,325 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide lazily loaded and cached tables of a MetaNetX release."""
+
+
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from . import extract, transform
+from .index import IdentifierEncoding
+from .index.identifier_encoding import ENCODED_COLUMNS
+from .model import TableConfigurationModel
+from .validate import log_validation, validate_table
+
+
+logger = logging.getLogger(__name__)
+
+
+# Columns of processed tables that are always text, even if they look numeric.
+IDENTIFIER_COLUMNS = ("mnx_id", "prefix", "identifier", "deprecated_id", "current_id")
+
+
+class TableSpecification(NamedTuple):
+    """Describe how to obtain one processed MetaNetX table."""
+
+    name: str
+    transform: Callable
+    prefix_mapping: Optional[Callable] = None
+
+
+TABLES: Dict[str, TableSpecification] = {
+    "chemicals": TableSpecification(
+        "chem_prop",
+        transform.transform_chemical_properties,
+        extract.extract_chemical_prefix_mapping,
+    ),
+    "chemical_xrefs": TableSpecification(
+        "chem_xref",
+        transform.transform_chemical_cross_references,
+        extract.extract_chemical_prefix_mapping,
+    ),
+    "chemical_deprecations": TableSpecification(
+        "chem_depr", transform.transform_deprecated_identifiers
+    ),
+    "compartments": TableSpecification(
+        "comp_prop",
+        transform.transform_compartment_properties,
+        extract.extract_compartment_prefix_mapping,
+    ),
+    "compartment_xrefs": TableSpecification(
+        "comp_xref",
+        transform.transform_compartment_cross_references,
+        extract.extract_compartment_prefix_mapping,
+    ),
+    "compartment_deprecations": TableSpecification(
+        "comp_depr", transform.transform_deprecated_identifiers
+    ),
+    "reactions": TableSpecification(
+        "reac_prop",
+        transform.transform_reaction_properties,
+        extract.extract_reaction_prefix_mapping,
+    ),
+    "reaction_xrefs": TableSpecification(
+        "reac_xref",
+        transform.transform_reaction_cross_references,
+        extract.extract_reaction_prefix_mapping,
+    ),
+    "reaction_deprecations": TableSpecification(
+        "reac_depr", transform.transform_deprecated_identifiers
+    ),
+}
+
+
+def _find_file(directory: Path, name: str, suffixes: Tuple[str, ...]) -> Optional[Path]:
+    """Return the first existing file of the given name and suffixes."""
+    for suffix in suffixes:
+        if (path := directory / f"{name}{suffix}").is_file():
+            return path
+    return None
+
+
+class MetaNetXRelease:
+    """
+    Provide the processed tables of a MetaNetX release as cached attributes.
+
+    Each table is loaded on first access, preferably from a processed file, and
+    otherwise extracted from the raw MetaNetX file and transformed. Loaded tables
+    are kept until they are evicted. With a memory budget, the least recently
+    used tables are evicted whenever the loaded tables exceed it.
+
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        version: Optional[str] = None,
+        processed_directory: Optional[Path] = None,
+        memory_budget: Optional[int] = None,
+        validate: bool = False,
+        encoding: Optional[IdentifierEncoding] = None,
+        string_storage: Optional[str] = None,
+    ) -> None:
+        """
+        Bind the release to a working directory.
+
+        Parameters
+        ----------
+        directory : pathlib.Path
+            The directory with the raw MetaNetX tables, for example,
+            ``chem_prop.tsv.gz``.
+        version : str, optional
+            The MetaNetX release version (default latest).
+        processed_directory : pathlib.Path, optional
+            The directory with processed tables named like the raw ones, for
+            example, ``chem_prop.parquet`` or ``chem_prop.tsv.gz`` (default a
+            subdirectory ``processed`` of the working directory). Parquet files
+            are preferred if a Parquet engine is installed.
+        memory_budget : int, optional
+            The maximum number of bytes of loaded tables. By default, tables are
+            never evicted automatically.
+        validate : bool, optional
+            Whether or not to validate raw tables against the configured rules
+            when they are extracted (default False).
+        encoding : metanetx_sdk.index.IdentifierEncoding, optional
+            If given, MetaNetX identifier columns of all tables are replaced by
+            their shared integer codes, which use less memory and join faster.
+        string_storage : str, optional
+            If given, text is kept in compact string columns with this storage, for
+            example, ``pyarrow``, and columns with few distinct values are
+            dictionary-encoded.
+
+        """
+        self.directory = Path(directory)
+        self.configuration = TableConfigurationModel.load(version)
+        self.version = self.configuration.version
+        self.processed_directory = (
+            self.directory / "processed"
+            if processed_directory is None
+            else Path(processed_directory)
+        )
+        self.memory_budget = memory_budget
+        self.validate = validate
+        self.encoding = encoding
+        self.string_storage = string_storage
+        self._tables: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._lock = threading.RLock()
+
+    def __repr__(self) -> str:
+        """Return a summary of the release and its loaded tables."""
+        return (
+            f"{type(self).__name__}(directory='{self.directory}', "
+            f"version='{self.version}', loaded={list(self._tables)})"
+        )
+
+    def _read_processed(self, name: str) -> Optional[pd.DataFrame]:
+        """Return a processed table if one exists."""
+        if path := _find_file(self.processed_directory, name, (".parquet",)):
+            try:
+                return pd.read_parquet(path)
+            except ImportError:
+                logger.debug("No Parquet engine available to read '%s'.", path)
+        if path := _find_file(self.processed_directory, name, (".tsv.gz", ".tsv")):
+            table = pd.read_csv(
+                path,
+                sep="\t",
+                dtype={column: str for column in IDENTIFIER_COLUMNS},
+            )
+            # Tables processed with an encoding store MetaNetX identifiers as codes.
+            for column in ENCODED_COLUMNS:
+                if (
+                    column in table.columns
+                    and table[column].notnull().all()
+                    and table[column].str.fullmatch(r"-?\d+").all()
+                ):
+                    table[column] = table[column].astype(np.int32)
+            return table
+        return None
+
+    def _process(self, specification: TableSpecification) -> pd.DataFrame:
+        """Extract and transform a raw MetaNetX table."""
+        path = _find_file(self.directory, specification.name, (".tsv.gz", ".tsv"))
+        if path is None:
+            raise FileNotFoundError(
+                f"Neither a processed nor a raw '{specification.name}' table exists "
+                f"in '{self.directory}'."
+            )
+        config = getattr(self.configuration, specification.name)
+        data = extract.extract_table(
+            path, config.columns, config.skip, string_storage=self.string_storage
+        )
+        if self.validate:
+            log_validation(validate_table(data, config.validation))
+        if specification.prefix_mapping is None:
+            return specification.transform(data)
+        return specification.transform(data, specification.prefix_mapping())
+
+    def get_table(self, table: str) -> pd.DataFrame:
+        """
+        Return a processed table, loading it if necessary.
+
+        Parameters
+        ----------
+        table : str
+            One of the table attributes, for example, ``chemicals``.
+
+        """
+        try:
+            specification = TABLES[table]
+        except KeyError:
+            raise ValueError(
+                f"Unknown table '{table}'. Known tables are {', '.join(TABLES)}."
+            ) from None
+        with self._lock:
+            if table in self._tables:
+                self._tables.move_to_end(table)
+                return self._tables[table]
+            logger.info("Loading %s...", table)
+            data = self._read_processed(specification.name)
+            if data is None:
+                data = self._process(specification)
+            if self.string_storage is not None:
+                data = extract.convert_string_columns(
+                    data, self.string_storage, categorical=True
+                )
+            if self.encoding is not None:
+                data = self.encoding.encode_table(data)
+            self._tables[table] = data
+            self._sizes[table] = int(data.memory_usage(deep=True).sum())
+            logger.debug("Table %s uses %d bytes.", table, self._sizes[table])
+            self._enforce_budget()
+            return data
+
+    def _enforce_budget(self) -> None:
+        """Evict the least recently used tables while over the memory budget."""
+        if self.memory_budget is None:
+            return
+        # The most recently used table is always kept.
+        while len(self._tables) > 1 and sum(self._sizes.values()) > self.memory_budget:
+            table, _ = self._tables.popitem(last=False)
+            logger.debug("Evicting %s (%d bytes).", table, self._sizes.pop(table))
+
+    def evict(self, table: Optional[str] = None) -> None:
+        """Remove one or, by default, all loaded tables from the cache."""
+        with self._lock:
+            if table is None:
+                self._tables.clear()
+                self._sizes.clear()
+            elif table in self._tables:
+                del self._tables[table]
+                del self._sizes[table]
+
+    def memory_usage(self) -> pd.Series:
+        """Return the number of bytes used by each loaded table."""
+        with self._lock:
+            return pd.Series(self._sizes, dtype="int64", name="bytes")
+
+    @property
+    def loaded(self) -> List[str]:
+        """Return the names of the loaded tables from least to most recently used."""
+        return list(self._tables)
+
+    @property
+    def chemicals(self) -> pd.DataFrame:
+        """Return the chemical properties."""
+        return self.get_table("chemicals")
+
+    @property
+    def chemical_xrefs(self) -> pd.DataFrame:
+        """Return the chemical cross-references."""
+        return self.get_table("chemical_xrefs")
+
+    @property
+    def chemical_deprecations(self) -> pd.DataFrame:
+        """Return the mapping of deprecated to current chemical identifiers."""
+        return self.get_table("chemical_deprecations")
+
+    @property
+    def compartments(self) -> pd.DataFrame:
+        """Return the compartment properties."""
+        return self.get_table("compartments")
+
+    @property
+    def compartment_xrefs(self) -> pd.DataFrame:
+        """Return the compartment cross-references."""
+        return self.get_table("compartment_xrefs")
+
+    @property
+    def compartment_deprecations(self) -> pd.DataFrame:
+        """Return the mapping of deprecated to current compartment identifiers."""
+        return self.get_table("compartment_deprecations")
+
+    @property
+    def reactions(self) -> pd.DataFrame:
+        """Return the reaction properties."""
+        return self.get_table("reactions")
+
+    @property
+    def reaction_xrefs(self) -> pd.DataFrame:
+        """Return the reaction cross-references."""
+        return self.get_table("reaction_xrefs")
+
+    @property
+    def reaction_deprecations(self) -> pd.DataFrame:
+        """Return the mapping of deprecated to current reaction identifiers."""
+        return self.get_table("reaction_deprecations")
@@ -16,9 +16,10 @@
 """Provide reporting and plotting functions."""
 
 
-from typing import Literal
+from typing import Iterable, List, Literal, NamedTuple, Optional, Tuple
 
 import humanize
+import numpy as np
 import pandas as pd
 from plotly import graph_objects as go
 
@@ -26,6 +27,9 @@ from plotly import graph_objects as go
 __all__ = (
     "report_value_count",
     "report_duplicates",
+    "TableProfile",
+    "profile_table",
+    "profile_chunks",
     "plot_bincount",
     "plot_frequency",
 )
@@ -87,11 +91,246 @@ def report_duplicates(data_frame: pd.DataFrame, column: str) -> pd.Series:
     )
 
 
+# The number of bits that select a HyperLogLog register. The 2 ** 14 registers give
+# distinct counts with a standard error of about 0.8%.
+HYPERLOGLOG_PRECISION = 14
+
+
+class TableProfile(NamedTuple):
+    """Describe the values of all columns of a table."""
+
+    summary: pd.DataFrame
+    duplicates: pd.DataFrame
+    top_values: pd.DataFrame
+
+
+def _make_profile(
+    summaries: List[tuple],
+    duplicates: List[pd.DataFrame],
+    top_values: List[pd.DataFrame],
+) -> TableProfile:
+    """Combine the profiles of single columns."""
+    return TableProfile(
+        summary=pd.DataFrame(
+            summaries,
+            columns=[
+                "column",
+                "count",
+                "num_missing",
+                "num_distinct",
+                "num_duplicates",
+            ],
+        ),
+        duplicates=(
+            pd.concat(duplicates, ignore_index=True)
+            if duplicates
+            else pd.DataFrame(columns=["column", "occurrences", "num_values"])
+        ),
+        top_values=(
+            pd.concat(top_values, ignore_index=True)
+            if top_values
+            else pd.DataFrame(columns=["column", "value", "count"])
+        ),
+    )
+
+
+def _count_values(series: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the distinct non-empty values of a series and their counts."""
+    # Factorizing is considerably faster than `value_counts` on object columns.
+    codes, uniques = pd.factorize(series)
+    return (
+        np.asarray(uniques),
+        np.bincount(codes[codes >= 0], minlength=len(uniques)),
+    )
+
+
+def _most_frequent(counts: np.ndarray, top: int) -> np.ndarray:
+    """Return the positions of the largest counts in descending order."""
+    if len(counts) > top:
+        positions = np.argpartition(-counts, top)[:top]
+    else:
+        positions = np.arange(len(counts))
+    return positions[np.argsort(-counts[positions], kind="stable")]
+
+
+def profile_table(data_frame: pd.DataFrame, top: int = 10) -> TableProfile:
+    """
+    Profile the values of all columns of a table in memory.
+
+    Each column is counted once and all statistics are derived from these counts.
+
+    Parameters
+    ----------
+    data_frame : pandas.DataFrame
+        A data frame with one or more columns.
+    top : int, optional
+        The number of most frequent values to report per column (default 10).
+
+    Returns
+    -------
+    TableProfile
+        The ``summary`` has one row per column with the number of non-empty cells
+        ``count``, ``num_missing``, ``num_distinct`` values, and
+        ``num_duplicates``, the number of cells that repeat an earlier value. The
+        ``duplicates`` state for each column how many values (``num_values``)
+        occur a given number of times (``occurrences``) if more than once. The
+        ``top_values`` are the most frequent values of each column with their
+        ``count``.
+
+    """
+    summaries = []
+    duplicates = []
+    top_values = []
+    for column in data_frame.columns:
+        values, counts = _count_values(data_frame[column])
+        count = int(counts.sum())
+        summaries.append(
+            (column, count, len(data_frame) - count, len(values), count - len(values))
+        )
+        occurrences = np.bincount(counts)
+        repeated = np.flatnonzero(occurrences[2:]) + 2
+        duplicates.append(
+            pd.DataFrame(
+                {
+                    "column": column,
+                    "occurrences": repeated,
+                    "num_values": occurrences[repeated],
+                }
+            )
+        )
+        frequent = _most_frequent(counts, top)
+        top_values.append(
+            pd.DataFrame(
+                {"column": column, "value": values[frequent], "count": counts[frequent]}
+            )
+        )
+    return _make_profile(summaries, duplicates, top_values)
+
+
+def _update_registers(
+    registers: np.ndarray, values: np.ndarray, precision: int
+) -> None:
+    """Record the hashes of values in HyperLogLog registers in place."""
+    hashes = pd.util.hash_array(values, categorize=False)
+    index = (hashes >> np.uint64(64 - precision)).astype(np.int64)
+    remainder = hashes << np.uint64(precision)
+    # Floating point yields exact bit lengths of integers below 2 ** 53.
+    high = remainder >> np.uint64(11)
+    length = np.where(
+        high > 0,
+        np.frexp(high.astype(float))[1] + 11,
+        np.frexp(remainder.astype(float))[1],
+    )
+    # The rank is the position of the first set bit after the register index.
+    rank = np.minimum(65 - length, 65 - precision).astype(np.uint8)
+    np.maximum.at(registers, index, rank)
+
+
+def _estimate_cardinality(registers: np.ndarray) -> int:
+    """Estimate the number of distinct hashes recorded in HyperLogLog registers."""
+    num_registers = len(registers)
+    alpha = 0.7213 / (1.0 + 1.079 / num_registers)
+    estimate = alpha * num_registers**2 / np.exp2(-registers.astype(float)).sum()
+    # Linear counting is more accurate for small cardinalities.
+    if estimate <= 2.5 * num_registers and (num_empty := (registers == 0).sum()) > 0:
+        estimate = num_registers * np.log(num_registers / num_empty)
+    return int(round(estimate))
+
+
+def profile_chunks(
+    chunks: Iterable[pd.DataFrame],
+    top: int = 10,
+    precision: int = HYPERLOGLOG_PRECISION,
+    capacity: Optional[int] = None,
+) -> TableProfile:
+    """
+    Profile the values of all columns of a table that is read in chunks.
+
+    Memory usage is bounded by the chunk size. Distinct values are estimated with
+    HyperLogLog sketches and the most frequent values are tracked among a limited
+    number of candidates, such that both are approximate.
+
+    Warnings
+    --------
+    Values are compared by their hashes, which differ between data types. The
+    chunks should therefore have consistent column types, for example, by reading
+    all columns as text.
+
+    Parameters
+    ----------
+    chunks : iterable of pandas.DataFrame
+        The consecutive parts of a table, for example, from
+        ``pandas.read_csv(..., chunksize=1_000_000)``.
+    top : int, optional
+        The number of most frequent values to report per column (default 10).
+    precision : int, optional
+        The number of bits that select one of the ``2 ** precision`` registers of
+        each sketch (default 14). More registers are more accurate.
+    capacity : int, optional
+        The number of candidate frequent values kept per column (default 100
+        times ``top``).
+
+    Returns
+    -------
+    TableProfile
+        The same profile as `profile_table` with estimated ``num_distinct`` and
+        ``num_duplicates`` but without the distribution of duplicates.
+
+    """
+    if capacity is None:
+        capacity = 100 * top
+    num_rows = 0
+    counts = {}
+    registers = {}
+    candidates = {}
+    for chunk in chunks:
+        num_rows += len(chunk)
+        for column in chunk.columns:
+            if column not in counts:
+                counts[column] = 0
+                registers[column] = np.zeros(2**precision, dtype=np.uint8)
+                candidates[column] = pd.Series([], dtype=np.int64)
+            values, chunk_counts = _count_values(chunk[column])
+            counts[column] += int(chunk_counts.sum())
+            _update_registers(registers[column], values, precision)
+            frequent = _most_frequent(chunk_counts, capacity)
+            candidates[column] = (
+                candidates[column]
+                .add(
+                    pd.Series(chunk_counts[frequent], index=values[frequent]),
+                    fill_value=0,
+                )
+                .nlargest(capacity)
+            )
+    summaries = []
+    top_values = []
+    for column, count in counts.items():
+        num_distinct = min(_estimate_cardinality(registers[column]), count)
+        summaries.append(
+            (column, count, num_rows - count, num_distinct, count - num_distinct)
+        )
+        frequent = candidates[column].nlargest(top).astype(np.int64)
+        top_values.append(
+            pd.DataFrame(
+                {"column": column, "value": frequent.index, "count": frequent.values}
+            )
+        )
+    return _make_profile(summaries, [], top_values)
+
+
+# Series with more values are binned before plotting them as histograms.
+MAX_RAW_POINTS = 10_000
+DEFAULT_BINS = 100
+DEFAULT_MAX_CATEGORIES = 50
+
+
 def plot_frequency(
     series: pd.Series,
     xaxis_title: str,
     yaxis_title: str = "Frequency",
     yaxis_scale: Literal["log", "linear"] = "log",
+    binned: Optional[bool] = None,
+    bins: int = DEFAULT_BINS,
 ) -> go.Figure:
     """
     Compute a histogram of the given data points.
@@ -106,6 +345,14 @@ def plot_frequency(
         The title for the vertial plot axis (default 'Frequency').
     yaxis_scale : {'log', 'linear'}, optional
         The vertical axis scale (default 'log').
+    binned : bool, optional
+        Whether to count the data points in bins before plotting, such that the
+        figure only contains the counts rather than every data point. By default,
+        series with more than `MAX_RAW_POINTS` values are binned.
+    bins : int, optional
+        The number of equal-width bins of numeric data points if binned (default
+        100). Non-finite data points are ignored. Other data points, including
+        booleans, are counted per distinct value.
 
     Returns
     -------
@@ -113,12 +360,33 @@ def plot_frequency(
         A simple histogram of the values as a bar plot.
 
     """
+    if binned is None:
+        binned = len(series) > MAX_RAW_POINTS
+    if binned and (
+        not pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series)
+    ):
+        return plot_bincount(
+            series.value_counts(), xaxis_title, yaxis_title, yaxis_scale
+        )
     fig = go.Figure()
-    fig.add_trace(
-        go.Histogram(
-            x=series,
+    if binned:
+        values = series.dropna().to_numpy(dtype=float)
+        values = values[np.isfinite(values)]
+        counts, edges = np.histogram(values, bins=bins)
+        fig.add_trace(
+            go.Bar(
+                x=(edges[:-1] + edges[1:]) / 2,
+                y=counts,
+                width=np.diff(edges),
+            )
+        )
+        fig.update_layout(bargap=0)
+    else:
+        fig.add_trace(
+            go.Histogram(
+                x=series,
+            )
         )
-    )
     fig.update_layout(
         xaxis_title_text=xaxis_title,
         yaxis_title_text=yaxis_title,
@@ -132,6 +400,8 @@ def plot_bincount(
     xaxis_title: str,
     yaxis_title: str = "Frequency",
     yaxis_scale: Literal["log", "linear"] = "log",
+    max_categories: Optional[int] = DEFAULT_MAX_CATEGORIES,
+    other_label: str = "other",
 ) -> go.Figure:
     """
     Generate a bar plot of the given values. Uses the index as tick labels.
@@ -146,6 +416,12 @@ def plot_bincount(
         The title for the vertial plot axis (default 'Frequency').
     yaxis_scale : {'log', 'linear'}, optional
         The vertical axis scale (default 'log').
+    max_categories : int, optional
+        The maximum number of bars (default 50). If there are more values, the
+        largest ones are kept in their order and the remainder is summed up in a
+        final bar. None shows all values.
+    other_label : str, optional
+        The tick label of the bar with the remaining values (default 'other').
 
     Returns
     -------
@@ -154,6 +430,17 @@ def plot_bincount(
         labels on the horizontal axis.
 
     """
+    if max_categories is not None and len(series) > max_categories:
+        kept = np.zeros(len(series), dtype=bool)
+        kept[
+            np.argpartition(-series.values, max_categories - 1)[: max_categories - 1]
+        ] = True
+        series = pd.concat(
+            [
+                series.loc[kept],
+                pd.Series([series.loc[~kept].sum()], index=[other_label]),
+            ]
+        )
     fig = go.Figure()
     fig.add_trace(
         go.Bar(
@@ -0,0 +1,222 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide a local HTTP server that keeps identifier mappings in memory."""
+
+
+import json
+import logging
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from .index import BloomFilter
+from .translate import Index, translate_identifiers
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+class Resolver:
+    """Answer batched identifier queries from an index loaded once."""
+
+    def __init__(
+        self,
+        index: Index,
+        deprecations: Optional[pd.DataFrame] = None,
+        bloom_filter: Optional[BloomFilter] = None,
+    ) -> None:
+        """
+        Initialize the resolver.
+
+        Parameters
+        ----------
+        index : IdentifierIndex or MappedIdentifierIndex
+            An index of cross-references.
+        deprecations : pandas.DataFrame, optional
+            Transformed deprecation tables with the columns ``deprecated_id`` and
+            ``current_id``.
+        bloom_filter : BloomFilter, optional
+            Filters of the indexed cross-references that are consulted first such
+            that most unknown identifiers never probe the index.
+
+        """
+        self._index = index
+        self._bloom_filter = bloom_filter
+        self._current: Dict[str, List[str]] = {}
+        if deprecations is not None:
+            self._current = (
+                deprecations.groupby("deprecated_id", sort=False)["current_id"]
+                .agg(list)
+                .to_dict()
+            )
+
+    def health(self) -> dict:
+        """Summarize the loaded data."""
+        return {
+            "status": "ok",
+            "cross_references": len(self._index),
+            "deprecations": len(self._current),
+        }
+
+    def _known(self, prefix: str, identifiers: List[str]) -> List[str]:
+        """Return the identifiers that pass the Bloom filter, if any."""
+        if self._bloom_filter is None:
+            return identifiers
+        mask = self._bloom_filter.might_contain_many(prefix, identifiers)
+        return [identifier for identifier, keep in zip(identifiers, mask) if keep]
+
+    def resolve(self, prefix: str, identifiers: List[str]) -> dict:
+        """Map cross-references of one namespace to MetaNetX identifiers."""
+        result = {identifier: [] for identifier in identifiers}
+        for identifier in self._known(prefix, identifiers):
+            result[identifier] = self._index.resolve(prefix, identifier)
+        return result
+
+    def cross_references(self, mnx_ids: List[str], prefix: Optional[str]) -> dict:
+        """Map MetaNetX identifiers to their cross-references."""
+        result = {mnx_id: [] for mnx_id in mnx_ids}
+        table = self._index.cross_references(mnx_ids, prefix=prefix)
+        for row in table.itertuples(index=False):
+            result[row.mnx_id].append([row.prefix, row.identifier])
+        return result
+
+    def translate(self, source: str, target: str, identifiers: List[str]) -> dict:
+        """Translate identifiers from one namespace to another."""
+        result = {identifier: [] for identifier in identifiers}
+        table = translate_identifiers(
+            pd.Series(list(result), dtype=object),
+            self._index,
+            source,
+            target,
+            bloom_filter=self._bloom_filter,
+        ).dropna(subset=["target"])
+        for row in table.itertuples(index=False):
+            result[row.source].append(row.target)
+        return result
+
+    def current(self, identifiers: List[str]) -> dict:
+        """Map deprecated MetaNetX identifiers to their current identifiers."""
+        return {
+            identifier: self._current.get(identifier, [identifier])
+            for identifier in identifiers
+        }
+
+
+class ResolverRequestHandler(BaseHTTPRequestHandler):
+    """Dispatch JSON requests to the server's resolver."""
+
+    # Keep connections alive such that clients avoid a handshake per query and
+    # send small responses immediately.
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _send(self, status: HTTPStatus, body: dict) -> None:
+        """Send a JSON response."""
+        content = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Report the status of the server."""
+        if self.path != "/health":
+            self._send(HTTPStatus.NOT_FOUND, {"error": f"Unknown path '{self.path}'."})
+            return
+        self._send(HTTPStatus.OK, self.server.resolver.health())
+
+    @staticmethod
+    def _strings(query: dict, key: str) -> List[str]:
+        """Return the list of strings under the given key of a query."""
+        value = query[key]
+        if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+            raise TypeError(f"'{key}' must be a list of strings")
+        return value
+
+    def do_POST(self) -> None:  # noqa: N802
+        """Answer a batched query."""
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            query = json.loads(self.rfile.read(length))
+        except ValueError as error:
+            # Covers both malformed JSON and bodies that are not valid UTF-8.
+            self._send(HTTPStatus.BAD_REQUEST, {"error": str(error)})
+            return
+        resolver: Resolver = self.server.resolver
+        try:
+            if self.path == "/resolve":
+                result = resolver.resolve(
+                    query["prefix"], self._strings(query, "identifiers")
+                )
+            elif self.path == "/cross-references":
+                result = resolver.cross_references(
+                    self._strings(query, "mnx_ids"), query.get("prefix")
+                )
+            elif self.path == "/translate":
+                result = resolver.translate(
+                    query["source"],
+                    query["target"],
+                    self._strings(query, "identifiers"),
+                )
+            elif self.path == "/current":
+                result = resolver.current(self._strings(query, "identifiers"))
+            else:
+                self._send(
+                    HTTPStatus.NOT_FOUND, {"error": f"Unknown path '{self.path}'."}
+                )
+                return
+        except (KeyError, TypeError) as error:
+            self._send(HTTPStatus.BAD_REQUEST, {"error": f"Invalid query: {error}"})
+            return
+        self._send(HTTPStatus.OK, {"results": result})
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002
+        """Log requests at debug level rather than to standard error."""
+        logger.debug(format, *args)
+
+
+def create_server(
+    resolver: Resolver, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT
+) -> ThreadingHTTPServer:
+    """
+    Create a threaded HTTP server that answers queries with the given resolver.
+
+    Parameters
+    ----------
+    resolver : Resolver
+        The resolver with all data loaded.
+    host : str, optional
+        The address to bind to (default loopback only).
+    port : int, optional
+        The port to listen on (default 8765). Zero selects a free port.
+
+    Returns
+    -------
+    http.server.ThreadingHTTPServer
+        The server, which is started with ``serve_forever``.
+
+    """
+    server = ThreadingHTTPServer((host, port), ResolverRequestHandler)
+    server.daemon_threads = True
+    server.resolver = resolver
+    return server
@@ -18,4 +18,6 @@
 
 from .chemical import *
 from .compartment import *
+from .deprecation import *
 from .reaction import *
+from .statistics import *
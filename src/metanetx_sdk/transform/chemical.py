@@ -17,10 +17,13 @@
 
 
 import logging
-from typing import Mapping
+from typing import Mapping, Optional
 
 import pandas as pd
 
+from ..model import TransformStatisticsModel
+from .statistics import collect_statistics
+
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +52,9 @@ def transform_metanetx_prefix(table: pd.DataFrame):
 
 
 def transform_chemical_properties(
-    chemicals: pd.DataFrame, prefix_mapping: Mapping
+    chemicals: pd.DataFrame,
+    prefix_mapping: Mapping,
+    statistics: Optional[TransformStatisticsModel] = None,
 ) -> pd.DataFrame:
     """Transform the MetaNetX chemical properties."""
     df = chemicals.copy()
@@ -66,20 +71,26 @@ def transform_chemical_properties(
     if "slm" in namespaces:
         transform_swisslipid_prefix(df)
         namespaces.remove("slm")
+    unhandled = []
     # Map all source databases to MIRIAM compliant versions.
     for prefix in namespaces:
         if prefix in prefix_mapping:
             df.loc[df["prefix"] == prefix, "prefix"] = prefix_mapping[prefix]
         else:
             logger.error("The resource prefix '%s' is unhandled.", prefix)
+            unhandled.append(prefix)
     transform_metanetx_prefix(df)
     del df["source"]
+    if statistics is not None:
+        collect_statistics(statistics, df, ["mnx_id"], num_missing, unhandled)
     logger.debug(df.head())
     return df
 
 
 def transform_chemical_cross_references(
-    references: pd.DataFrame, prefix_mapping: Mapping
+    references: pd.DataFrame,
+    prefix_mapping: Mapping,
+    statistics: Optional[TransformStatisticsModel] = None,
 ) -> pd.DataFrame:
     """Transform the MetaNetX chemical cross-references."""
     df = references.copy()
@@ -100,13 +111,19 @@ def transform_chemical_cross_references(
     if "slm" in namespaces:
         transform_swisslipid_prefix(df)
         namespaces.remove("slm")
+    unhandled = []
     # Map all xref databases to MIRIAM compliant versions.
     for prefix in namespaces:
         if prefix in prefix_mapping:
             df.loc[df["prefix"] == prefix, "prefix"] = prefix_mapping[prefix]
         else:
             logger.error("The resource prefix '%s' is unhandled.", prefix)
+            unhandled.append(prefix)
     transform_metanetx_prefix(df)
     del df["xref"]
+    if statistics is not None:
+        collect_statistics(
+            statistics, df, ["prefix", "identifier"], num_missing, unhandled
+        )
     logger.debug(df.head())
     return df
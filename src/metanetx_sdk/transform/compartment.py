@@ -17,10 +17,13 @@
 
 
 import logging
-from typing import Mapping
+from typing import Mapping, Optional
 
 import pandas as pd
 
+from ..model import TransformStatisticsModel
+from .statistics import collect_statistics
+
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +47,9 @@ def transform_cell_type_ontology_prefix(table: pd.DataFrame):
 
 
 def transform_compartment_properties(
-    compartments: pd.DataFrame, prefix_mapping: Mapping
+    compartments: pd.DataFrame,
+    prefix_mapping: Mapping,
+    statistics: Optional[TransformStatisticsModel] = None,
 ) -> pd.DataFrame:
     """Transform the MetaNetX compartment properties."""
     df = compartments.copy()
@@ -67,19 +72,25 @@ def transform_compartment_properties(
         logger.debug("Transforming Cell Type Ontology terms.")
         transform_cell_type_ontology_prefix(df)
         namespaces.remove("cl")
+    unhandled = []
     # Map all source databases to MIRIAM compliant versions.
     for prefix in namespaces:
         if prefix in prefix_mapping:
             df.loc[df["prefix"] == prefix, "prefix"] = prefix_mapping[prefix]
         else:
             logger.error("The resource prefix '%s' is unhandled.", prefix)
+            unhandled.append(prefix)
     del df["source"]
+    if statistics is not None:
+        collect_statistics(statistics, df, ["mnx_id"], num_missing, unhandled)
     logger.debug(df.head())
     return df
 
 
 def transform_compartment_cross_references(
-    references: pd.DataFrame, prefix_mapping: Mapping
+    references: pd.DataFrame,
+    prefix_mapping: Mapping,
+    statistics: Optional[TransformStatisticsModel] = None,
 ) -> pd.DataFrame:
     """Transform the MetaNetX compartment cross-references."""
     df = references.copy()
@@ -102,12 +113,18 @@ def transform_compartment_cross_references(
         logger.debug("Transforming Cell Type Ontology terms.")
         transform_cell_type_ontology_prefix(df)
         namespaces.remove("cl")
+    unhandled = []
     # Map all xref databases to MIRIAM compliant versions.
     for prefix in namespaces:
         if prefix in prefix_mapping:
             df.loc[df["prefix"] == prefix, "prefix"] = prefix_mapping[prefix]
         else:
             logger.error("The resource prefix '%s' is unhandled.", prefix)
+            unhandled.append(prefix)
     del df["xref"]
+    if statistics is not None:
+        collect_statistics(
+            statistics, df, ["prefix", "identifier"], num_missing, unhandled
+        )
     logger.debug(df.head())
     return df
@@ -0,0 +1,187 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide deprecated identifier transformation functions."""
+
+
+import logging
+
+import numpy as np
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+
+def _find_cyclic_nodes(
+    sources: np.ndarray, targets: np.ndarray, size: int
+) -> np.ndarray:
+    """Return a mask of the nodes that are part of or lead into cycles."""
+    alive = np.ones(len(sources), dtype=bool)
+    while alive.any():
+        has_successors = np.zeros(size, dtype=bool)
+        has_successors[sources[alive]] = True
+        is_blocked = np.zeros(size, dtype=bool)
+        is_blocked[sources[alive & has_successors[targets]]] = True
+        resolvable = alive & ~is_blocked[sources]
+        if not resolvable.any():
+            break
+        alive &= ~resolvable
+    cyclic = np.zeros(size, dtype=bool)
+    cyclic[sources[alive]] = True
+    return cyclic
+
+
+def find_deprecation_cycles(edges: pd.DataFrame) -> pd.Index:
+    """
+    Find deprecated identifiers whose deprecation chains never end.
+
+    Identifiers whose successors are all current, or themselves resolved, are
+    peeled off iteratively. Whatever remains is part of a cycle or leads into one.
+
+    Parameters
+    ----------
+    edges : pandas.DataFrame
+        A table with the columns ``deprecated_id`` and ``current_id``.
+
+    Returns
+    -------
+    pandas.Index
+        The deprecated identifiers that cannot be resolved.
+
+    """
+    codes, identifiers = pd.factorize(
+        pd.concat([edges["deprecated_id"], edges["current_id"]], ignore_index=True)
+    )
+    cyclic = _find_cyclic_nodes(
+        codes[: len(edges)], codes[len(edges) :], len(identifiers)
+    )
+    return identifiers[cyclic]
+
+
+def transform_deprecated_identifiers(deprecated: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compress the MetaNetX deprecation chains into direct mappings.
+
+    An identifier may have been deprecated repeatedly over several releases. The
+    chains are followed once for all identifiers at the same time such that every
+    deprecated identifier maps directly to its current identifiers. Identifiers
+    that were split map to more than one current identifier.
+
+    Parameters
+    ----------
+    deprecated : pandas.DataFrame
+        A MetaNetX table of deprecated identifiers.
+
+    Returns
+    -------
+    pandas.DataFrame
+        A table with the columns ``deprecated_id``, ``current_id``, ``version``,
+        and ``hops``. The version is that of the first deprecation and the hops
+        count the number of deprecations between the two identifiers.
+        Identifiers that are part of a deprecation cycle are omitted.
+
+    """
+    edges = deprecated[["deprecated_id", "current_id", "version"]].dropna(
+        subset=["deprecated_id", "current_id"]
+    )
+    # All further work happens on integer codes rather than identifier strings.
+    codes, identifiers = pd.factorize(
+        pd.concat([edges["deprecated_id"], edges["current_id"]], ignore_index=True)
+    )
+    edges = pd.DataFrame(
+        {
+            "deprecated_id": codes[: len(edges)],
+            "current_id": codes[len(edges) :],
+            "version": edges["version"].values,
+        }
+    )
+    self_loops = edges["deprecated_id"] == edges["current_id"]
+    if (num_loops := self_loops.sum()) > 0:
+        logger.warning("Ignoring %d identifiers deprecated by themselves.", num_loops)
+        edges = edges.loc[~self_loops]
+    edges = edges.drop_duplicates(["deprecated_id", "current_id"])
+    cyclic = _find_cyclic_nodes(
+        edges["deprecated_id"].values, edges["current_id"].values, len(identifiers)
+    )
+    if (num_cyclic := cyclic.sum()) > 0:
+        logger.error(
+            "There are %d identifiers whose deprecation chains contain cycles.",
+            num_cyclic,
+        )
+        edges = edges.loc[~cyclic[edges["deprecated_id"].values]]
+    is_deprecated = np.zeros(len(identifiers), dtype=bool)
+    is_deprecated[edges["deprecated_id"].values] = True
+    steps = edges[["deprecated_id", "current_id"]].rename(
+        columns={"deprecated_id": "current_id", "current_id": "next_id"}
+    )
+    closure = edges.assign(hops=1)
+    # Since cycles are removed, this terminates after the longest chain length.
+    while (pending := is_deprecated[closure["current_id"].values]).any():
+        advanced = (
+            closure.loc[pending]
+            .merge(steps, on="current_id", how="inner", sort=False)
+            .drop(columns="current_id")
+            .rename(columns={"next_id": "current_id"})
+        )
+        advanced["hops"] += 1
+        closure = pd.concat(
+            [closure.loc[~pending], advanced], ignore_index=True
+        ).drop_duplicates(["deprecated_id", "current_id"])
+    closure = pd.DataFrame(
+        {
+            "deprecated_id": identifiers.take(closure["deprecated_id"].values),
+            "current_id": identifiers.take(closure["current_id"].values),
+            "version": closure["version"].values,
+            "hops": closure["hops"].values,
+        }
+    ).sort_values(["deprecated_id", "current_id"], ignore_index=True)
+    logger.debug(closure.head())
+    return closure
+
+
+def resolve_deprecated_identifiers(
+    identifiers: pd.Series, deprecations: pd.DataFrame
+) -> pd.Series:
+    """
+    Replace deprecated identifiers with their current identifiers in one pass.
+
+    Parameters
+    ----------
+    identifiers : pandas.Series
+        Any MetaNetX identifiers, deprecated or current.
+    deprecations : pandas.DataFrame
+        Direct mappings as generated by `transform_deprecated_identifiers`.
+
+    Returns
+    -------
+    pandas.Series
+        The current identifiers aligned with the given ones. Identifiers that are
+        not deprecated are returned unchanged. Identifiers that were split into
+        more than one current identifier cannot be resolved and are missing.
+
+    """
+    is_split = deprecations["deprecated_id"].duplicated(keep=False)
+    unique = deprecations.loc[~is_split]
+    lookup = pd.Series(unique["current_id"].values, index=unique["deprecated_id"])
+    result = identifiers.map(lookup).fillna(identifiers)
+    ambiguous = identifiers.isin(deprecations.loc[is_split, "deprecated_id"])
+    if (num_ambiguous := ambiguous.sum()) > 0:
+        logger.warning(
+            "There are %d identifiers with more than one current identifier.",
+            num_ambiguous,
+        )
+        result.loc[ambiguous] = None
+    return result
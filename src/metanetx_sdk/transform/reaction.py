@@ -17,10 +17,13 @@
 
 
 import logging
-from typing import Mapping
+from typing import Mapping, Optional
 
 import pandas as pd
 
+from ..model import TransformStatisticsModel
+from .statistics import collect_statistics
+
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +38,9 @@ def transform_metanetx_prefix(table: pd.DataFrame):
 
 
 def transform_reaction_properties(
-    reactions: pd.DataFrame, prefix_mapping: Mapping
+    reactions: pd.DataFrame,
+    prefix_mapping: Mapping,
+    statistics: Optional[TransformStatisticsModel] = None,
 ) -> pd.DataFrame:
     """Transform the MetaNetX reaction properties."""
     df = reactions.copy()
@@ -44,19 +49,25 @@ def transform_reaction_properties(
     df[["prefix", "identifier"]] = df["source"].str.split(":", n=1, expand=True)
     if (num_missing := df["identifier"].isnull().sum()) > 0:
         logger.error("There are %d entries without a namespace prefix.", num_missing)
+    unhandled = []
     # Map all source databases to MIRIAM compliant versions.
     for prefix in df.loc[df["identifier"].notnull(), "prefix"].unique():
         if prefix in prefix_mapping:
             df.loc[df["prefix"] == prefix, "prefix"] = prefix_mapping[prefix]
         else:
             logger.error("The resource prefix '%s' is unhandled.", prefix)
+            unhandled.append(prefix)
     del df["source"]
+    if statistics is not None:
+        collect_statistics(statistics, df, ["mnx_id"], num_missing, unhandled)
     logger.debug(df.head())
     return df
 
 
 def transform_reaction_cross_references(
-    references: pd.DataFrame, prefix_mapping: Mapping
+    references: pd.DataFrame,
+    prefix_mapping: Mapping,
+    statistics: Optional[TransformStatisticsModel] = None,
 ) -> pd.DataFrame:
     """Transform the MetaNetX reaction cross-references."""
     df = references.copy()
@@ -69,13 +80,19 @@ def transform_reaction_cross_references(
             "'metanetx.reaction'.",
             num_missing,
         )
+    unhandled = []
     # Map all xref databases to MIRIAM compliant versions.
     for prefix in df.loc[df["identifier"].notnull(), "prefix"].unique():
         if prefix in prefix_mapping:
             df.loc[df["prefix"] == prefix, "prefix"] = prefix_mapping[prefix]
         else:
             logger.error("The resource prefix '%s' is unhandled.", prefix)
+            unhandled.append(prefix)
     transform_metanetx_prefix(df)
     del df["xref"]
+    if statistics is not None:
+        collect_statistics(
+            statistics, df, ["prefix", "identifier"], num_missing, unhandled
+        )
     logger.debug(df.head())
     return df
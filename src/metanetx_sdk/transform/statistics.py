@@ -0,0 +1,71 @@
+# Copyright (c) 2019, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide the collection of statistics on transformed tables."""
+
+
+import logging
+from typing import Iterable, List
+
+import pandas as pd
+
+from ..model import TransformStatisticsModel
+
+
+logger = logging.getLogger(__name__)
+
+
+def collect_statistics(
+    statistics: TransformStatisticsModel,
+    table: pd.DataFrame,
+    keys: List[str],
+    num_missing_prefix: int,
+    unhandled_prefixes: Iterable[str],
+) -> None:
+    """
+    Record statistics of a transformed table in place.
+
+    Parameters
+    ----------
+    statistics : metanetx_sdk.model.TransformStatisticsModel
+        The model to update.
+    table : pandas.DataFrame
+        The transformed table with the columns ``prefix`` and ``identifier``. Rows
+        without an identifier have no namespace prefix and are not counted per
+        prefix.
+    keys : list of str
+        The columns that identify a row. Rows that repeat the keys of an earlier row
+        are counted as duplicates.
+    num_missing_prefix : int
+        The number of entries without a namespace prefix as counted by the
+        transformation.
+    unhandled_prefixes : iterable of str
+        The prefixes without a mapping to an Identifiers.org registry.
+
+    """
+    statistics.num_rows = len(table)
+    statistics.num_missing_prefix = int(num_missing_prefix)
+    statistics.num_duplicates = int(table.duplicated(keys).sum())
+    statistics.prefix_counts = {
+        prefix: int(count)
+        for prefix, count in table.loc[table["identifier"].notnull(), "prefix"]
+        .value_counts(sort=False)
+        .items()
+    }
+    statistics.unhandled_prefixes = sorted(unhandled_prefixes)
+    statistics.missing_values = {
+        column: int(count) for column, count in table.isnull().sum().items()
+    }
+    logger.debug(statistics)
@@ -0,0 +1,148 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide translation of identifiers between namespaces via MetaNetX."""
+
+
+import gzip
+import logging
+from pathlib import Path
+from typing import Optional, Union
+
+import pandas as pd
+
+from .index import BloomFilter, IdentifierIndex, MappedIdentifierIndex
+
+
+logger = logging.getLogger(__name__)
+
+
+Index = Union[IdentifierIndex, MappedIdentifierIndex]
+
+
+def translate_identifiers(
+    identifiers: pd.Series,
+    index: Index,
+    source: str,
+    target: str,
+    bloom_filter: Optional[BloomFilter] = None,
+) -> pd.DataFrame:
+    """
+    Translate identifiers from one namespace to another in a single batch.
+
+    Each distinct identifier is resolved only once. The translations are then
+    joined back onto the given identifiers.
+
+    Parameters
+    ----------
+    identifiers : pandas.Series
+        Identifiers in the source namespace.
+    index : IdentifierIndex or MappedIdentifierIndex
+        An index of cross-references.
+    source : str
+        The Identifiers.org prefix of the given identifiers, for example,
+        bigg.metabolite.
+    target : str
+        The Identifiers.org prefix to translate to, for example, kegg.compound.
+    bloom_filter : BloomFilter, optional
+        Filters of the indexed cross-references that reject most unknown
+        identifiers before they probe the index.
+
+    Returns
+    -------
+    pandas.DataFrame
+        A table with the columns ``source``, ``mnx_id``, and ``target`` in the
+        order of the given identifiers. Identifiers with more than one translation
+        occur in multiple rows. Missing values denote identifiers that are unknown
+        to MetaNetX or that have no cross-reference in the target namespace.
+
+    """
+    forward = index.resolve_many(
+        source, identifiers.dropna().unique(), bloom_filter=bloom_filter
+    )
+    backward = index.cross_references(forward["mnx_id"].unique(), prefix=target)
+    mapping = forward.rename(columns={"identifier": "source"}).merge(
+        backward[["mnx_id", "identifier"]].rename(columns={"identifier": "target"}),
+        on="mnx_id",
+        how="left",
+        sort=False,
+    )
+    return pd.DataFrame({"source": identifiers.values}).merge(
+        mapping, on="source", how="left", sort=False
+    )
+
+
+def translate_file(
+    input_file: Path,
+    output_file: Path,
+    index: Index,
+    source: str,
+    target: str,
+    chunksize: int = 1_000_000,
+    bloom_filter: Optional[BloomFilter] = None,
+) -> None:
+    """
+    Translate a file of identifiers from one namespace to another.
+
+    The input is streamed in chunks such that memory usage does not grow with the
+    size of the input file.
+
+    Parameters
+    ----------
+    input_file : pathlib.Path
+        A file with one identifier per line. Only the first tab-separated column is
+        considered. May be gzip compressed.
+    output_file : pathlib.Path
+        A tab-separated file with the columns ``source``, ``mnx_id``, and
+        ``target``. Compressed if the file name ends with ``.gz``.
+    index : IdentifierIndex or MappedIdentifierIndex
+        An index of cross-references.
+    source : str
+        The Identifiers.org prefix of the given identifiers.
+    target : str
+        The Identifiers.org prefix to translate to.
+    chunksize : int, optional
+        The number of identifiers that are translated at a time (default 1,000,000).
+    bloom_filter : BloomFilter, optional
+        Filters of the indexed cross-references that reject most unknown
+        identifiers before they probe the index.
+
+    """
+    if output_file.suffix == ".gz":
+        handle = gzip.open(output_file, "wt", newline="")
+    else:
+        handle = output_file.open("w", newline="")
+    num_identifiers = 0
+    num_translated = 0
+    with handle:
+        for chunk in pd.read_csv(
+            input_file,
+            sep="\t",
+            header=None,
+            usecols=[0],
+            names=["source"],
+            dtype=str,
+            chunksize=chunksize,
+        ):
+            result = translate_identifiers(
+                chunk["source"], index, source, target, bloom_filter=bloom_filter
+            )
+            result.to_csv(handle, sep="\t", index=False, header=num_identifiers == 0)
+            num_identifiers += len(chunk)
+            num_translated += result["target"].notnull().sum()
+            logger.debug("Translated %d identifiers.", num_identifiers)
+    logger.info(
+        "Wrote %d translations of %d identifiers.", num_translated, num_identifiers
+    )
@@ -0,0 +1,107 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Provide column-wise validation of extracted tables."""
+
+
+import logging
+from typing import Iterable, List
+
+import pandas as pd
+
+from .model import ValidationResultModel, ValidationRuleModel
+
+
+logger = logging.getLogger(__name__)
+
+
+def find_violations(series: pd.Series, rule: ValidationRuleModel) -> pd.Series:
+    """
+    Apply a validation rule to all values of a column at once.
+
+    Parameters
+    ----------
+    series : pandas.Series
+        The table column to validate.
+    rule : metanetx_sdk.model.ValidationRuleModel
+        The rule that every value must satisfy.
+
+    Returns
+    -------
+    pandas.Series
+        A boolean mask that is true for every value violating the rule.
+
+    """
+    present = series.notnull()
+    if rule.check == "pattern":
+        valid = series.astype("string").str.fullmatch(rule.pattern).fillna(False)
+    elif rule.check == "flag":
+        valid = series.astype("string").isin(rule.values)
+    else:
+        numbers = pd.to_numeric(series, errors="coerce")
+        valid = numbers.notnull()
+        if rule.check == "integer":
+            valid &= numbers.mod(1) == 0
+    violations = present & ~valid.astype(bool)
+    if not rule.allow_missing:
+        violations |= ~present
+    return violations
+
+
+def validate_table(
+    table: pd.DataFrame, rules: Iterable[ValidationRuleModel], num_samples: int = 5
+) -> List[ValidationResultModel]:
+    """
+    Validate a table with vectorized column rules.
+
+    Parameters
+    ----------
+    table : pandas.DataFrame
+        An extracted MetaNetX table.
+    rules : iterable of metanetx_sdk.model.ValidationRuleModel
+        The rules configured for the table.
+    num_samples : int, optional
+        The maximum number of violating rows to report per rule (default 5).
+
+    Returns
+    -------
+    list of metanetx_sdk.model.ValidationResultModel
+        The number of violations and a sample of violating rows for each rule.
+
+    """
+    results = []
+    for rule in rules:
+        violations = find_violations(table[rule.column], rule)
+        results.append(
+            ValidationResultModel(
+                rule=rule,
+                violations=violations.sum(),
+                samples=table.loc[violations].head(num_samples).to_dict("records"),
+            )
+        )
+    return results
+
+
+def log_validation(results: Iterable[ValidationResultModel]) -> None:
+    """Log the outcome of validating a table."""
+    for result in results:
+        if result.violations == 0:
+            logger.debug("Rule '%s' is satisfied.", result.rule.name)
+            continue
+        logger.warning(
+            "Rule '%s' is violated by %d rows.", result.rule.name, result.violations
+        )
+        for row in result.samples:
+            logger.debug("%r", row)
@@ -0,0 +1,73 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected outcomes of checking reaction balance."""
+
+
+from typing import Tuple
+
+import pandas as pd
+import pytest
+
+from metanetx_sdk.analysis import ElementMatrix, StoichiometricMatrix, check_balance
+
+
+@pytest.fixture(scope="module")
+def balance() -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Provide the balance of a few reactions."""
+    matrix = StoichiometricMatrix.from_equations(
+        pd.Series(
+            {
+                "MNXR1": "1 MNXM3@MNXD1 + 1 MNXM1@MNXD1 = 1 MNXM4@MNXD1",
+                "MNXR2": "1 MNXM3@MNXD1 = 1 MNXM4@MNXD1",
+                "MNXR3": "1 MNXM2@MNXD1 = 1 MNXM2@MNXD2",
+                "MNXR4": "2 MNXM5@MNXD1 + 1 MNXM6@MNXD1 = 2 MNXM2@MNXD1",
+                "MNXR5": "1 MNXM9@MNXD1 = 1 MNXM2@MNXD1",
+            }
+        )
+    )
+    chemicals = pd.DataFrame(
+        {
+            "formula": ["H", "H2O", "C2H3O2", "C2H4O2", "H2", "O2", "(X)n"],
+            "charge": ["1", "0", "-1", "0", "0", "0", None],
+        },
+        index=["MNXM1", "MNXM2", "MNXM3", "MNXM4", "MNXM5", "MNXM6", "MNXM9"],
+    )
+    return check_balance(
+        matrix, ElementMatrix.from_formulae(chemicals["formula"]), chemicals["charge"]
+    )
+
+
+def test_summary(balance: Tuple[pd.DataFrame, pd.DataFrame]):
+    """Expect that balance is determined only for reactions with known chemicals."""
+    summary, _ = balance
+    summary = summary.set_index("mnx_id")
+    assert summary["is_balanced"].tolist() == ["B", "U", "B", "B", None]
+    assert not summary.at["MNXR2", "is_element_balanced"]
+    assert not summary.at["MNXR2", "is_charge_balanced"]
+    assert summary.at["MNXR4", "is_element_balanced"]
+    assert summary.at["MNXR2", "charge_residual"] == 1
+    assert summary.at["MNXR5", "num_unknown"] == 1
+    assert pd.isna(summary.at["MNXR5", "is_element_balanced"])
+
+
+def test_residuals(balance: Tuple[pd.DataFrame, pd.DataFrame]):
+    """Expect residuals of unbalanced elements of known reactions only."""
+    _, residuals = balance
+    assert residuals.to_dict("list") == {
+        "mnx_id": ["MNXR2"],
+        "element": ["H"],
+        "residual": [1.0],
+    }
@@ -0,0 +1,96 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected outcomes of clustering cross-references."""
+
+
+import logging
+
+import numpy as np
+import pandas as pd
+
+from metanetx_sdk.analysis import find_clusters, label_components
+
+
+def test_label_components():
+    """Expect each node to be labeled by the smallest node of its component."""
+    labels = label_components(np.array([4, 3, 1, 6]), np.array([3, 2, 0, 6]), 7)
+    assert labels.tolist() == [0, 0, 2, 2, 2, 5, 6]
+
+
+def test_label_components_star(caplog):
+    """Expect a large star to be merged in a constant number of rounds."""
+    num_leaves = 10_000
+    with caplog.at_level(logging.DEBUG, logger="metanetx_sdk.analysis.cluster"):
+        labels = label_components(
+            np.arange(num_leaves), np.full(num_leaves, num_leaves), num_leaves + 1
+        )
+    assert (labels == 0).all()
+    assert "Labeled components in 2 rounds." in caplog.messages
+
+
+def test_label_components_chain():
+    """Expect a long chain to be labeled by its smallest node."""
+    nodes = np.arange(10_000)
+    labels = label_components(nodes[1:], nodes[:-1], len(nodes))
+    assert (labels == 0).all()
+
+
+def test_find_clusters():
+    """Expect clusters ordered by size and the ambiguous identifiers."""
+    cross_references = pd.DataFrame(
+        {
+            "mnx_id": ["MNXM1", "MNXM1", "MNXM2", "MNXM2", "MNXM3", "MNXM3", "MNXM4"],
+            "prefix": [
+                "metanetx.chemical",
+                "chebi",
+                "chebi",
+                "kegg.compound",
+                "kegg.compound",
+                "kegg.compound",
+                "chebi",
+            ],
+            "identifier": [
+                "MNXM1",
+                "CHEBI:15377",
+                "CHEBI:15377",
+                "C00001",
+                "C00001",
+                "C00001",
+                "CHEBI:16236",
+            ],
+        }
+    )
+    clusters, ambiguous = find_clusters(cross_references)
+    assert clusters["mnx_id"].tolist() == ["MNXM1", "MNXM2", "MNXM3", "MNXM4"]
+    assert clusters["cluster"].tolist() == [0, 0, 0, 1]
+    assert clusters["num_mnx_ids"].tolist() == [3, 3, 3, 1]
+    assert clusters["num_identifiers"].tolist() == [2, 2, 2, 1]
+    assert ambiguous.to_dict("records") == [
+        {
+            "prefix": "chebi",
+            "identifier": "CHEBI:15377",
+            "num_mnx_ids": 2,
+            "mnx_ids": "MNXM1;MNXM2",
+            "cluster": 0,
+        },
+        {
+            "prefix": "kegg.compound",
+            "identifier": "C00001",
+            "num_mnx_ids": 2,
+            "mnx_ids": "MNXM2;MNXM3",
+            "cluster": 0,
+        },
+    ]
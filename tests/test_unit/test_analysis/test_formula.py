@@ -0,0 +1,87 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected outcomes of parsing chemical formulae."""
+
+
+import pandas as pd
+import pytest
+
+from metanetx_sdk.analysis import ElementMatrix
+
+
+@pytest.fixture(scope="module")
+def matrix() -> ElementMatrix:
+    """Provide the element counts of a few formulae."""
+    return ElementMatrix.from_formulae(
+        pd.Series(
+            {
+                "MNXM1": "C6H12O6",
+                "MNXM2": "H2O",
+                "MNXM3": "CH3COOH",
+                "MNXM4": "(C6H10O5)n",
+                "MNXM5": None,
+                "MNXM6": "C2H4O2",
+                "MNXM7": "C5H10NO2R",
+                "MNXM8": "Xy2",
+                "MNXM9": "H2O",
+            }
+        )
+    )
+
+
+def test_validity(matrix: ElementMatrix):
+    """Expect that other notations and unknown elements are invalid."""
+    assert matrix.valid.tolist() == [
+        True,
+        True,
+        True,
+        False,
+        False,
+        True,
+        True,
+        False,
+        True,
+    ]
+
+
+def test_to_frame(matrix: ElementMatrix):
+    """Expect that repeated elements are summed."""
+    frame = matrix.to_frame()
+    assert frame.columns.tolist() == ["H", "C", "N", "O", "R"]
+    assert frame.loc["MNXM3"].tolist() == frame.loc["MNXM6"].tolist() == [4, 2, 0, 2, 0]
+    assert frame.loc["MNXM9"].tolist() == [2, 0, 0, 1, 0]
+
+
+def test_filters(matrix: ElementMatrix):
+    """Expect that formulae are filtered by their elements."""
+    assert matrix.contains(["N"]).sum() == 1
+    assert matrix.consists_of(["C", "H", "O"]).sum() == 5
+    assert matrix.get_counts("C").to_dict() == {
+        "MNXM1": 6,
+        "MNXM2": 0,
+        "MNXM3": 2,
+        "MNXM6": 2,
+        "MNXM7": 5,
+        "MNXM9": 0,
+    }
+
+
+def test_monoisotopic_masses(matrix: ElementMatrix):
+    """Expect masses only for formulae with defined elements."""
+    masses = matrix.monoisotopic_masses()
+    assert masses["MNXM1"] == pytest.approx(180.06339, abs=1e-5)
+    assert masses["MNXM2"] == pytest.approx(18.01056, abs=1e-5)
+    assert masses[["MNXM4", "MNXM5", "MNXM7"]].isnull().all()
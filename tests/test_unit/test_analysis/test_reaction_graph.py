@@ -0,0 +1,92 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected behavior of the reaction graph."""
+
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from metanetx_sdk.analysis import ReactionGraph, StoichiometricMatrix
+
+
+@pytest.fixture(scope="module")
+def matrix() -> StoichiometricMatrix:
+    """Provide a small linear pathway that uses water in every step."""
+    return StoichiometricMatrix.from_equations(
+        pd.Series(
+            {
+                "MNXR1": "1 MNXM1@MNXD1 + 1 WATER@MNXD1 = 1 MNXM2@MNXD1",
+                "MNXR2": "1 MNXM2@MNXD1 + 1 WATER@MNXD1 = 1 MNXM3@MNXD1",
+                "MNXR3": "1 MNXM3@MNXD1 + 1 WATER@MNXD1 = 1 MNXM4@MNXD1",
+                "MNXR4": "1 MNXM4@MNXD1 = 1 MNXM4@MNXD2",
+            }
+        )
+    )
+
+
+@pytest.fixture(scope="module")
+def graph(matrix: StoichiometricMatrix) -> ReactionGraph:
+    """Provide a graph of the pathway."""
+    return ReactionGraph.from_matrix(matrix)
+
+
+def test_adjacency(graph: ReactionGraph):
+    """Expect that edges are found in both directions."""
+    assert graph.get_reactions("WATER@MNXD1") == ["MNXR1", "MNXR2", "MNXR3"]
+    assert graph.get_metabolites("MNXR4") == ["MNXM4@MNXD1", "MNXM4@MNXD2"]
+    assert graph.currency_metabolites(2).tolist() == ["WATER@MNXD1"]
+
+
+def test_neighbors(graph: ReactionGraph):
+    """Expect that currency metabolites can be excluded."""
+    assert graph.neighbors("MNXM1@MNXD1") == ["MNXM2@MNXD1", "WATER@MNXD1"]
+    assert graph.neighbors("MNXM1@MNXD1", max_degree=2) == ["MNXM2@MNXD1"]
+
+
+@pytest.mark.parametrize(
+    "hops, max_degree, expected",
+    [
+        (1, None, {"MNXM1@MNXD1": 0, "MNXM2@MNXD1": 1, "WATER@MNXD1": 1}),
+        (
+            2,
+            None,
+            {
+                "MNXM1@MNXD1": 0,
+                "MNXM2@MNXD1": 1,
+                "WATER@MNXD1": 1,
+                "MNXM3@MNXD1": 2,
+                "MNXM4@MNXD1": 2,
+            },
+        ),
+        (2, 2, {"MNXM1@MNXD1": 0, "MNXM2@MNXD1": 1, "MNXM3@MNXD1": 2}),
+    ],
+)
+def test_expand(graph: ReactionGraph, hops: int, max_degree, expected: dict):
+    """Expect breadth-first distances in number of reactions."""
+    result = graph.expand(["MNXM1@MNXD1", "UNKNOWN"], hops=hops, max_degree=max_degree)
+    assert result.set_index("metabolite")["distance"].to_dict() == expected
+
+
+def test_collapse_compartments(matrix: StoichiometricMatrix, tmp_path: Path):
+    """Expect that compartments are merged and survive persistence."""
+    graph = ReactionGraph.from_matrix(matrix, collapse_compartments=True)
+    filename = tmp_path / "graph.npz"
+    graph.save(filename)
+    loaded = ReactionGraph.load(filename)
+    assert loaded.get_metabolites("MNXR4") == ["MNXM4"]
+    assert loaded.get_reactions("MNXM4") == ["MNXR3", "MNXR4"]
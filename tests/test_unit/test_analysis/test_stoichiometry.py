@@ -0,0 +1,81 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected outcomes of parsing reaction equations."""
+
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from metanetx_sdk.analysis import StoichiometricMatrix, parse_equations
+
+
+@pytest.fixture(scope="module")
+def equations() -> pd.Series:
+    """Provide a few MetaNetX reaction equations."""
+    return pd.Series(
+        {
+            "MNXR2": "1 MNXM1@MNXD1 + 2 MNXM2@MNXD1 = 1 MNXM3@MNXD1",
+            "MNXR1": "1 MNXM1@MNXD1 = 1 MNXM1@MNXD2",
+            "MNXR3": "1 MNXM4@MNXD1 + 1 MNXM5@MNXD1 = 1 MNXM4@MNXD1 + 1 MNXM6@MNXD1",
+            "MNXR4": "n MNXM7@MNXD1 = 1 MNXM8@MNXD1",
+            "MNXR5": None,
+        }
+    )
+
+
+def test_parse_equations(equations: pd.Series):
+    """Expect that every numeric term is parsed with its sign."""
+    terms = parse_equations(equations)
+    assert len(terms) == 10
+    mnxr2 = terms.loc[terms["reaction"] == "MNXR2"].set_index("metabolite")
+    assert mnxr2["coefficient"].to_dict() == {
+        "MNXM1@MNXD1": -1.0,
+        "MNXM2@MNXD1": -2.0,
+        "MNXM3@MNXD1": 1.0,
+    }
+
+
+def test_from_equations(equations: pd.Series):
+    """Expect a sorted, compressed matrix without cancelled entries."""
+    matrix = StoichiometricMatrix.from_equations(equations)
+    assert matrix.reactions.tolist() == ["MNXR1", "MNXR2", "MNXR3", "MNXR4"]
+    assert matrix.shape == (4, 8)
+    assert matrix.nnz == 8
+    assert matrix.get_reaction("MNXR3").to_dict() == {
+        "MNXM5@MNXD1": -1.0,
+        "MNXM6@MNXD1": 1.0,
+    }
+    assert matrix.get_reaction("MNXR1").to_dict() == {
+        "MNXM1@MNXD1": -1.0,
+        "MNXM1@MNXD2": 1.0,
+    }
+    assert matrix.compounds()["MNXM1@MNXD2"] == "MNXM1"
+
+
+def test_save_load(equations: pd.Series, tmp_path: Path):
+    """Expect that a loaded matrix is identical."""
+    matrix = StoichiometricMatrix.from_equations(equations)
+    filename = tmp_path / "stoichiometry.npz"
+    matrix.save(filename)
+    loaded = StoichiometricMatrix.load(filename)
+    assert loaded.reactions.equals(matrix.reactions)
+    assert loaded.metabolites.equals(matrix.metabolites)
+    assert np.array_equal(loaded.indptr, matrix.indptr)
+    assert np.array_equal(loaded.indices, matrix.indices)
+    assert np.array_equal(loaded.data, matrix.data)
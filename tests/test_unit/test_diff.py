@@ -0,0 +1,76 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected outcomes of changeset functions."""
+
+
+import pytest
+from pandas import DataFrame
+
+from metanetx_sdk import diff
+
+
+KEYS = ["xref", "mnx_id"]
+
+
+@pytest.fixture(scope="module")
+def previous() -> DataFrame:
+    """Provide a previous version of a cross-references table."""
+    return DataFrame(
+        {
+            "xref": ["chebi:1", "chebi:2", "chebi:3", "chebi:3"],
+            "mnx_id": ["MNXM1", "MNXM2", "MNXM3", "MNXM4"],
+            "description": ["a", "b", "c", "d"],
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def current() -> DataFrame:
+    """Provide a current version of a cross-references table."""
+    return DataFrame(
+        {
+            "xref": ["chebi:1", "chebi:3", "chebi:3", "chebi:5"],
+            "mnx_id": ["MNXM1", "MNXM3", "MNXM4", "MNXM5"],
+            "description": ["a", "c", "dd", "e"],
+        }
+    )
+
+
+def test_diff_tables(previous: DataFrame, current: DataFrame):
+    """Expect that added, removed, and changed rows are detected."""
+    changeset = diff.diff_tables(previous, current, KEYS)
+    assert changeset.added["xref"].tolist() == ["chebi:5"]
+    assert changeset.removed.to_dict("records") == [
+        {"xref": "chebi:2", "mnx_id": "MNXM2"}
+    ]
+    assert changeset.changed["description"].tolist() == ["dd"]
+
+
+def test_diff_tables_duplicate_keys(previous: DataFrame, current: DataFrame):
+    """Expect that non-unique keys are rejected."""
+    with pytest.raises(ValueError, match="uniquely"):
+        diff.diff_tables(previous, current, ["xref"])
+
+
+def test_apply_changeset(previous: DataFrame, current: DataFrame):
+    """Expect that applying a changeset reproduces the current table."""
+    changeset = diff.diff_tables(previous, current, KEYS)
+    result = diff.apply_changeset(previous, changeset, KEYS)
+    assert (
+        result.sort_values(KEYS)
+        .reset_index(drop=True)
+        .equals(current.sort_values(KEYS).reset_index(drop=True))
+    )
@@ -0,0 +1,72 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected outcomes of extracting tables."""
+
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from metanetx_sdk.extract import (
+    convert_string_columns,
+    extract_chemical_prefix_mapping,
+    extract_table,
+)
+from metanetx_sdk.transform import transform_chemical_cross_references
+
+
+@pytest.fixture()
+def xref_file(tmp_path: Path) -> Path:
+    """Provide a raw cross-references table whose text begins in a later chunk."""
+    path = tmp_path / "chem_xref.tsv"
+    path.write_text(
+        "# comment\n"
+        + "chebi:1\tMNXM1\t\n" * 2
+        + "".join(f"kegg.compound:C{i:05d}\tMNXM{i}\tname {i}\n" for i in range(500))
+    )
+    return path
+
+
+@pytest.mark.parametrize("storage", ["python", "pyarrow"])
+def test_string_storage(xref_file: Path, storage: str):
+    """Expect compact string columns through extraction and transformation."""
+    if storage == "pyarrow":
+        pytest.importorskip("pyarrow")
+    columns = ["xref", "mnx_id", "description"]
+    table = extract_table(xref_file, columns, 1, string_storage=storage, chunksize=2)
+    assert (table.dtypes == pd.StringDtype(storage)).all()
+    assert table["description"].isnull().sum() == 2
+    assert (
+        table["mnx_id"].tolist()
+        == extract_table(xref_file, columns, 1)["mnx_id"].tolist()
+    )
+    processed = convert_string_columns(
+        transform_chemical_cross_references(table, extract_chemical_prefix_mapping()),
+        storage,
+        categorical=True,
+    )
+    assert pd.api.types.is_categorical_dtype(processed["prefix"])
+    assert processed["identifier"].dtype == pd.StringDtype(storage)
+
+
+def test_convert_string_columns_copy():
+    """Expect that the given table is left unchanged."""
+    table = pd.DataFrame({"a": ["x", "y"], "b": [1, 2]})
+    converted = convert_string_columns(table, "python")
+    assert table["a"].dtype == object
+    assert converted["a"].dtype == pd.StringDtype("python")
+    assert converted["b"].dtype == table["b"].dtype
@@ -0,0 +1,98 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected outcomes of retrieving files from the FTP server."""
+
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+from pathlib import Path, PurePosixPath
+from typing import List
+
+import pytest
+from pytz import utc
+
+from metanetx_sdk import ftp
+
+
+class FakeClient:
+    """Serve one remote file of a given size in the given blocks."""
+
+    def __init__(self, size: int, blocks: List[bytes]) -> None:
+        """Initialize the fake server's file."""
+        self.size = size
+        self.blocks = blocks
+
+    async def change_directory(self, path: PurePosixPath) -> None:
+        """Ignore directory changes."""
+
+    async def stat(self, path: Path) -> dict:
+        """Describe the remote file."""
+        return {"type": "file", "size": str(self.size), "modify": "20210101000000"}
+
+    @asynccontextmanager
+    async def download_stream(self, path: Path):
+        """Provide a stream of the blocks."""
+        yield self
+
+    async def iter_by_block(self):
+        """Yield the blocks of the file."""
+        for block in self.blocks:
+            yield block
+
+
+@pytest.fixture()
+def local_file(tmp_path: Path) -> Path:
+    """Provide an outdated local file."""
+    path = tmp_path / "chem_prop.tsv"
+    path.write_bytes(b"old")
+    return path
+
+
+def update(client: FakeClient, local_file: Path, monkeypatch) -> None:
+    """Update the local file from the fake server."""
+
+    @asynccontextmanager
+    async def context(*args, **kwargs):
+        yield client
+
+    monkeypatch.setattr(ftp.aioftp.Client, "context", context)
+    asyncio.run(
+        ftp.update_file(
+            "localhost",
+            PurePosixPath("/"),
+            local_file.parent,
+            Path(local_file.name),
+            datetime(2020, 1, 1, tzinfo=utc),
+            utc,
+            compress=False,
+            keep_previous=True,
+        )
+    )
+
+
+def test_update_file(local_file: Path, monkeypatch):
+    """Expect a complete transfer to replace the local file."""
+    update(FakeClient(6, [b"new", b"new"]), local_file, monkeypatch)
+    assert local_file.read_bytes() == b"newnew"
+    assert (local_file.parent / "previous" / local_file.name).read_bytes() == b"old"
+
+
+def test_update_file_incomplete(local_file: Path, monkeypatch):
+    """Expect an incomplete transfer to leave the local file in place."""
+    update(FakeClient(6, [b"new"]), local_file, monkeypatch)
+    assert local_file.read_bytes() == b"old"
+    assert sorted(p.name for p in local_file.parent.iterdir()) == [local_file.name]
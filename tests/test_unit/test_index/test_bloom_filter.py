@@ -0,0 +1,125 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected behavior of the Bloom filters."""
+
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from metanetx_sdk import api
+from metanetx_sdk.index import (
+    BloomFilter,
+    IdentifierIndex,
+    MappedIdentifierIndex,
+    write_identifier_index,
+)
+from metanetx_sdk.server import Resolver
+
+
+@pytest.fixture(scope="module")
+def table() -> pd.DataFrame:
+    """Provide cross-references of two namespaces."""
+    return pd.DataFrame(
+        {
+            "mnx_id": [f"MNXM{i}" for i in range(2000)],
+            "prefix": ["kegg.compound"] * 1000 + ["bigg.metabolite"] * 1000,
+            "identifier": [f"C{i:05d}" for i in range(2000)],
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def bloom_filter(table: pd.DataFrame) -> BloomFilter:
+    """Provide filters with a false-positive rate of one percent."""
+    return BloomFilter.from_tables([table], false_positive_rate=0.01)
+
+
+def test_membership(table: pd.DataFrame, bloom_filter: BloomFilter):
+    """Expect no false negatives and few false positives."""
+    kegg = table.loc[table["prefix"] == "kegg.compound", "identifier"]
+    assert bloom_filter.might_contain_many("kegg.compound", kegg).all()
+    assert all(bloom_filter.might_contain("kegg.compound", i) for i in kegg)
+    unknown = [f"X{i:05d}" for i in range(10000)]
+    rate = bloom_filter.might_contain_many("kegg.compound", unknown).mean()
+    assert rate < 0.03
+    assert [bloom_filter.might_contain("kegg.compound", i) for i in unknown[:500]] == (
+        bloom_filter.might_contain_many("kegg.compound", unknown[:500]).tolist()
+    )
+    assert not bloom_filter.might_contain("chebi", "C00001")
+
+
+def test_save_load(bloom_filter: BloomFilter, tmp_path: Path):
+    """Expect that a stored filter gives the same answers."""
+    bloom_filter.save(tmp_path / "bloom.npz")
+    loaded = BloomFilter.load(tmp_path / "bloom.npz")
+    assert loaded.prefixes.equals(bloom_filter.prefixes)
+    assert loaded.might_contain("bigg.metabolite", "C01999")
+
+
+def test_resolver(table: pd.DataFrame, bloom_filter: BloomFilter):
+    """Expect that the resolver answers identically with a filter."""
+    resolver = Resolver(IdentifierIndex.from_tables([table]), bloom_filter=bloom_filter)
+    assert resolver.resolve("kegg.compound", ["C00001", "X1"]) == {
+        "C00001": ["MNXM1"],
+        "X1": [],
+    }
+
+
+def test_resolve_many(table: pd.DataFrame, bloom_filter: BloomFilter, tmp_path: Path):
+    """Expect that both indices resolve identically with a filter."""
+    write_identifier_index([table], tmp_path / "index.bin")
+    identifiers = ["C00001", "X1", "C00999", "C01000"]
+    expected = IdentifierIndex.from_tables([table]).resolve_many(
+        "kegg.compound", identifiers
+    )
+    assert expected["mnx_id"].tolist() == ["MNXM1", "MNXM999"]
+    with MappedIdentifierIndex(tmp_path / "index.bin") as mapped:
+        for index in (IdentifierIndex.from_tables([table]), mapped):
+            result = index.resolve_many(
+                "kegg.compound", identifiers, bloom_filter=bloom_filter
+            )
+            assert result.equals(expected)
+
+
+def test_map_identifiers(
+    table: pd.DataFrame, bloom_filter: BloomFilter, tmp_path: Path
+):
+    """Expect that files are translated identically with a filter."""
+    xref_file = tmp_path / "xref.tsv"
+    table.to_csv(xref_file, sep="\t", index=False)
+    bloom_filter.save(tmp_path / "bloom.npz")
+    input_file = tmp_path / "ids.txt"
+    input_file.write_text("C00001\nX1\nC01500\n")
+    api.map_identifiers(
+        input_file,
+        tmp_path / "plain.tsv",
+        "kegg.compound",
+        "bigg.metabolite",
+        xref_files=[xref_file],
+    )
+    api.map_identifiers(
+        input_file,
+        tmp_path / "filtered.tsv",
+        "kegg.compound",
+        "bigg.metabolite",
+        xref_files=[xref_file],
+        bloom_file=tmp_path / "bloom.npz",
+    )
+    assert (tmp_path / "filtered.tsv").read_text() == (
+        tmp_path / "plain.tsv"
+    ).read_text()
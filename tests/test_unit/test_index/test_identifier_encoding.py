@@ -0,0 +1,70 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected behavior of the shared identifier encoding."""
+
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from metanetx_sdk.index import IdentifierEncoding
+
+
+@pytest.fixture(scope="module")
+def tables() -> dict:
+    """Provide a property and a deprecation table."""
+    return {
+        "prop": pd.DataFrame({"mnx_id": ["MNXM2", "MNXM1"], "name": ["b", "a"]}),
+        "depr": pd.DataFrame(
+            {"deprecated_id": ["MNXM3"], "current_id": ["MNXM1"], "hops": [1]}
+        ),
+    }
+
+
+def test_codes(tables: dict):
+    """Expect sorted codes shared by all tables."""
+    encoding = IdentifierEncoding.from_tables(tables.values())
+    assert encoding.identifiers.tolist() == ["MNXM1", "MNXM2", "MNXM3"]
+    prop = encoding.encode_table(tables["prop"])
+    depr = encoding.encode_table(tables["depr"])
+    assert prop["mnx_id"].dtype == np.int32
+    assert prop["mnx_id"].tolist() == [1, 0]
+    assert depr[["deprecated_id", "current_id"]].values.tolist() == [[2, 0]]
+    joined = depr.merge(prop, left_on="current_id", right_on="mnx_id")
+    assert joined["name"].tolist() == ["a"]
+    assert encoding.decode_table(prop).equals(tables["prop"])
+
+
+def test_unknown(tables: dict):
+    """Expect that unknown identifiers are rejected unless explicitly allowed."""
+    encoding = IdentifierEncoding.from_tables([tables["prop"]])
+    codes = encoding.encode(["MNXM1", "MNXM9"])
+    assert codes.tolist() == [0, -1]
+    assert encoding.decode(codes).tolist() == ["MNXM1", None]
+    with pytest.raises(ValueError, match="column 'deprecated_id'"):
+        encoding.encode_table(tables["depr"])
+    depr = encoding.encode_table(tables["depr"], allow_unknown=True)
+    assert depr[["deprecated_id", "current_id"]].values.tolist() == [[-1, 0]]
+
+
+def test_save_load(tables: dict, tmp_path: Path):
+    """Expect that a stored encoding is identical."""
+    encoding = IdentifierEncoding.from_tables(tables.values())
+    encoding.save(tmp_path / "encoding.npz")
+    loaded = IdentifierEncoding.load(tmp_path / "encoding.npz")
+    assert loaded.identifiers.equals(encoding.identifiers)
@@ -0,0 +1,95 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected behavior of the in-memory identifier index."""
+
+
+import pytest
+from pandas import DataFrame
+
+from metanetx_sdk.index import IdentifierIndex
+
+
+@pytest.fixture(scope="module")
+def index() -> IdentifierIndex:
+    """Provide an index over a small cross-references table."""
+    return IdentifierIndex.from_tables(
+        [
+            DataFrame(
+                {
+                    "mnx_id": ["MNXM1", "MNXM2", "MNXM1", "MNXM3", "MNXM1"],
+                    "prefix": [
+                        "kegg.compound",
+                        "kegg.compound",
+                        "chebi",
+                        "chebi",
+                        "chebi",
+                    ],
+                    "identifier": ["C1", "C2", "CHEBI:1", "CHEBI:1", "CHEBI:1"],
+                    "description": ["a", "b", "c", "d", "e"],
+                }
+            ),
+            DataFrame(
+                {
+                    "mnx_id": ["MNXC1"],
+                    "prefix": ["go"],
+                    "identifier": ["GO:1"],
+                    "description": [None],
+                }
+            ),
+        ]
+    )
+
+
+def test_len(index: IdentifierIndex):
+    """Expect that duplicate cross-references are ignored."""
+    assert len(index) == 5
+    assert index.prefixes == ["chebi", "go", "kegg.compound"]
+
+
+@pytest.mark.parametrize(
+    "prefix, identifier, expected",
+    [
+        ("chebi", "CHEBI:1", ["MNXM1", "MNXM3"]),
+        ("kegg.compound", "C2", ["MNXM2"]),
+        ("go", "GO:1", ["MNXC1"]),
+        ("kegg.compound", "C3", []),
+        ("foo", "C1", []),
+    ],
+)
+def test_resolve(index: IdentifierIndex, prefix: str, identifier: str, expected):
+    """Expect the MetaNetX identifiers of a cross-reference."""
+    assert index.resolve(prefix, identifier) == expected
+
+
+def test_resolve_many(index: IdentifierIndex):
+    """Expect mappings in the order of the given identifiers."""
+    result = index.resolve_many("kegg.compound", ["C2", "C3", "C1"])
+    assert result.to_dict("list") == {
+        "identifier": ["C2", "C1"],
+        "mnx_id": ["MNXM2", "MNXM1"],
+    }
+
+
+def test_cross_references(index: IdentifierIndex):
+    """Expect the cross-references of MetaNetX identifiers."""
+    result = index.cross_references(["MNXM1", "MNXM9"])
+    assert result.to_dict("list") == {
+        "mnx_id": ["MNXM1", "MNXM1"],
+        "prefix": ["chebi", "kegg.compound"],
+        "identifier": ["CHEBI:1", "C1"],
+    }
+    result = index.cross_references(["MNXM1"], prefix="chebi")
+    assert result["identifier"].tolist() == ["CHEBI:1"]
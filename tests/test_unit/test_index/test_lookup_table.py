@@ -0,0 +1,72 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected behavior of denormalized lookup tables."""
+
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from metanetx_sdk.index import (
+    LookupTable,
+    build_lookup_table,
+    write_lookup_table,
+)
+
+
+@pytest.fixture(scope="module")
+def table() -> pd.DataFrame:
+    """Provide a small chemical lookup table."""
+    return build_lookup_table(
+        pd.DataFrame(
+            {
+                "mnx_id": ["MNXM2", "MNXM1", "MNXM3", "MNXM1"],
+                "prefix": ["kegg.compound", "kegg.compound", "kegg.compound", "chebi"],
+                "identifier": ["C00001", "C00031", "C00001", "CHEBI:4167"],
+                "description": ["water", "glucose", "H2O", "D-glucose"],
+            }
+        ),
+        pd.DataFrame(
+            {
+                "mnx_id": ["MNXM1", "MNXM2"],
+                "name": ["D-glucose", "water"],
+                "formula": ["C6H12O6", "H2O"],
+            }
+        ),
+        ["name", "formula"],
+    )
+
+
+def test_sorted(table: pd.DataFrame):
+    """Expect rows sorted by prefix and identifier with properties joined."""
+    assert table["identifier"].tolist() == [
+        "CHEBI:4167",
+        "C00001",
+        "C00001",
+        "C00031",
+    ]
+    assert table["formula"].tolist()[:2] == ["C6H12O6", "H2O"]
+    assert pd.isnull(table.at[2, "name"])
+
+
+def test_find(table: pd.DataFrame, tmp_path: Path):
+    """Expect all entries of identifiers in query order after a round trip."""
+    write_lookup_table(table, tmp_path / "chem_lookup.tsv.gz")
+    lookup = LookupTable.from_file(tmp_path / "chem_lookup.tsv.gz")
+    result = lookup.find("kegg.compound", ["C00031", "C99999", "C00001"])
+    assert result["mnx_id"].tolist() == ["MNXM1", "MNXM2", "MNXM3"]
+    assert lookup.find("chebi", ["C00001"]).empty
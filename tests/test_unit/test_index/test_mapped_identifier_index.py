@@ -0,0 +1,89 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected behavior of the memory-mapped identifier index."""
+
+
+from pathlib import Path
+
+import pytest
+from pandas import DataFrame
+
+from metanetx_sdk.index import MappedIdentifierIndex, write_identifier_index
+
+
+@pytest.fixture(scope="module")
+def index(tmp_path_factory) -> MappedIdentifierIndex:
+    """Provide a mapped index over a small cross-references table."""
+    filename = tmp_path_factory.mktemp("index") / "index.bin"
+    write_identifier_index(
+        [
+            DataFrame(
+                {
+                    "mnx_id": ["MNXM1", "MNXM2", "MNXM1", "MNXM3", "MNXC1"],
+                    "prefix": [
+                        "kegg.compound",
+                        "kegg.compound",
+                        "chebi",
+                        "chebi",
+                        "go",
+                    ],
+                    "identifier": ["C1", "C2", "CHEBI:1", "CHEBI:1", "GO:1"],
+                }
+            )
+        ],
+        filename,
+    )
+    with MappedIdentifierIndex(filename) as index:
+        yield index
+
+
+def test_invalid_file(tmp_path: Path):
+    """Expect that other files are rejected."""
+    filename = tmp_path / "foo.bin"
+    filename.write_bytes(b"\x00" * 1024)
+    with pytest.raises(ValueError, match="not an identifier index"):
+        MappedIdentifierIndex(filename)
+
+
+def test_len(index: MappedIdentifierIndex):
+    """Expect the number of cross-references and namespaces."""
+    assert len(index) == 5
+    assert index.prefixes == ["chebi", "go", "kegg.compound"]
+
+
+@pytest.mark.parametrize(
+    "prefix, identifier, expected",
+    [
+        ("chebi", "CHEBI:1", ["MNXM1", "MNXM3"]),
+        ("kegg.compound", "C2", ["MNXM2"]),
+        ("go", "GO:1", ["MNXC1"]),
+        ("kegg.compound", "C3", []),
+        ("foo", "C1", []),
+    ],
+)
+def test_resolve(index: MappedIdentifierIndex, prefix: str, identifier: str, expected):
+    """Expect the MetaNetX identifiers of a cross-reference."""
+    assert index.resolve(prefix, identifier) == expected
+
+
+def test_cross_references(index: MappedIdentifierIndex):
+    """Expect the cross-references of MetaNetX identifiers."""
+    result = index.cross_references(["MNXM1", "MNXM9"])
+    assert result.to_dict("list") == {
+        "mnx_id": ["MNXM1", "MNXM1"],
+        "prefix": ["chebi", "kegg.compound"],
+        "identifier": ["CHEBI:1", "C1"],
+    }
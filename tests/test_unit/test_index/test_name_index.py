@@ -0,0 +1,111 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected behavior of the name search index."""
+
+
+from pathlib import Path
+
+import pytest
+from pandas import DataFrame
+
+from metanetx_sdk.index import NameIndex
+
+
+@pytest.fixture(scope="module")
+def index() -> NameIndex:
+    """Provide an index over a few names and synonyms."""
+    return NameIndex.from_tables(
+        [
+            DataFrame(
+                {
+                    "mnx_id": ["MNXM1", "MNXM2", "MNXM3"],
+                    "name": ["ATP", "D-glucose", "L-glutamate"],
+                }
+            )
+        ],
+        [
+            DataFrame(
+                {
+                    "mnx_id": ["MNXM1", "MNXM2", "MNXM4"],
+                    "description": [
+                        "adenosine 5'-triphosphate||ATP",
+                        "glucose||dextrose",
+                        None,
+                    ],
+                }
+            )
+        ],
+    )
+
+
+def test_len(index: NameIndex):
+    """Expect that normalized names are counted once."""
+    assert len(index) == 6
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("atp", "MNXM1"),
+        ("Adenosine triphosphate", "MNXM1"),
+        ("glucos", "MNXM2"),
+        ("dextrose", "MNXM2"),
+        ("L glutamate", "MNXM3"),
+    ],
+)
+def test_search(index: NameIndex, query: str, expected: str):
+    """Expect that the best match is ranked first."""
+    result = index.search(query)
+    assert result.at[0, "mnx_id"] == expected
+
+
+def test_search_exact(index: NameIndex):
+    """Expect that an exact match scores one."""
+    result = index.search("D-Glucose")
+    assert result.at[0, "name"] == "D-glucose"
+    assert result.at[0, "score"] == 1.0
+
+
+def test_search_miss(index: NameIndex):
+    """Expect that dissimilar names are not reported."""
+    assert len(index.search("pyruvate")) == 0
+
+
+def test_prefix_search(index: NameIndex):
+    """Expect that names are found by their beginning in alphabetical order."""
+    result = index.prefix_search("gl")
+    assert result["name"].tolist() == ["glucose"]
+    assert index.prefix_search("D-gl")["name"].tolist() == ["D-glucose"]
+
+
+def test_save_load(index: NameIndex, tmp_path: Path):
+    """Expect that a loaded index gives the same results."""
+    filename = tmp_path / "names.npz"
+    index.save(filename)
+    loaded = NameIndex.load(filename)
+    assert len(loaded) == len(index)
+    assert loaded.search("dextrose").equals(index.search("dextrose"))
+
+
+def test_save_load_empty(tmp_path: Path):
+    """Expect that an empty index stays empty when loaded."""
+    filename = tmp_path / "names.npz"
+    NameIndex.from_tables(
+        [DataFrame({"mnx_id": [], "name": []}, dtype=object)], []
+    ).save(filename)
+    loaded = NameIndex.load(filename)
+    assert len(loaded) == 0
+    assert loaded.search("atp").empty
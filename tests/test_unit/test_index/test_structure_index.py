@@ -0,0 +1,73 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected behavior of the structure index."""
+
+
+import pytest
+from pandas import DataFrame
+
+from metanetx_sdk.index import StructureIndex
+
+
+@pytest.fixture(scope="module")
+def index() -> StructureIndex:
+    """Provide an index over a few chemicals."""
+    return StructureIndex(
+        DataFrame(
+            {
+                "mnx_id": ["MNXM1", "MNXM2", "MNXM3", "MNXM4"],
+                "inchi_key": [
+                    "WQZGKKKJIJFFOK-GASJEMHNSA-N",
+                    "WQZGKKKJIJFFOK-DVKNGEFBSA-N",
+                    "XLYOFNOQVPJJNP-UHFFFAOYSA-N",
+                    None,
+                ],
+                "formula": ["C6H12O6", "C6H12O6", "H2O", "C3H4O3"],
+                "mass": [180.06339, 180.06339, 18.01056, 88.01604],
+            }
+        )
+    )
+
+
+def test_find_inchi_keys(index: StructureIndex):
+    """Expect that full InChIKeys match exactly."""
+    result = index.find_inchi_keys(
+        ["XLYOFNOQVPJJNP-UHFFFAOYSA-N", "WQZGKKKJIJFFOK-GASJEMHNSA-N", "FOO"]
+    )
+    assert result["mnx_id"].tolist() == ["MNXM3", "MNXM1"]
+
+
+def test_find_inchi_key_skeletons(index: StructureIndex):
+    """Expect that skeletons match all stereoisomers."""
+    result = index.find_inchi_keys(["WQZGKKKJIJFFOK-AAAAAAAAAA-N"], skeleton=True)
+    assert result["query"].unique().tolist() == ["WQZGKKKJIJFFOK-AAAAAAAAAA-N"]
+    assert sorted(result["mnx_id"]) == ["MNXM1", "MNXM2"]
+
+
+@pytest.mark.parametrize(
+    "masses, tolerance, ppm, expected",
+    [
+        ([18.0106], 5.0, True, ["MNXM3"]),
+        ([18.0110], 5.0, True, []),
+        ([18.0110], 0.001, False, ["MNXM3"]),
+        ([88.016, 180.0634], 5.0, True, ["MNXM4", "MNXM1", "MNXM2"]),
+    ],
+)
+def test_find_masses(index: StructureIndex, masses, tolerance, ppm, expected):
+    """Expect that all chemicals within each mass window are found."""
+    result = index.find_masses(masses, tolerance=tolerance, ppm=ppm)
+    assert result["mnx_id"].tolist() == expected
+    assert (result["error_ppm"].abs() <= 56).all()
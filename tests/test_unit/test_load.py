@@ -0,0 +1,123 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected outcomes of loading functions."""
+
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+from pandas import DataFrame
+
+from metanetx_sdk import load
+
+
+@pytest.fixture()
+def tables(tmp_path: Path) -> dict:
+    """Provide transformed table files."""
+    prop = tmp_path / "chem_prop.tsv.gz"
+    DataFrame(
+        {
+            "mnx_id": ["MNXM1", "MNXM2", "MNXM3"],
+            "charge": [0, None, -1],
+            "inchi_key": ["A", None, "C"],
+        }
+    ).to_csv(prop, sep="\t", index=False)
+    xref = tmp_path / "chem_xref.tsv.gz"
+    DataFrame(
+        {
+            "mnx_id": ["MNXM1", "MNXM2"],
+            "prefix": ["chebi", "kegg.compound"],
+            "identifier": ["1", "C00002"],
+        }
+    ).to_csv(xref, sep="\t", index=False)
+    return {"chem_prop": prop, "chem_xref": xref}
+
+
+def test_load_sqlite(tables: dict, tmp_path: Path):
+    """Expect that tables are loaded with missing values and indexes."""
+    database = tmp_path / "metanetx.sqlite"
+    load.load_sqlite(tables, database, chunksize=2)
+    with sqlite3.connect(str(database)) as connection:
+        assert connection.execute(
+            "SELECT mnx_id, charge, inchi_key FROM chem_prop ORDER BY mnx_id"
+        ).fetchall() == [("MNXM1", 0, "A"), ("MNXM2", None, None), ("MNXM3", -1, "C")]
+        assert connection.execute(
+            "SELECT mnx_id FROM chem_xref WHERE prefix = ? AND identifier = ?",
+            ("kegg.compound", "C00002"),
+        ).fetchall() == [("MNXM2",)]
+        indexes = {
+            row[0]
+            for row in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+    assert indexes == {
+        "ix_chem_prop_mnx_id",
+        "ix_chem_prop_inchi_key",
+        "ix_chem_xref_mnx_id",
+        "ix_chem_xref_prefix_identifier",
+    }
+
+
+def test_load_sqlite_existing_rollback(tables: dict, tmp_path: Path):
+    """Expect that a failed load leaves an existing database unchanged."""
+    database = tmp_path / "metanetx.sqlite"
+    load.load_sqlite({"chem_prop": tables["chem_prop"]}, database)
+    with pytest.raises(FileNotFoundError):
+        load.load_sqlite(
+            {"chem_prop": tables["chem_xref"], "chem_xref": tmp_path / "missing.tsv"},
+            database,
+        )
+    with sqlite3.connect(str(database)) as connection:
+        assert connection.execute("PRAGMA integrity_check").fetchall() == [("ok",)]
+        assert connection.execute(
+            "SELECT mnx_id FROM chem_prop ORDER BY mnx_id"
+        ).fetchall() == [("MNXM1",), ("MNXM2",), ("MNXM3",)]
+        assert not connection.execute(
+            "SELECT name FROM sqlite_master WHERE name = 'chem_xref'"
+        ).fetchall()
+
+
+@pytest.mark.parametrize(
+    "filename, expected",
+    [
+        ("chem_prop.tsv.gz", "chem_prop"),
+        ("transformed_reac_xref.tsv", "reac_xref"),
+        ("my-table.tsv", "my_table"),
+    ],
+)
+def test_infer_table_name(filename: str, expected: str):
+    """Expect that table names are inferred from file names."""
+    assert load.infer_table_name(Path(filename), ["chem_prop", "reac_xref"]) == expected
+
+
+def test_load_sqlite_identifiers_as_text(tmp_path: Path):
+    """Expect identifiers of later, all-numeric chunks to be stored verbatim."""
+    xref = tmp_path / "chem_xref.tsv"
+    DataFrame(
+        {
+            "mnx_id": ["MNXM1", "MNXM2", "MNXM3", "MNXM4"],
+            "prefix": ["kegg.compound", "kegg.compound", "chebi", "chebi"],
+            "identifier": ["C00001", "C00002", "022", None],
+        }
+    ).to_csv(xref, sep="\t", index=False)
+    database = tmp_path / "metanetx.sqlite"
+    load.load_sqlite({"chem_xref": xref}, database, chunksize=2)
+    with sqlite3.connect(str(database)) as connection:
+        assert connection.execute(
+            "SELECT identifier FROM chem_xref ORDER BY mnx_id"
+        ).fetchall() == [("C00001",), ("C00002",), ("022",), (None,)]
@@ -0,0 +1,65 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected outcomes of exporting cross-references as RDF."""
+
+
+import gzip
+from pathlib import Path
+
+import pandas as pd
+
+from metanetx_sdk.rdf import export_triples, format_triples
+
+
+CROSS_REFERENCES = pd.DataFrame(
+    {
+        "mnx_id": ["MNXM1", "MNXM1", "MNXM2", "MNXM2"],
+        "prefix": ["metanetx.chemical", "chebi", "kegg.compound", "seed.compound"],
+        "identifier": ["MNXM1", "CHEBI:15377", "C00007", None],
+    }
+)
+
+
+def test_format_triples():
+    """Expect one triple per cross-reference without self-references."""
+    assert format_triples(CROSS_REFERENCES, "metanetx.chemical").splitlines() == [
+        "<https://identifiers.org/metanetx.chemical:MNXM1> "
+        "<http://www.w3.org/2004/02/skos/core#exactMatch> "
+        "<https://identifiers.org/chebi:CHEBI:15377> .",
+        "<https://identifiers.org/metanetx.chemical:MNXM2> "
+        "<http://www.w3.org/2004/02/skos/core#exactMatch> "
+        "<https://identifiers.org/kegg.compound:C00007> .",
+    ]
+
+
+def test_format_triples_escaping():
+    """Expect that characters which are invalid in IRIs are percent-encoded."""
+    table = pd.DataFrame(
+        {"mnx_id": ["MNXM1"], "prefix": ["name"], "identifier": ["a <b>"]}
+    )
+    assert "<https://identifiers.org/name:a%20%3Cb%3E> ." in format_triples(
+        table, "metanetx.chemical", predicate="urn:related"
+    )
+
+
+def test_export_triples(tmp_path: Path):
+    """Expect that all chunks are written to a compressed file."""
+    source = tmp_path / "chem_xref.tsv.gz"
+    CROSS_REFERENCES.to_csv(source, sep="\t", index=False)
+    output = tmp_path / "chem_xref.nt.gz"
+    assert export_triples([source], output, "metanetx.chemical", chunksize=1) == 2
+    with gzip.open(output, "rt") as handle:
+        assert len(handle.read().splitlines()) == 2
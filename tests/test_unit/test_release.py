@@ -0,0 +1,88 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected behavior of lazily loaded release tables."""
+
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from metanetx_sdk.release import MetaNetXRelease
+
+
+@pytest.fixture()
+def directory(tmp_path: Path) -> Path:
+    """Provide a working directory with one raw and one processed table."""
+    (tmp_path / "chem_depr.tsv").write_text(
+        "#\n" * 348 + "MNXM2\tMNXM1\tVER3\nMNXM3\tMNXM2\tVER4\n"
+    )
+    processed = tmp_path / "processed"
+    processed.mkdir()
+    pd.DataFrame({"mnx_id": ["MNXM1", "MNXM2"], "name": ["water", "oxygen"]}).to_csv(
+        processed / "chem_prop.tsv.gz", sep="\t", index=False
+    )
+    return tmp_path
+
+
+def test_lazy_caching(directory: Path):
+    """Expect that tables are loaded once on first access."""
+    release = MetaNetXRelease(directory, version="4.1")
+    assert release.loaded == []
+    chemicals = release.chemicals
+    assert chemicals["name"].tolist() == ["water", "oxygen"]
+    assert release.chemicals is chemicals
+    deprecations = release.chemical_deprecations
+    assert set(deprecations["current_id"]) == {"MNXM1"}
+    assert release.loaded == ["chemicals", "chemical_deprecations"]
+    assert (release.memory_usage() > 0).all()
+    release.evict("chemicals")
+    assert release.loaded == ["chemical_deprecations"]
+
+
+def test_memory_budget(directory: Path):
+    """Expect that the least recently used tables are evicted."""
+    release = MetaNetXRelease(directory, version="4.1", memory_budget=1)
+    release.chemicals
+    release.chemical_deprecations
+    assert release.loaded == ["chemical_deprecations"]
+
+
+def test_missing_table(directory: Path):
+    """Expect an informative error for tables without any file."""
+    release = MetaNetXRelease(directory, version="4.1")
+    with pytest.raises(FileNotFoundError):
+        release.reactions
+    with pytest.raises(ValueError, match="Unknown table"):
+        release.get_table("genes")
+
+
+def test_processed_identifiers(directory: Path):
+    """Expect identifiers of processed tables to be read as text."""
+    processed = directory / "processed"
+    pd.DataFrame(
+        {
+            "mnx_id": ["MNXM1", "MNXM2"],
+            "prefix": ["chebi", "chebi"],
+            "identifier": ["022", None],
+        }
+    ).to_csv(processed / "chem_xref.tsv.gz", sep="\t", index=False)
+    pd.DataFrame(
+        {"deprecated_id": [0, 1], "current_id": [1, -1], "version": ["VER3"] * 2}
+    ).to_csv(processed / "chem_depr.tsv.gz", sep="\t", index=False)
+    release = MetaNetXRelease(directory, version="4.1")
+    assert release.chemical_xrefs["identifier"].tolist()[0] == "022"
+    assert release.chemical_deprecations["current_id"].tolist() == [1, -1]
@@ -0,0 +1,52 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected behavior of the release registry."""
+
+
+from pathlib import Path
+
+import pytest
+
+from metanetx_sdk.model import (
+    FTPConfigurationModel,
+    TableConfigurationModel,
+    get_release_registry,
+)
+
+
+def test_versions():
+    """Expect that the latest release is among the known releases."""
+    registry = get_release_registry()
+    assert registry.latest in registry.versions
+
+
+def test_cached_configuration():
+    """Expect that configurations are only validated once per release."""
+    registry = get_release_registry()
+    assert registry.tables() is TableConfigurationModel.load(registry.latest)
+    assert registry.ftp() is FTPConfigurationModel.load()
+
+
+def test_unknown_version():
+    """Expect that an unknown release is rejected."""
+    with pytest.raises(ValueError, match="Unknown MetaNetX release"):
+        get_release_registry().tables("0.0")
+
+
+def test_release_directory():
+    """Expect a release-specific working directory."""
+    registry = get_release_registry()
+    assert registry.release_directory(Path("data"), "4.1") == Path("data", "4.1")
@@ -81,3 +81,96 @@ def test_report_duplicates(table: DataFrame, column: str, expected: Series):
     """Expect the value counts to be accurate."""
     assert (report.report_duplicates(table, column).index == expected.index).all()
     assert (report.report_duplicates(table, column).values == expected.values).all()
+
+
+def test_profile_table():
+    """Expect counts, duplicates, and frequent values of all columns."""
+    profile = report.profile_table(
+        DataFrame({"a": ["x", "y", "x", None, "x"], "b": [1, 2, 3, 3, 2]}), top=1
+    )
+    assert profile.summary.to_dict("records") == [
+        {
+            "column": "a",
+            "count": 4,
+            "num_missing": 1,
+            "num_distinct": 2,
+            "num_duplicates": 2,
+        },
+        {
+            "column": "b",
+            "count": 5,
+            "num_missing": 0,
+            "num_distinct": 3,
+            "num_duplicates": 2,
+        },
+    ]
+    assert profile.duplicates.to_dict("records") == [
+        {"column": "a", "occurrences": 3, "num_values": 1},
+        {"column": "b", "occurrences": 2, "num_values": 2},
+    ]
+    assert profile.top_values.to_dict("records")[0] == {
+        "column": "a",
+        "value": "x",
+        "count": 3,
+    }
+
+
+def test_profile_chunks():
+    """Expect approximate distinct counts across chunks."""
+    chunks = [
+        DataFrame({"a": [f"id{i}" for i in range(start, start + 10_000)] + ["x"] * 3})
+        for start in range(0, 50_000, 5_000)
+    ]
+    profile = report.profile_chunks(chunks, top=1)
+    summary = profile.summary.iloc[0]
+    assert summary["count"] == 100_030
+    assert summary["num_distinct"] == pytest.approx(55_001, rel=0.05)
+    assert profile.top_values.to_dict("records") == [
+        {"column": "a", "value": "x", "count": 30}
+    ]
+    assert profile.duplicates.empty
+
+
+def test_plot_frequency_binned():
+    """Expect large series to be plotted as pre-binned counts."""
+    fig = report.plot_frequency(Series(linspace(0.0, 1.0, 20_001)), "x", bins=4)
+    assert fig.data[0].type == "bar"
+    assert list(fig.data[0].y) == [5000, 5000, 5000, 5001]
+    assert report.plot_frequency(Series(range(5)), "x").data[0].type == "histogram"
+
+
+def test_plot_frequency_binned_nullable():
+    """Expect missing values of nullable integers to be ignored when binned."""
+    fig = report.plot_frequency(
+        Series([1, None, 2, 3, None, 4], dtype="Int64"), "x", binned=True, bins=2
+    )
+    assert list(fig.data[0].y) == [2, 2]
+
+
+def test_plot_frequency_binned_infinite():
+    """Expect infinite values to be ignored when binned."""
+    fig = report.plot_frequency(
+        Series([1.0, float("inf"), 2.0, 3.0, -float("inf"), 4.0]),
+        "x",
+        binned=True,
+        bins=2,
+    )
+    assert list(fig.data[0].y) == [2, 2]
+
+
+def test_plot_frequency_binned_bool():
+    """Expect booleans to be counted per value when binned."""
+    fig = report.plot_frequency(
+        Series([True, False, True]), "x", yaxis_scale="linear", binned=True
+    )
+    assert fig.data[0].type == "bar"
+    assert sorted(zip(fig.data[0].x, fig.data[0].y)) == [(False, 1), (True, 2)]
+
+
+def test_plot_bincount_other():
+    """Expect the smallest categories to be summed up in a final bar."""
+    fig = report.plot_bincount(
+        Series([5, 1, 7, 2, 9], index=LETTERS), "x", max_categories=3
+    )
+    assert list(fig.data[0].x) == ["c", "e", "other"]
+    assert list(fig.data[0].y) == [7, 9, 8]
@@ -0,0 +1,162 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected behavior of the resolver server and its client."""
+
+
+import subprocess
+import sys
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
+
+import pandas as pd
+import pytest
+
+from metanetx_sdk.client import MetaNetXClient
+from metanetx_sdk.index import IdentifierIndex
+from metanetx_sdk.server import Resolver, create_server
+
+
+@pytest.fixture(scope="module")
+def client() -> MetaNetXClient:
+    """Provide a client connected to a running server."""
+    index = IdentifierIndex.from_tables(
+        [
+            pd.DataFrame(
+                {
+                    "mnx_id": ["MNXM1", "MNXM1", "MNXM2"],
+                    "prefix": ["bigg.metabolite", "kegg.compound", "bigg.metabolite"],
+                    "identifier": ["atp", "C00002", "h2o"],
+                }
+            )
+        ]
+    )
+    deprecations = pd.DataFrame(
+        {"deprecated_id": ["MNXM9", "MNXM8", "MNXM8"], "current_id": ["MNXM1"] * 3}
+    )
+    server = create_server(Resolver(index, deprecations), port=0)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    with MetaNetXClient(port=server.server_address[1]) as client:
+        yield client
+    server.shutdown()
+    server.server_close()
+
+
+def test_health(client: MetaNetXClient):
+    """Expect that the server reports the loaded data."""
+    assert client.health()["cross_references"] == 3
+
+
+def test_resolve(client: MetaNetXClient):
+    """Expect that every queried identifier is answered."""
+    assert client.resolve("bigg.metabolite", ["atp", "foo"]) == {
+        "atp": ["MNXM1"],
+        "foo": [],
+    }
+
+
+def test_cross_references(client: MetaNetXClient):
+    """Expect that cross-references can be restricted to a namespace."""
+    assert client.cross_references(["MNXM1"], prefix="kegg.compound") == {
+        "MNXM1": [("kegg.compound", "C00002")]
+    }
+
+
+def test_translate(client: MetaNetXClient):
+    """Expect that identifiers are translated between namespaces."""
+    assert client.translate("bigg.metabolite", "kegg.compound", ["atp", "h2o"]) == {
+        "atp": ["C00002"],
+        "h2o": [],
+    }
+
+
+def test_current_identifiers(client: MetaNetXClient):
+    """Expect that deprecated identifiers are mapped to current ones."""
+    assert client.current_identifiers(["MNXM9", "MNXM2"]) == {
+        "MNXM9": ["MNXM1"],
+        "MNXM2": ["MNXM2"],
+    }
+
+
+def test_invalid_query(client: MetaNetXClient):
+    """Expect that incomplete queries are rejected."""
+    with pytest.raises(RuntimeError, match="Invalid query"):
+        client._request("POST", "/resolve", {"identifiers": []})
+
+
+@pytest.mark.parametrize(
+    "path, payload",
+    [
+        ("/resolve", {"prefix": "bigg.metabolite", "identifiers": [1, 2]}),
+        ("/resolve", {"prefix": "bigg.metabolite", "identifiers": "atp"}),
+        ("/cross-references", {"mnx_ids": [None]}),
+        ("/current", {"identifiers": [["MNXM1"]]}),
+    ],
+)
+def test_invalid_identifiers(client: MetaNetXClient, path: str, payload: dict):
+    """Expect that identifiers other than lists of strings are rejected."""
+    with pytest.raises(RuntimeError, match="Invalid query"):
+        client._request("POST", path, payload)
+
+
+def test_invalid_encoding(client: MetaNetXClient):
+    """Expect that bodies which are not UTF-8 are rejected."""
+    client._connection.request("POST", "/resolve", body=b"\xff\xfe\x00")
+    response = client._connection.getresponse()
+    response.read()
+    assert response.status == 400
+
+
+class ErrorPageHandler(BaseHTTPRequestHandler):
+    """Respond to every request with an HTML error page like a proxy."""
+
+    def do_GET(self) -> None:
+        """Send a bad gateway error."""
+        body = b"<html><body>Bad Gateway</body></html>"
+        self.send_response(502)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        """Silence the request log."""
+
+
+def test_error_page():
+    """Expect that error responses without JSON are reported."""
+    server = HTTPServer(("127.0.0.1", 0), ErrorPageHandler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with MetaNetXClient(port=server.server_address[1]) as client:
+            with pytest.raises(RuntimeError, match="502: Bad Gateway"):
+                client.health()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_client_is_lightweight():
+    """Expect that the client does not import pandas."""
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, metanetx_sdk.client; assert 'pandas' not in sys.modules",
+        ],
+        check=True,
+    )
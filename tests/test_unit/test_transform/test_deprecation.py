@@ -0,0 +1,61 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected outcomes of deprecation transformation functions."""
+
+
+import pytest
+from pandas import DataFrame, Series
+
+from metanetx_sdk import transform
+
+
+@pytest.fixture(scope="module")
+def deprecated() -> DataFrame:
+    """Provide a table of deprecated identifiers with chains, splits, and a cycle."""
+    return DataFrame(
+        {
+            "deprecated_id": ["A", "B", "C", "D", "D", "X", "Y", "Z"],
+            "current_id": ["B", "C", "E", "F", "G", "Y", "X", "X"],
+            "version": ["1", "2", "3", "3", "3", "1", "1", "1"],
+        }
+    )
+
+
+def test_find_deprecation_cycles(deprecated: DataFrame):
+    """Expect that cycles and the identifiers leading into them are found."""
+    cycles = transform.find_deprecation_cycles(deprecated)
+    assert sorted(cycles) == ["X", "Y", "Z"]
+
+
+def test_transform_deprecated_identifiers(deprecated: DataFrame):
+    """Expect that chains are compressed into direct mappings."""
+    result = transform.transform_deprecated_identifiers(deprecated)
+    assert result.to_dict("records") == [
+        {"deprecated_id": "A", "current_id": "E", "version": "1", "hops": 3},
+        {"deprecated_id": "B", "current_id": "E", "version": "2", "hops": 2},
+        {"deprecated_id": "C", "current_id": "E", "version": "3", "hops": 1},
+        {"deprecated_id": "D", "current_id": "F", "version": "3", "hops": 1},
+        {"deprecated_id": "D", "current_id": "G", "version": "3", "hops": 1},
+    ]
+
+
+def test_resolve_deprecated_identifiers(deprecated: DataFrame):
+    """Expect that a whole series is resolved at once."""
+    mapping = transform.transform_deprecated_identifiers(deprecated)
+    result = transform.resolve_deprecated_identifiers(
+        Series(["A", "E", "D", "Q"]), mapping
+    )
+    assert result.tolist() == ["E", "E", None, "Q"]
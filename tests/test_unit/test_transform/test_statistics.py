@@ -0,0 +1,107 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected statistics collected while transforming tables."""
+
+
+import json
+from pathlib import Path
+
+from pandas import DataFrame
+
+from metanetx_sdk import api, transform
+from metanetx_sdk.model import SingleTableConfigurationModel, TransformStatisticsModel
+
+
+def test_chemical_cross_reference_statistics():
+    """Expect counts per namespace, unhandled prefixes, and duplicates."""
+    references = DataFrame(
+        {
+            "xref": ["chebi:15377", "chebi:15377", "keggC:C00001", "MNXM1", "foo:1"],
+            "mnx_id": ["MNXM1", "MNXM2", "MNXM1", "MNXM1", "MNXM1"],
+            "description": ["water", "water", None, None, None],
+        }
+    )
+    statistics = TransformStatisticsModel()
+    transform.transform_chemical_cross_references(
+        references, {"keggC": "kegg.compound"}, statistics=statistics
+    )
+    assert statistics.num_rows == 5
+    assert statistics.num_missing_prefix == 1
+    assert statistics.num_duplicates == 1
+    assert statistics.prefix_counts == {
+        "chebi": 2,
+        "kegg.compound": 1,
+        "metanetx.chemical": 1,
+        "foo": 1,
+    }
+    assert statistics.unhandled_prefixes == ["foo"]
+    assert statistics.missing_values["description"] == 3
+
+
+def test_reaction_property_statistics():
+    """Expect that sources without a namespace prefix are not counted per prefix."""
+    reactions = DataFrame(
+        {
+            "mnx_id": ["MNXR1", "MNXR2", "MNXR3"],
+            "source": ["rheaR:10000", "rheaR:10004", "MNXR3"],
+        }
+    )
+    statistics = TransformStatisticsModel()
+    transform.transform_reaction_properties(
+        reactions, {"rheaR": "rhea"}, statistics=statistics
+    )
+    assert statistics.num_rows == 3
+    assert statistics.num_missing_prefix == 1
+    assert statistics.prefix_counts == {"rhea": 2}
+    assert statistics.missing_values["identifier"] == 1
+
+
+def test_compartment_property_statistics():
+    """Expect that specially handled ontology terms are counted per prefix."""
+    compartments = DataFrame(
+        {
+            "mnx_id": ["MNXC1", "MNXC2", "MNXC3"],
+            "source": ["go:0005737", "cl:0000000", "bigg:c"],
+        }
+    )
+    statistics = TransformStatisticsModel()
+    transform.transform_compartment_properties(
+        compartments, {"go": "go", "cl": "cl"}, statistics=statistics
+    )
+    assert statistics.num_missing_prefix == 0
+    assert statistics.prefix_counts == {"go": 1, "cl": 1, "bigg": 1}
+    assert statistics.unhandled_prefixes == ["bigg"]
+
+
+def test_etl_table_statistics(tmp_path: Path):
+    """Expect that the statistics of a processed table are stored as JSON."""
+    filename = tmp_path / "chem_xref.tsv"
+    filename.write_text("#comment\nchebi:15377\tMNXM1\twater\nfoo:1\tMNXM1\t\n")
+    api.etl_table(
+        filename,
+        tmp_path / "chem_xref.tsv.gz",
+        SingleTableConfigurationModel(
+            columns=["xref", "mnx_id", "description"], keys=["xref"], skip=1
+        ),
+        {},
+        transform.transform_chemical_cross_references,
+        statistics_output=tmp_path / "statistics.json",
+    )
+    statistics = json.loads((tmp_path / "statistics.json").read_text())
+    assert statistics["num_rows"] == 2
+    assert statistics["prefix_counts"] == {"chebi": 1, "foo": 1}
+    assert statistics["unhandled_prefixes"] == ["foo"]
+    assert statistics["missing_values"]["description"] == 1
@@ -0,0 +1,78 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected outcomes of identifier translation."""
+
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from metanetx_sdk import translate
+from metanetx_sdk.index import IdentifierIndex
+
+
+@pytest.fixture(scope="module")
+def index() -> IdentifierIndex:
+    """Provide an index of a few cross-references."""
+    table = pd.DataFrame(
+        {
+            "mnx_id": ["MNXM1", "MNXM1", "MNXM2", "MNXM2", "MNXM2", "MNXM3"],
+            "prefix": [
+                "bigg.metabolite",
+                "kegg.compound",
+                "bigg.metabolite",
+                "kegg.compound",
+                "kegg.compound",
+                "bigg.metabolite",
+            ],
+            "identifier": ["atp", "C00002", "h2o", "C00001", "C01328", "zn2"],
+        }
+    )
+    return IdentifierIndex.from_tables([table])
+
+
+def test_translate_identifiers(index: IdentifierIndex):
+    """Expect that translations are aligned with the input identifiers."""
+    result = translate.translate_identifiers(
+        pd.Series(["h2o", "foo", "atp", "zn2", "atp"]),
+        index,
+        "bigg.metabolite",
+        "kegg.compound",
+    )
+    assert result["source"].tolist() == ["h2o", "h2o", "foo", "atp", "zn2", "atp"]
+    assert result["mnx_id"].tolist()[3:] == ["MNXM1", "MNXM3", "MNXM1"]
+    assert result["target"].fillna("").tolist() == [
+        "C00001",
+        "C01328",
+        "",
+        "C00002",
+        "",
+        "C00002",
+    ]
+
+
+def test_translate_file(index: IdentifierIndex, tmp_path: Path):
+    """Expect that a file is translated in chunks."""
+    input_file = tmp_path / "ids.txt"
+    input_file.write_text("atp\nh2o\nfoo\n")
+    output_file = tmp_path / "translated.tsv.gz"
+    translate.translate_file(
+        input_file, output_file, index, "bigg.metabolite", "kegg.compound", chunksize=2
+    )
+    result = pd.read_csv(output_file, sep="\t")
+    assert result.columns.tolist() == ["source", "mnx_id", "target"]
+    assert result["source"].tolist() == ["atp", "h2o", "h2o", "foo"]
@@ -0,0 +1,83 @@
+# Copyright (c) 2020, Moritz E. Beber.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Ensure the expected outcomes of validation functions."""
+
+
+import pytest
+from pandas import DataFrame, Series
+
+from metanetx_sdk import validate
+from metanetx_sdk.model import ValidationRuleModel
+
+
+@pytest.mark.parametrize(
+    "series, rule, expected",
+    [
+        (
+            Series(["MNXM1", "MNXM", None, "BIOMASS"]),
+            {"column": "x", "check": "pattern", "pattern": r"MNXM\d+|BIOMASS"},
+            [False, True, False, False],
+        ),
+        (
+            Series(["MNXM1", None]),
+            {
+                "column": "x",
+                "check": "pattern",
+                "pattern": r"MNXM\d+",
+                "allow_missing": False,
+            },
+            [False, True],
+        ),
+        (
+            Series([1.0, 1.5, None, "foo"]),
+            {"column": "x", "check": "integer"},
+            [False, True, False, True],
+        ),
+        (
+            Series([1.0, 1.5, None, "foo"]),
+            {"column": "x", "check": "numeric"},
+            [False, False, False, True],
+        ),
+        (
+            Series(["B", "F", None]),
+            {"column": "x", "check": "flag", "values": ["B", "U"]},
+            [False, True, False],
+        ),
+    ],
+)
+def test_find_violations(series: Series, rule: dict, expected: list):
+    """Expect that violating values are detected."""
+    result = validate.find_violations(series, ValidationRuleModel(**rule))
+    assert result.tolist() == expected
+
+
+def test_pattern_rule_requires_pattern():
+    """Expect that a pattern check without an expression is rejected."""
+    with pytest.raises(ValueError):
+        ValidationRuleModel(column="x", check="pattern")
+
+
+def test_validate_table():
+    """Expect violation counts and sample rows per rule."""
+    table = DataFrame({"mnx_id": ["MNXM1", "foo", "bar"], "charge": [0, 1, 2]})
+    rules = [
+        ValidationRuleModel(column="mnx_id", check="pattern", pattern=r"MNXM\d+"),
+        ValidationRuleModel(column="charge", check="integer"),
+    ]
+    first, second = validate.validate_table(table, rules, num_samples=1)
+    assert first.violations == 2
+    assert first.samples == [{"mnx_id": "foo", "charge": 1}]
+    assert second.violations == 0